@@ -0,0 +1,74 @@
+import argparse
+
+import pytest
+
+from benchmarks.models import create_model
+from duit.annotation.AnnotationFinder import AnnotationFinder
+from duit.arguments.Argument import Argument
+from duit.arguments.Arguments import Arguments
+from duit.iterator.DataFieldIterator import DataFieldIterator
+from duit.settings.Settings import Settings
+from duit.settings.backend import create_fastest_json_backend
+from duit.ui.annotations import find_all_ui_annotations
+from duit.ui.meta.meta_utils import build_meta_tree
+
+
+@pytest.mark.benchmark(group="finder")
+def bench_annotation_finder(benchmark, size):
+    model = create_model(*size)
+    finder = AnnotationFinder(Argument, recursive=True)
+    benchmark(finder.find, model)
+
+
+@pytest.mark.benchmark(group="iterator")
+def bench_data_field_iterator(benchmark, size):
+    model = create_model(*size)
+    benchmark(lambda: list(DataFieldIterator(model)))
+
+
+@pytest.mark.benchmark(group="ui")
+def bench_find_all_ui_annotations(benchmark, size):
+    model = create_model(*size)
+    benchmark(find_all_ui_annotations, model)
+
+
+@pytest.mark.benchmark(group="ui")
+def bench_build_meta_tree(benchmark, size):
+    model = create_model(*size)
+    benchmark(build_meta_tree, model)
+
+
+@pytest.mark.benchmark(group="settings")
+def bench_settings_save_json(benchmark, size):
+    model = create_model(*size)
+    settings = Settings()
+    benchmark(settings.save_json, model)
+
+
+@pytest.mark.benchmark(group="settings")
+def bench_settings_load_json(benchmark, size):
+    model = create_model(*size)
+    settings = Settings()
+    content = settings.save_json(model)
+    benchmark(settings.load_json, content, model)
+
+
+@pytest.mark.benchmark(group="arguments")
+def bench_arguments_add_arguments(benchmark, size):
+    arguments = Arguments()
+
+    # add_arguments stores the generated destination on the annotations, so every round needs a fresh model
+    def setup():
+        return (argparse.ArgumentParser(), create_model(*size)), {}
+
+    def add_arguments(parser, model):
+        arguments.add_arguments(parser, model, use_attribute_path_as_name=True)
+
+    benchmark.pedantic(add_arguments, setup=setup, rounds=20)
+
+
+@pytest.mark.benchmark(group="settings")
+def bench_settings_save_json_fastest_compact(benchmark, size):
+    model = create_model(*size)
+    settings = Settings(json_backend=create_fastest_json_backend(), compact_json=True)
+    benchmark(settings.save_json, model)
@@ -0,0 +1,16 @@
+from typing import Tuple
+
+import pytest
+
+# (width, depth, branching) of the synthetic models
+MODEL_SIZES = {
+    "small": (10, 2, 1),
+    "wide": (200, 0, 1),
+    "deep": (5, 100, 1),
+    "tree": (20, 4, 3),
+}
+
+
+@pytest.fixture(params=list(MODEL_SIZES.keys()))
+def size(request) -> Tuple[int, int, int]:
+    return MODEL_SIZES[request.param]
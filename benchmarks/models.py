@@ -0,0 +1,59 @@
+from enum import Enum
+from typing import Any
+
+import vector
+
+from duit import ui
+from duit.arguments.Argument import Argument
+from duit.model.DataField import DataField
+
+
+class BenchmarkMode(Enum):
+    Fast = 1
+    Accurate = 2
+
+
+_FIELD_FACTORIES = [
+    lambda i: DataField(i) | ui.Number(f"Number {i}") | Argument(),
+    lambda i: DataField(i * 0.5) | ui.Slider(f"Slider {i}", limit_min=0, limit_max=1000) | Argument(),
+    lambda i: DataField(f"text {i}") | ui.Text(f"Text {i}") | Argument(),
+    lambda i: DataField(i % 2 == 0) | ui.Boolean(f"Boolean {i}") | Argument(),
+    lambda i: DataField(BenchmarkMode.Fast) | ui.Enum(f"Enum {i}") | Argument(),
+    lambda i: DataField(vector.obj(x=i, y=i, z=i)) | ui.Vector(f"Vector {i}") | Argument(),
+]
+
+
+class BenchmarkNode:
+    """
+    A synthetic model node with `width` annotated DataFields and `branching` nested sub-nodes per level.
+
+    The total number of fields is width * (branching^0 + branching^1 + ... + branching^depth).
+    """
+
+    def __init__(self, width: int, depth: int, branching: int = 1):
+        for i in range(width):
+            field = _FIELD_FACTORIES[i % len(_FIELD_FACTORIES)](i)
+
+            if i == 0:
+                field = field | ui.StartSection("Section")
+            if i == width - 1:
+                field = field | ui.EndSection()
+
+            setattr(self, f"field_{i}", field)
+
+        if depth > 0:
+            for b in range(branching):
+                child = BenchmarkNode(width, depth - 1, branching)
+                setattr(self, f"child_{b}", DataField(child) | ui.SubSection(f"Child {b}"))
+
+
+def create_model(width: int, depth: int, branching: int = 1) -> Any:
+    """
+    Create a synthetic model of the specified size.
+
+    :param width: The number of DataFields per node.
+    :param depth: The number of nested levels below the root node.
+    :param branching: The number of sub-nodes per node.
+    :return: The root node of the model.
+    """
+    return BenchmarkNode(width, depth, branching)
@@ -1,7 +1,8 @@
-from typing import Any, Dict, Tuple, TypeVar, Generic, Callable, Optional, Type, List
+from typing import Any, Dict, Tuple, TypeVar, Generic, Callable, Optional, Type, List, Set, Iterator
 
 from duit.annotation.Annotation import Annotation
-from duit.model.AttributeIdentifier import AttributeIdentifier
+from duit.annotation.AnnotationSchema import AnnotationSchemaCache, DefaultAnnotationSchemaCache
+from duit.model.AttributeIdentifier import AttributeIdentifier, ParentNode
 from duit.model.DataField import DataField
 
 A = TypeVar("A", bound=Annotation)
@@ -10,11 +11,13 @@ A = TypeVar("A", bound=Annotation)
 class AnnotationFinder(Generic[A]):
     """
     AnnotationFinder is a generic class for finding annotations in objects.
+    The traversal state is kept per call, which allows to use the same finder from multiple threads in parallel.
 
     Args:
         annotation_type (Type[A]): The type of annotation to search for.
         is_field_valid (Optional[Callable[[DataField, A], bool]]): A function to determine if a DataField is valid for the given annotation (optional).
         recursive (bool): Whether to recursively search for annotations in nested objects (default is False).
+        schema_cache (Optional[AnnotationSchemaCache]): The cache of compiled per-class schemas (default is the shared DefaultAnnotationSchemaCache).
 
     Attributes:
         annotation_type (Type[A]): The type of annotation to search for.
@@ -24,7 +27,8 @@ class AnnotationFinder(Generic[A]):
 
     def __init__(self, annotation_type: Type[A],
                  is_field_valid: Optional[Callable[[DataField, A], bool]] = None,
-                 recursive: bool = False):
+                 recursive: bool = False,
+                 schema_cache: Optional[AnnotationSchemaCache] = None):
         """
         Initialize an AnnotationFinder instance.
 
@@ -32,13 +36,14 @@ class AnnotationFinder(Generic[A]):
             annotation_type (Type[A]): The type of annotation to search for.
             is_field_valid (Optional[Callable[[DataField, A], bool]]): A function to determine if a DataField is valid for the given annotation (optional).
             recursive (bool): Whether to recursively search for annotations in nested objects (default is False).
+            schema_cache (Optional[AnnotationSchemaCache]): The cache of compiled per-class schemas (default is the shared DefaultAnnotationSchemaCache).
         """
         self.annotation_type = annotation_type
         self.is_field_valid = is_field_valid
         self.recursive = recursive
+        self.schema_cache = DefaultAnnotationSchemaCache if schema_cache is None else schema_cache
 
         self._annotation_attribute_name = self.annotation_type._get_annotation_attribute_name()
-        self._processed_objects = set()
 
     def find(self, obj: Any) -> Dict[str, Tuple[DataField, A]]:
         """
@@ -63,42 +68,55 @@ class AnnotationFinder(Generic[A]):
         Returns:
             Dict[AttributeIdentifier, Tuple[DataField, A]]: A dictionary of found annotations, where the keys are attribute identifiers and values are tuples of DataField and the annotation.
         """
-        self._processed_objects.clear()
-        return self._find_all_annotations(obj)
+        return self._find_all_annotations(obj, set())
 
     def _find_all_annotations(self, obj: Any,
-                              parents: Optional[List[str]] = None) -> Dict[AttributeIdentifier, Tuple[DataField, A]]:
+                              processed_objects: Set[int]) -> Dict[AttributeIdentifier, Tuple[DataField, A]]:
         """
-        Recursively find all annotations in an object.
+        Find all annotations in an object and (if recursive) in its nested objects.
+
+        The object tree is traversed depth-first with an explicit stack, to support deeply nested objects.
+        The parents of nested objects are stored as shared linked nodes, which are only expanded if an annotation is found.
 
         Args:
             obj (Any): The object to search for annotations.
-            parents (Optional[List[str]]): Parents for the recursive structure.
+            processed_objects (Set[int]): Ids of the objects already visited during the current call.
 
         Returns:
             Dict[AttributeIdentifier, Tuple[DataField, A]]: A dictionary of found annotations, where the keys are attribute identifiers and values are tuples of DataField and the annotation.
         """
         annotations: Dict[AttributeIdentifier, Tuple[DataField, A]] = {}
-        self._processed_objects.add(id(obj))
+        processed_objects.add(id(obj))
 
-        if not hasattr(obj, "__dict__"):
+        fields = self.schema_cache.get_fields(obj)
+        if fields is None:
             return annotations
 
-        if parents is None:
-            parents = []
+        stack: List[Tuple[Iterator[Tuple[str, DataField]], ParentNode]] = [(iter(fields), None)]
+
+        while stack:
+            field_iterator, parent_node = stack[-1]
 
-        for n, v in obj.__dict__.items():
-            if isinstance(v, DataField):
-                if hasattr(v, self._annotation_attribute_name):
-                    a = v.__getattribute__(self._annotation_attribute_name)
+            for n, v in field_iterator:
+                a = v.__dict__.get(self._annotation_attribute_name)
+                if a is not None:
                     if self.is_field_valid is not None and not self.is_field_valid(v, a):
                         continue
-                    attribute_identifier = AttributeIdentifier(n, parents)
+                    attribute_identifier = AttributeIdentifier.from_parent_node(n, parent_node)
                     annotations[attribute_identifier] = (v, a)
-                else:
+                elif self.recursive:
                     value = v.value
-                    if self.recursive and id(value) not in self._processed_objects:
-                        parents.append(n)
-                        annotations.update(self._find_all_annotations(value, parents.copy()))
-                        parents.pop()
+                    if id(value) in processed_objects:
+                        continue
+
+                    processed_objects.add(id(value))
+                    sub_fields = self.schema_cache.get_fields(value)
+
+                    if sub_fields:
+                        # continue with the nested object and resume this object afterwards
+                        stack.append((iter(sub_fields), (n, parent_node)))
+                        break
+            else:
+                stack.pop()
+
         return annotations
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple, List, Optional
+
+from duit.model.DataField import DataField
+
+# the class, the attribute names and whether each attribute contains a DataField
+SchemaKey = Tuple[type, Tuple[str, ...], Tuple[bool, ...]]
+
+
+@dataclass(frozen=True)
+class AnnotationSchema:
+    """
+    A compiled description of the DataField attributes of objects with the same class and instance dict shape.
+
+    Attributes:
+        field_names (Tuple[str, ...]): The names of the attributes that contain a DataField (in attribute order).
+    """
+    field_names: Tuple[str, ...]
+
+    @staticmethod
+    def compile(attributes: Dict[str, Any]) -> "AnnotationSchema":
+        """
+        Compile a schema from the instance dict of an object.
+
+        Args:
+            attributes (Dict[str, Any]): The instance dict of the object.
+
+        Returns:
+            AnnotationSchema: The compiled schema.
+        """
+        return AnnotationSchema(tuple(n for n, v in attributes.items() if isinstance(v, DataField)))
+
+
+class AnnotationSchemaCache:
+    """
+    A cache of compiled AnnotationSchemas per class and instance dict shape.
+
+    The instance dict shape (its attribute names) is part of the cache key, which invalidates the schema as soon as
+    attributes are added or removed. On every lookup, the schema is validated against the instance, which means that
+    instances of the same class whose attributes contain a DataField or not (e.g. optional fields) get their own
+    schema. If more than `max_size` schemas are cached, the oldest ones are removed.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Initialize an empty AnnotationSchemaCache.
+
+        Args:
+            max_size (int): The maximum number of cached schemas (default is 1024).
+        """
+        self.max_size = max_size
+        self._schemas: Dict[SchemaKey, AnnotationSchema] = {}
+
+    def get_fields(self, obj: Any) -> Optional[List[Tuple[str, DataField]]]:
+        """
+        Get the DataField attributes of an object by using the cached schema of its class.
+
+        Args:
+            obj (Any): The object to get the DataField attributes from.
+
+        Returns:
+            Optional[List[Tuple[str, DataField]]]: The attribute names and DataFields, or None if the object has no instance dict.
+        """
+        attributes = getattr(obj, "__dict__", None)
+
+        if attributes is None:
+            return None
+
+        field_mask = tuple(isinstance(v, DataField) for v in attributes.values())
+        key = (type(obj), tuple(attributes), field_mask)
+        schema = self._schemas.get(key)
+
+        if schema is None:
+            schema = AnnotationSchema.compile(attributes)
+
+            # the oldest schema is removed (dicts keep the insertion order)
+            if len(self._schemas) >= self.max_size:
+                del self._schemas[next(iter(self._schemas))]
+            self._schemas[key] = schema
+
+        return [(n, attributes[n]) for n in schema.field_names]
+
+    def clear(self) -> None:
+        """
+        Remove all compiled schemas from the cache.
+        """
+        self._schemas.clear()
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+
+DefaultAnnotationSchemaCache = AnnotationSchemaCache()
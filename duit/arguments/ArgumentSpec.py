@@ -0,0 +1,76 @@
+import argparse
+from dataclasses import dataclass, field
+from typing import Optional, List, Tuple, Any, Dict
+
+# the positional and keyword arguments of a call to `add_argument()`
+ArgumentCall = Tuple[Tuple[Any, ...], Dict[str, Any]]
+
+
+@dataclass
+class ArgumentSpecEntry:
+    """
+    The compiled command-line argument of a single field.
+
+    Attributes:
+        path (str): The attribute path of the field (e.g. "camera.exposure").
+        group (Optional[str]): The argument group name.
+        ns_dest (str): The namespace attribute name of the argument.
+        allow_none (bool): Whether None is a valid value of the argument.
+        calls (List[ArgumentCall]): The calls to `add_argument()` done by the type adapter of the field.
+    """
+    path: str
+    group: Optional[str]
+    ns_dest: str
+    allow_none: bool
+    calls: List[ArgumentCall] = field(default_factory=list)
+
+
+@dataclass
+class ArgumentSpec:
+    """
+    The compiled command-line arguments of an object, which can be added to a parser without inspecting the object.
+
+    Attributes:
+        entries (List[ArgumentSpecEntry]): The arguments in the order they are added to the parser.
+    """
+    entries: List[ArgumentSpecEntry] = field(default_factory=list)
+
+    def apply(self, parser: argparse.ArgumentParser) -> None:
+        """
+        Add the arguments (and their groups) to a parser.
+
+        Args:
+            parser (argparse.ArgumentParser): The parser to which the arguments will be added.
+        """
+        groups: Dict[Optional[str], Any] = {None: parser}
+
+        for entry in self.entries:
+            group = groups.get(entry.group)
+            if group is None:
+                group = parser.add_argument_group(entry.group)
+                groups[entry.group] = group
+
+            for args, kwargs in entry.calls:
+                group.add_argument(*args, **kwargs)
+
+
+class ArgumentRecorder:
+    """
+    A stand-in for an argparse parser, which records the calls of type adapters to `add_argument()`.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty ArgumentRecorder.
+        """
+        self.calls: List[ArgumentCall] = []
+
+    def add_argument(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Record a call to `add_argument()`.
+
+        Args:
+            *args (Any): The positional arguments.
+            **kwargs (Any): The keyword arguments.
+        """
+        self.calls.append((args, dict(kwargs)))
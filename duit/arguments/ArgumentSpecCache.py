@@ -0,0 +1,137 @@
+import hashlib
+import logging
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Optional, Dict, Sequence, Union
+
+from duit.arguments.ArgumentSpec import ArgumentSpec
+from duit.utils.file_utils import write_file_atomic, FsyncPolicy
+
+_SPEC_FORMAT_VERSION = 1
+
+
+class ArgumentSpecCache:
+    """
+    A cache of compiled ArgumentSpecs per model class.
+
+    The specs are kept in memory and, if a `directory` is set, stored on disk to speed up the start of short-lived
+    processes. The spec of a class is identified by a schema hash of the class name, the options of the arguments,
+    the type adapters and the modification time of the module which defines the class. Changes to other modules
+    (e.g. of nested classes) are not detected and require a call to `clear()`.
+
+    The cache assumes that all instances of a class create the same arguments (e.g. no instance specific defaults).
+    Specs are stored with pickle, which means that the cache directory must only be writable by trusted users.
+    Specs which cannot be pickled (e.g. lambda argument types) are only kept in memory.
+    """
+
+    def __init__(self, directory: Optional[Union[str, os.PathLike]] = None):
+        """
+        Initialize an ArgumentSpecCache.
+
+        Args:
+            directory (Optional[Union[str, os.PathLike]]): The directory in which the specs are stored, or None to
+                keep them only in memory (default is None).
+        """
+        self.directory = None if directory is None else Path(directory)
+        self._specs: Dict[str, ArgumentSpec] = {}
+
+    def get_key(self, model_type: type, use_attribute_path_as_name: bool, type_adapters: Sequence[object]) -> str:
+        """
+        Get the schema hash which identifies the spec of a model class.
+
+        Args:
+            model_type (type): The class of the model.
+            use_attribute_path_as_name (bool): Whether the attribute paths are used as argument names.
+            type_adapters (Sequence[object]): The type adapters used to create the arguments.
+
+        Returns:
+            str: The schema hash.
+        """
+        module = sys.modules.get(model_type.__module__)
+        module_file = getattr(module, "__file__", None)
+
+        module_signature = None
+        if module_file is not None and os.path.exists(module_file):
+            stat = os.stat(module_file)
+            module_signature = (module_file, stat.st_mtime_ns, stat.st_size)
+
+        schema = (
+            _SPEC_FORMAT_VERSION,
+            f"{model_type.__module__}.{model_type.__qualname__}",
+            module_signature,
+            use_attribute_path_as_name,
+            tuple(f"{type(a).__module__}.{type(a).__qualname__}" for a in type_adapters),
+        )
+        return hashlib.sha1(repr(schema).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[ArgumentSpec]:
+        """
+        Get a cached spec.
+
+        Args:
+            key (str): The schema hash of the spec.
+
+        Returns:
+            Optional[ArgumentSpec]: The spec or None if it is not cached.
+        """
+        spec = self._specs.get(key)
+        if spec is not None or self.directory is None:
+            return spec
+
+        path = self._get_path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, "rb") as file:
+                spec = pickle.load(file)
+        except Exception as ex:
+            logging.warning(f"Could not read cached argument spec '{path}': {ex}")
+            return None
+
+        if not isinstance(spec, ArgumentSpec):
+            return None
+
+        self._specs[key] = spec
+        return spec
+
+    def put(self, key: str, spec: ArgumentSpec) -> None:
+        """
+        Add a spec to the cache.
+
+        Args:
+            key (str): The schema hash of the spec.
+            spec (ArgumentSpec): The spec.
+        """
+        self._specs[key] = spec
+
+        if self.directory is None:
+            return
+
+        try:
+            content = pickle.dumps(spec)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            write_file_atomic(self._get_path(key), content, FsyncPolicy.NONE)
+        except OSError as ex:
+            logging.warning(f"Could not store argument spec in '{self.directory}': {ex}")
+
+    def clear(self) -> None:
+        """
+        Remove all specs from memory and from the cache directory.
+        """
+        self._specs.clear()
+
+        if self.directory is None or not self.directory.exists():
+            return
+
+        for path in self.directory.glob("*.spec"):
+            path.unlink()
+
+    def _get_path(self, key: str) -> Path:
+        return self.directory / f"{key}.spec"
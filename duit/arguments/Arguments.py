@@ -1,16 +1,21 @@
 import argparse
 from collections import defaultdict
-from typing import Any, List
+from typing import Any, List, Optional, Dict, Iterator, Tuple
 
 from duit.annotation.AnnotationFinder import AnnotationFinder
+from duit.arguments import ARGUMENT_ANNOTATION_ATTRIBUTE_NAME
 from duit.arguments.Argument import Argument
+from duit.arguments.ArgumentSpec import ArgumentSpec, ArgumentSpecEntry, ArgumentRecorder
+from duit.arguments.ArgumentSpecCache import ArgumentSpecCache
 from duit.arguments.adapters.BaseTypeAdapter import BaseTypeAdapter
 from duit.arguments.adapters.BooleanTypeAdapter import BooleanTypeAdapter
 from duit.arguments.adapters.DefaultTypeAdapter import DefaultTypeAdapter
 from duit.arguments.adapters.EnumTypeAdapter import EnumTypeAdapter
 from duit.arguments.adapters.PathTypeAdapter import PathTypeAdapter
 from duit.arguments.adapters.VectorTypeAdapter import VectorTypeAdapter
+from duit.model.AttributeIdentifier import AttributeIdentifier
 from duit.model.DataField import DataField
+from duit.utils.type_dispatch import TypeDispatchCache
 
 
 class Arguments:
@@ -20,12 +25,17 @@ class Arguments:
     Attributes:
         type_adapters (List[BaseTypeAdapter]): A list of type adapters to handle specific data types.
         default_serializer (BaseTypeAdapter): The default type adapter for serialization.
+        spec_cache (Optional[ArgumentSpecCache]): A cache of the compiled arguments per model class.
         _annotation_finder (AnnotationFinder): An instance of AnnotationFinder for finding Argument annotations in objects.
     """
 
-    def __init__(self):
+    def __init__(self, spec_cache: Optional[ArgumentSpecCache] = None):
         """
         Initialize an Arguments instance with default configuration.
+
+        Args:
+            spec_cache (Optional[ArgumentSpecCache]): A cache of the compiled arguments per model class, which allows
+                to add the arguments without inspecting the object (default is None).
         """
         self.type_adapters: List[BaseTypeAdapter] = [
             BooleanTypeAdapter(),
@@ -34,6 +44,10 @@ class Arguments:
             PathTypeAdapter()
         ]
         self.default_serializer: BaseTypeAdapter = DefaultTypeAdapter()
+        self._type_adapter_cache: TypeDispatchCache[BaseTypeAdapter] = TypeDispatchCache()
+
+        self.spec_cache = spec_cache
+        self._spec_keys: Dict[type, str] = {}
 
         # setup annotation finder
         def _is_field_valid(field: DataField, annotation: Argument):
@@ -70,11 +84,43 @@ class Arguments:
         """
         Add command-line arguments to the parser based on annotations in the object.
 
+        If a `spec_cache` is set, the compiled arguments of the object class are taken from the cache.
+
         Args:
             parser (argparse.ArgumentParser): The argparse parser to which the arguments will be added.
             obj (Any): The object containing annotations for command-line arguments.
             use_attribute_path_as_name (bool): Use the attribute path as name. This allows nested attributes share the same name.
         """
+        spec: Optional[ArgumentSpec] = None
+        key: Optional[str] = None
+
+        if self.spec_cache is not None:
+            key = self.spec_cache.get_key(type(obj), use_attribute_path_as_name, self.type_adapters)
+            spec = self.spec_cache.get(key)
+
+        if spec is None:
+            spec = self.compile_spec(obj, use_attribute_path_as_name)
+
+            if self.spec_cache is not None:
+                self.spec_cache.put(key, spec)
+
+        # the cached spec is used to configure objects of the same class
+        if key is not None:
+            self._spec_keys[type(obj)] = key
+
+        spec.apply(parser)
+
+    def compile_spec(self, obj: Any, use_attribute_path_as_name: bool = False) -> ArgumentSpec:
+        """
+        Compile the command-line arguments of an object into an ArgumentSpec.
+
+        Args:
+            obj (Any): The object containing annotations for command-line arguments.
+            use_attribute_path_as_name (bool): Use the attribute path as name. This allows nested attributes share the same name.
+
+        Returns:
+            ArgumentSpec: The compiled arguments.
+        """
         groups = defaultdict(list)
 
         for attribute_identifier, (field, argument) in self._annotation_finder.find_with_identifier(obj).items():
@@ -82,22 +128,26 @@ class Arguments:
                 attribute_name = attribute_identifier.path if use_attribute_path_as_name else attribute_identifier.name
                 argument.dest = f"--{self.to_argument_str(attribute_name)}"
 
-            groups[argument.group].append((field, argument))
+            groups[argument.group].append((attribute_identifier.path, field, argument))
 
         group_keys = sorted(groups.keys(), key=lambda x: (x is not None, x))
         if None in group_keys:
             group_keys.remove(None)
             group_keys.insert(0, None)
 
-        parser_groups = {g: parser.add_argument_group(g) for g in group_keys if g is not None}
-        parser_groups[None] = parser
+        spec = ArgumentSpec()
 
         for key in group_keys:
-            p = parser_groups[key]
-
-            for field, argument in groups[key]:
+            for path, field, argument in groups[key]:
+                # the calls of the type adapter are recorded to replay them on the parser
+                recorder = ArgumentRecorder()
                 type_adapter = self._get_matching_type_adapter(field)
-                type_adapter.add_argument(p, argument, field.value)
+                type_adapter.add_argument(recorder, argument, field.value)
+
+                ns_dest = self.to_namespace_str(argument.dest)
+                spec.entries.append(ArgumentSpecEntry(path, key, ns_dest, argument.allow_none, recorder.calls))
+
+        return spec
 
     def configure(self, args: argparse.Namespace, obj: Any):
         """
@@ -107,11 +157,8 @@ class Arguments:
             args (argparse.Namespace): The parsed namespace containing the command-line arguments.
             obj (Any): The object containing annotations for command-line arguments.
         """
-        for name, (field, argument) in self._annotation_finder.find(obj).items():
-            dest = name if argument.dest is None else argument.dest
-            ns_dest = self.to_namespace_str(dest)
-
-            if not argument.allow_none and getattr(args, ns_dest) is None:
+        for field, argument, ns_dest, allow_none in self._iter_arguments(obj):
+            if not allow_none and getattr(args, ns_dest) is None:
                 continue
 
             type_adapter = self._get_matching_type_adapter(field)
@@ -125,10 +172,55 @@ class Arguments:
             namespace (argparse.Namespace): The argparse namespace to be updated.
             obj (Any): The object containing annotations for command-line arguments.
         """
+        for field, _, ns_dest, _ in self._iter_arguments(obj):
+            namespace.__setattr__(ns_dest, field.value)
+
+    def _iter_arguments(self, obj: Any) -> Iterator[Tuple[DataField, Argument, str, bool]]:
+        """
+        Iterate over the argument fields of an object. If the arguments of the class of the object have been added
+        from the `spec_cache`, the fields are resolved by the paths of the cached spec instead of searching them.
+
+        Args:
+            obj (Any): The object containing annotations for command-line arguments.
+
+        Returns:
+            Iterator[Tuple[DataField, Argument, str, bool]]: The field, its annotation, namespace name and whether
+            None is a valid value.
+        """
+        spec: Optional[ArgumentSpec] = None
+
+        key = self._spec_keys.get(type(obj))
+        if self.spec_cache is not None and key is not None:
+            spec = self.spec_cache.get(key)
+
+        if spec is not None:
+            resolved = self._resolve_spec(spec, obj)
+            if resolved is not None:
+                yield from resolved
+                return
+
         for name, (field, argument) in self._annotation_finder.find(obj).items():
             dest = name if argument.dest is None else argument.dest
-            ns_dest = self.to_namespace_str(dest)
-            namespace.__setattr__(ns_dest, field.value)
+            yield field, argument, self.to_namespace_str(dest), argument.allow_none
+
+    @staticmethod
+    def _resolve_spec(spec: ArgumentSpec, obj: Any) -> Optional[List[Tuple[DataField, Argument, str, bool]]]:
+        resolved = []
+
+        for entry in spec.entries:
+            # instances with a different nested structure are searched instead
+            try:
+                field = AttributeIdentifier.from_path(entry.path).get_field(obj)
+            except AttributeError:
+                return None
+
+            argument = field.__dict__.get(ARGUMENT_ANNOTATION_ATTRIBUTE_NAME) if isinstance(field, DataField) else None
+            if argument is None:
+                return None
+
+            resolved.append((field, argument, entry.ns_dest, entry.allow_none))
+
+        return resolved
 
     def _get_matching_type_adapter(self, field: DataField) -> BaseTypeAdapter:
         """
@@ -140,10 +232,7 @@ class Arguments:
         Returns:
             BaseTypeAdapter: The type adapter that matches the data type, or the default serializer if no match is found.
         """
-        for type_adapter in self.type_adapters:
-            if type_adapter.handles_type(field.value):
-                return type_adapter
-        return self.default_serializer
+        return self._type_adapter_cache.get(field.value, self.type_adapters, self.default_serializer)
 
     @staticmethod
     def to_argument_str(name: str) -> str:
@@ -10,9 +10,13 @@ class BaseTypeAdapter(ABC):
     An abstract base class for defining type adapters for command-line arguments.
 
     Attributes:
-        None
+        is_type_based (bool): Whether `handles_type()` only depends on the type of the object. This allows the
+            Arguments to cache the matching type adapter per type. Only set it to True if the value itself is not
+            inspected (default is False).
     """
 
+    is_type_based: bool = False
+
     @abstractmethod
     def handles_type(self, obj: Any) -> bool:
         """
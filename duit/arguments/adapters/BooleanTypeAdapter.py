@@ -10,6 +10,8 @@ class BooleanTypeAdapter(BaseTypeAdapter):
     A type adapter for handling command-line arguments of bool data type.
     """
 
+    is_type_based = True
+
     def handles_type(self, obj: Any) -> bool:
         """
         Check if the type adapter can handle a specific data type (bool).
@@ -13,6 +13,8 @@ class DefaultTypeAdapter(BaseTypeAdapter):
         None
     """
 
+    is_type_based = True
+
     def handles_type(self, obj: Any) -> bool:
         """
         Check if the type adapter can handle a specific data type.
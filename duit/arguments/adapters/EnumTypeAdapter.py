@@ -14,6 +14,8 @@ class EnumTypeAdapter(BaseTypeAdapter):
         None
     """
 
+    is_type_based = True
+
     def handles_type(self, obj: Any) -> bool:
         """
         Check if the type adapter can handle a specific data type (enum).
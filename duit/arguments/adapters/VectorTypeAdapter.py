@@ -1,11 +1,9 @@
 import argparse
+import sys
 from typing import Any, Optional
 
-import vector
-
 from duit.arguments.Argument import Argument
 from duit.arguments.adapters.BaseTypeAdapter import BaseTypeAdapter
-from duit.utils import _vector
 
 
 class VectorTypeAdapter(BaseTypeAdapter):
@@ -16,6 +14,8 @@ class VectorTypeAdapter(BaseTypeAdapter):
         None
     """
 
+    is_type_based = True
+
     def handles_type(self, obj: Any) -> bool:
         """
         Check if the type adapter can handle a specific data type (vector.Vector).
@@ -26,7 +26,9 @@ class VectorTypeAdapter(BaseTypeAdapter):
         Returns:
             bool: True if the type adapter can handle vector.Vector data types, False otherwise.
         """
-        return isinstance(obj, vector.Vector)
+        # a vector can only exist if the module has been imported, which keeps the import out of the cli startup
+        vector = sys.modules.get("vector")
+        return vector is not None and isinstance(obj, vector.Vector)
 
     def add_argument(self, parser, argument: Argument, obj: Any):
         """
@@ -40,8 +42,10 @@ class VectorTypeAdapter(BaseTypeAdapter):
         Returns:
             None
         """
+        from duit.utils import _vector
+
         components = _vector.get_vector_attributes(obj)
-        default_value: Optional[vector.Vector] = argument.kwargs.get("default", None)
+        default_value: Optional[Any] = argument.kwargs.get("default", None)
 
         argument.kwargs["metavar"] = components
         argument.kwargs["type"] = float
@@ -64,6 +68,9 @@ class VectorTypeAdapter(BaseTypeAdapter):
         Returns:
             Any: The parsed vector.Vector object.
         """
+        import vector
+        from duit.utils import _vector
+
         components = _vector.get_vector_attributes(obj)
         values = getattr(args, ns_dest)
 
@@ -1,4 +1,4 @@
-from typing import TypeVar, Any
+from typing import TypeVar, Any, Optional, Sequence, Callable
 from duit.annotation.Annotation import Annotation
 from duit.iterator.ObjectIterator import ObjectIterator
 
@@ -15,9 +15,16 @@ class AnnotationIterator(ObjectIterator[A]):
             Defaults to True.
         only_recurse_public_fields (bool, optional): If True, the iterator will only recurse into public fields.
             Defaults to True.
+        max_depth (Optional[int], optional): The maximum depth to recurse into. Defaults to None (unlimited).
+        excluded_types (Sequence[type], optional): Types of objects which are never recursed into.
+        should_recurse (Optional[Callable[[str, Any], bool]], optional): A predicate on the attribute path and value,
+            which decides if the value is recursed into. Defaults to None.
     """
 
-    def __init__(self, obj: Any, recursive: bool = True, only_recurse_public_fields: bool = True):
+    def __init__(self, obj: Any, recursive: bool = True, only_recurse_public_fields: bool = True,
+                 max_depth: Optional[int] = None,
+                 excluded_types: Sequence[type] = (),
+                 should_recurse: Optional[Callable[[str, Any], bool]] = None):
         """
         Initialize the AnnotationIterator.
 
@@ -27,5 +34,10 @@ class AnnotationIterator(ObjectIterator[A]):
                 Defaults to True.
             only_recurse_public_fields (bool, optional): If True, the iterator will only recurse into public fields.
                 Defaults to True.
+            max_depth (Optional[int], optional): The maximum depth to recurse into. Defaults to None (unlimited).
+            excluded_types (Sequence[type], optional): Types of objects which are never recursed into.
+            should_recurse (Optional[Callable[[str, Any], bool]], optional): A predicate on the attribute path and value,
+                which decides if the value is recursed into. Defaults to None.
         """
-        super().__init__(obj, Annotation, recursive, only_recurse_public_fields)
\ No newline at end of file
+        super().__init__(obj, Annotation, recursive, only_recurse_public_fields,
+                         max_depth, excluded_types, should_recurse)
\ No newline at end of file
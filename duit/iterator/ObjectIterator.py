@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import TypeVar, Any, Generic, List, Iterator, Type, Optional
+from typing import TypeVar, Any, Generic, Iterator, Type, Optional, Callable, Sequence, List, Tuple
 
 OT = TypeVar("OT", bound=Any)
 
@@ -25,6 +25,9 @@ class ObjectIterator(Generic[OT]):
     """
     An iterator for recursively iterating over an object's fields.
 
+    The object graph is walked lazily: results are yielded as soon as they are found, which allows to stop the
+    iteration early. The traversal can be limited by depth, by type and by a predicate on the attribute path.
+
     Args:
         obj (Any): The object to iterate over.
         object_type (Type[OT]): The type of objects to look for during iteration.
@@ -32,10 +35,20 @@ class ObjectIterator(Generic[OT]):
             Defaults to True.
         only_recurse_public_fields (bool, optional): If True, the iterator will only recurse into public fields.
             Defaults to True.
+        max_depth (Optional[int], optional): The maximum depth to recurse into (0 only visits the fields of obj).
+            Defaults to None (unlimited).
+        excluded_types (Sequence[type], optional): Types of objects which are never recursed into.
+            Defaults to an empty sequence.
+        should_recurse (Optional[Callable[[str, Any], bool]], optional): A predicate which is called with the
+            attribute path (e.g. "camera.settings") and the value, before recursing into the value.
+            Defaults to None.
     """
 
     def __init__(self, obj: Any, object_type: Type[OT],
-                 recursive: bool = True, only_recurse_public_fields: bool = True):
+                 recursive: bool = True, only_recurse_public_fields: bool = True,
+                 max_depth: Optional[int] = None,
+                 excluded_types: Sequence[type] = (),
+                 should_recurse: Optional[Callable[[str, Any], bool]] = None):
         """
         Initialize the ObjectIterator.
 
@@ -46,46 +59,83 @@ class ObjectIterator(Generic[OT]):
                 Defaults to True.
             only_recurse_public_fields (bool, optional): If True, the iterator will only recurse into public fields.
                 Defaults to True.
+            max_depth (Optional[int], optional): The maximum depth to recurse into (0 only visits the fields of obj).
+                Defaults to None (unlimited).
+            excluded_types (Sequence[type], optional): Types of objects which are never recursed into.
+                Defaults to an empty sequence.
+            should_recurse (Optional[Callable[[str, Any], bool]], optional): A predicate which is called with the
+                attribute path and the value, before recursing into the value. Defaults to None.
         """
+        self._obj = obj
         self._object_type = object_type
         self._recursive = recursive
         self.only_recurse_public_fields = only_recurse_public_fields
-
-        self._results: List[ObjectIteratorResult] = []
-
-        self._processed_objects = set()
-        self._find_objects(obj)
+        self.max_depth = max_depth
+        self.excluded_types = tuple(excluded_types)
+        self.should_recurse = should_recurse
 
     def __iter__(self) -> Iterator[ObjectIteratorResult]:
         """
-        Returns an iterator for the results of the object iteration.
+        Returns a lazy iterator for the results of the object iteration.
 
         Returns:
             Iterator[ObjectIteratorResult]: Iterator for the results of the object iteration.
         """
-        return iter(self._results)
+        return self._find_objects(self._obj)
 
-    def _find_objects(self, obj: Any, parent_field_name: Optional[str] = None):
+    def _find_objects(self, obj: Any) -> Iterator[ObjectIteratorResult]:
         """
-        Recursively finds objects of the specified type in the given object.
+        Finds objects of the specified type in the given object and its nested objects.
+
+        The object graph is traversed depth-first with an explicit stack, to support deeply nested objects.
 
         Args:
             obj (Any): The object to search for objects of the specified type.
-            parent_field_name (Optional[str]): The name of the field in the parent object.
+
+        Yields:
+            ObjectIteratorResult: The found objects.
         """
-        self._processed_objects.add(id(obj))
+        processed_objects = {id(obj)}
 
         if not self._is_iterable(obj):
             return
 
-        for name, value in obj.__dict__.items():
-            if isinstance(value, self._object_type):
-                self._results.append(ObjectIteratorResult(parent_field_name, obj, name, value))
+        # each entry holds the object, the name of its field in the parent, its path, its depth and its attributes
+        stack: List[Tuple[Any, Optional[str], str, int, Iterator[Tuple[str, Any]]]] = [
+            (obj, None, "", 0, iter(list(obj.__dict__.items())))
+        ]
+
+        while stack:
+            current, parent_field_name, path, depth, attributes = stack[-1]
+            can_recurse = self._recursive and (self.max_depth is None or depth < self.max_depth)
+
+            for name, value in attributes:
+                if isinstance(value, self._object_type):
+                    yield ObjectIteratorResult(parent_field_name, current, name, value)
+
+                if not can_recurse or id(value) in processed_objects:
+                    continue
 
-            if self._recursive and id(value) not in self._processed_objects:
                 if self.only_recurse_public_fields and name.startswith("_"):
                     continue
-                self._find_objects(value, name)
+
+                if self.excluded_types and isinstance(value, self.excluded_types):
+                    continue
+
+                value_path = ""
+                if self.should_recurse is not None:
+                    value_path = f"{path}.{name}" if path else name
+                    if not self.should_recurse(value_path, value):
+                        continue
+
+                processed_objects.add(id(value))
+
+                if self._is_iterable(value):
+                    # continue with the nested object and resume this object afterwards
+                    stack.append((value, name, value_path, depth + 1, iter(list(value.__dict__.items()))))
+                    break
+            else:
+                stack.pop()
 
     @staticmethod
     def _is_iterable(obj: Any) -> bool:
@@ -98,4 +148,4 @@ class ObjectIterator(Generic[OT]):
         Returns:
             bool: True if the object is iterable, False otherwise.
         """
-        return hasattr(obj, "__dict__")
\ No newline at end of file
+        return hasattr(obj, "__dict__")
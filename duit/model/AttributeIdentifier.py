@@ -1,36 +1,151 @@
+import operator
 from dataclasses import dataclass, field
-from typing import List, Any
+from functools import lru_cache
+from typing import Any, Sequence, Tuple, Callable, Optional
+
+from duit.model.DataField import DataField
+
+ParentNode = Optional[Tuple[str, "ParentNode"]]
+"""
+A linked parent path node (name, parent node) which can be shared by all attributes of the same object while
+traversing an object tree.
+"""
 
 
 @dataclass(frozen=True)
 class AttributeIdentifier:
+    """
+    Identifies an attribute inside an object tree by its name and the names of its parent attributes.
+
+    Parent attributes which contain a DataField are resolved to the value of the DataField. The path, the hash
+    are computed once when the identifier is created, the attribute getters on first access.
+
+    Attributes:
+        name (str): The name of the attribute.
+        parents (Sequence[str]): The names of the parent attributes (from the root object to the attribute).
+    """
     name: str
-    parents: List[str] = field(default_factory=list)
+    parents: Sequence[str] = field(default_factory=tuple)
+
+    _path: str = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+    _parent_getters: Optional[Tuple[Callable[[Any], Any], ...]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        parents = tuple(self.parents)
+        path = self.get_path_separator().join((*parents, self.name))
+
+        # the identifier is frozen, so the cached values have to be set on the underlying object
+        object.__setattr__(self, "parents", parents)
+        object.__setattr__(self, "_path", path)
+        object.__setattr__(self, "_hash", hash(path))
+        object.__setattr__(self, "_parent_getters", None)
+
+    def get_parent(self, obj: Any) -> Any:
+        """
+        Get the object which contains the attribute.
+
+        Args:
+            obj (Any): The root object.
+
+        Returns:
+            Any: The object containing the attribute.
+        """
+        getters = self._parent_getters
+        if getters is None:
+            # the getters are only created on first access, finders create many identifiers which are never resolved
+            getters = tuple(operator.attrgetter(p) for p in self.parents)
+            object.__setattr__(self, "_parent_getters", getters)
+
+        for getter in getters:
+            obj = getter(obj)
+
+            if isinstance(obj, DataField):
+                obj = obj.value
+        return obj
+
+    def get_field(self, obj: Any) -> Any:
+        """
+        Get the attribute (usually a DataField) this identifier points to.
+
+        Args:
+            obj (Any): The root object.
+
+        Returns:
+            Any: The attribute.
+        """
+        return getattr(self.get_parent(obj), self.name)
 
     def get_value(self, obj: Any) -> Any:
-        pass
+        """
+        Get the value of the attribute. If the attribute is a DataField, its value is returned.
+
+        Args:
+            obj (Any): The root object.
+
+        Returns:
+            Any: The value of the attribute.
+        """
+        attribute = self.get_field(obj)
+
+        if isinstance(attribute, DataField):
+            return attribute.value
+        return attribute
 
-    def set_value(self, obj: Any) -> Any:
-        pass
+    def set_value(self, obj: Any, value: Any) -> None:
+        """
+        Set the value of the attribute. If the attribute is a DataField, its value is set.
+
+        Args:
+            obj (Any): The root object.
+            value (Any): The new value.
+        """
+        parent = self.get_parent(obj)
+        attribute = getattr(parent, self.name)
+
+        if isinstance(attribute, DataField):
+            attribute.value = value
+        else:
+            setattr(parent, self.name, value)
 
     def __str__(self):
-        return f"{self.__name__} ({self.path})"
+        return f"{type(self).__name__} ({self.path})"
 
     def __repr__(self):
-        self.__str__()
+        return self.__str__()
 
     @property
     def path(self) -> str:
-        return self.get_path_separator().join([*self.parents, self.name])
+        return self._path
 
     @staticmethod
     def get_path_separator() -> str:
         return "."
 
     @staticmethod
+    def from_parent_node(name: str, parent_node: ParentNode) -> "AttributeIdentifier":
+        """
+        Create an AttributeIdentifier from an attribute name and a linked parent path node.
+
+        Args:
+            name (str): The name of the attribute.
+            parent_node (ParentNode): The linked node of the innermost parent (None for the root object).
+
+        Returns:
+            AttributeIdentifier: The identifier of the attribute.
+        """
+        parents = []
+        while parent_node is not None:
+            parent_name, parent_node = parent_node
+            parents.append(parent_name)
+        parents.reverse()
+        return AttributeIdentifier(name, parents)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
     def from_path(path: str) -> "AttributeIdentifier":
         elements = path.split(AttributeIdentifier.get_path_separator())
         return AttributeIdentifier(elements.pop(), elements)
 
     def __hash__(self):
-        return hash(self.path)
+        return self._hash
@@ -0,0 +1,111 @@
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import Generic, Any, List, Optional, Iterator
+
+from duit.event.Event import Event
+from duit.model.DataField import DataField, T
+
+
+class ChangeType(Enum):
+    """
+    Enum describing how a single entry of a data collection has changed.
+    """
+    ADDED = "added"
+    UPDATED = "updated"
+    REMOVED = "removed"
+
+
+@dataclass(frozen=True)
+class CollectionChange:
+    """
+    Represents the change of a single entry (key or element) of a data collection.
+
+    Attributes:
+        change_type (ChangeType): The type of the change.
+        key (Any): The key (DataDict), element (DataSet) or index (DataList) that has changed.
+        old_value (Optional[Any]): The value before the change (None if the entry has been added).
+        new_value (Optional[Any]): The value after the change (None if the entry has been removed).
+    """
+    change_type: ChangeType
+    key: Any
+    old_value: Optional[Any] = None
+    new_value: Optional[Any] = None
+
+
+class DataCollection(DataField[T], Generic[T]):
+    """
+    A base class for observable collections which publish per-entry change deltas.
+
+    Every mutation fires the 'on_items_changed' event with the list of changed entries and afterwards the regular
+    'on_changed' event. Multiple mutations can be combined into a single notification by using the `batch()` context.
+    """
+
+    def __init__(self, value: T):
+        """
+        Initialize a DataCollection with the given value.
+
+        Args:
+            value (T): The initial collection.
+        """
+        super().__init__(value)
+        self.on_items_changed: Event[List[CollectionChange]] = Event[List[CollectionChange]]()
+
+        self._batch_depth: int = 0
+        self._pending_changes: List[CollectionChange] = []
+
+    @contextmanager
+    def batch(self) -> Iterator["DataCollection[T]"]:
+        """
+        Context manager to combine multiple mutations into a single notification.
+
+        The collected changes are published once the outermost batch context is left.
+
+        :yields: The collection itself.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+
+            if self._batch_depth == 0 and self._pending_changes:
+                changes = self._pending_changes
+                self._pending_changes = []
+                self._publish_changes(*changes)
+
+    @property
+    def is_batching(self) -> bool:
+        """
+        Check if the collection is currently inside a batch context.
+
+        Returns:
+            bool: True if changes are currently collected instead of published.
+        """
+        return self._batch_depth > 0
+
+    def _publish_changes(self, *changes: CollectionChange) -> None:
+        """
+        Publish the given changes or collect them if a batch is active.
+
+        Args:
+            *changes (CollectionChange): The changes to publish.
+        """
+        if not changes:
+            return
+
+        if self._batch_depth > 0:
+            self._pending_changes.extend(changes)
+            return
+
+        if not self.publish_enabled:
+            return
+
+        self.on_items_changed(list(changes))
+        self.fire()
+
+    def __getstate__(self):
+        d = super().__getstate__()
+        # reset the event because handlers may not be pickled
+        d["on_items_changed"] = Event()
+        return d
@@ -0,0 +1,210 @@
+from typing import Dict, Generic, Optional, TypeVar, Any, Iterator, KeysView, ValuesView, ItemsView, Mapping
+
+from duit.model.DataCollection import DataCollection, CollectionChange, ChangeType
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class DataDict(DataCollection[Dict[K, V]], Generic[K, V]):
+    """
+    A generic data field for managing a dictionary of values of type V with keys of type K.
+
+    Keyed mutations only compare the affected entry and publish the change as a `CollectionChange`.
+    """
+
+    def __init__(self, values: Optional[Dict[K, V]] = None):
+        """
+        Initialize a DataDict with optional initial values.
+
+        Args:
+            values (Optional[Dict[K, V]]): The initial values for the DataDict. Defaults to an empty dict if not provided.
+        """
+        if values is None:
+            values = {}
+
+        super().__init__(values)
+
+    def __len__(self) -> int:
+        """
+        Get the number of entries in the DataDict.
+
+        Returns:
+            int: The number of entries in the dict.
+        """
+        return len(self.value)
+
+    def __getitem__(self, key: K) -> V:
+        """
+        Get the value stored for the specified key.
+
+        Args:
+            key (K): The key of the value to retrieve.
+
+        Returns:
+            V: The value stored for the key.
+        """
+        return self.value[key]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """
+        Set the value for the specified key and trigger the change events if the entry has changed.
+
+        Args:
+            key (K): The key of the value to set.
+            value (V): The new value.
+        """
+        values = self.value
+        old_value = values.get(key, _MISSING)
+        values[key] = value
+
+        if old_value is _MISSING:
+            self._publish_changes(CollectionChange(ChangeType.ADDED, key, None, value))
+        elif not self._is_equal(old_value, value):
+            self._publish_changes(CollectionChange(ChangeType.UPDATED, key, old_value, value))
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Delete the entry for the specified key and trigger the change events.
+
+        Args:
+            key (K): The key of the entry to delete.
+        """
+        values = self.value
+        old_value = values.pop(key)
+        self._publish_changes(CollectionChange(ChangeType.REMOVED, key, old_value, None))
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Check if the DataDict contains the specified key.
+
+        Args:
+            key (Any): The key to check.
+
+        Returns:
+            bool: True if the key is present, False otherwise.
+        """
+        return key in self.value
+
+    def __iter__(self) -> Iterator[K]:
+        """
+        Iterate over the keys of the DataDict.
+
+        Returns:
+            Iterator[K]: An iterator over the keys.
+        """
+        return iter(self.value)
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Get the value for the specified key or a default value if the key is not present.
+
+        Args:
+            key (K): The key of the value to retrieve.
+            default (Optional[V]): The value returned if the key is not present.
+
+        Returns:
+            Optional[V]: The value stored for the key or the default value.
+        """
+        return self.value.get(key, default)
+
+    def keys(self) -> KeysView[K]:
+        """
+        Get a view of the keys of the DataDict.
+
+        Returns:
+            KeysView[K]: The keys of the dict.
+        """
+        return self.value.keys()
+
+    def values(self) -> ValuesView[V]:
+        """
+        Get a view of the values of the DataDict.
+
+        Returns:
+            ValuesView[V]: The values of the dict.
+        """
+        return self.value.values()
+
+    def items(self) -> ItemsView[K, V]:
+        """
+        Get a view of the entries of the DataDict.
+
+        Returns:
+            ItemsView[K, V]: The entries of the dict.
+        """
+        return self.value.items()
+
+    def pop(self, key: K, default: Any = _MISSING) -> V:
+        """
+        Remove and return the value for the specified key and trigger the change events.
+
+        Args:
+            key (K): The key of the entry to remove.
+            default (Any): The value returned if the key is not present. If not provided, a KeyError is raised.
+
+        Returns:
+            V: The removed value or the default value.
+        """
+        values = self.value
+
+        if key not in values:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+
+        value = values.pop(key)
+        self._publish_changes(CollectionChange(ChangeType.REMOVED, key, value, None))
+        return value
+
+    def setdefault(self, key: K, default: Optional[V] = None) -> V:
+        """
+        Return the value for the specified key and insert the default value if the key is not present.
+
+        Args:
+            key (K): The key of the entry.
+            default (Optional[V]): The value inserted if the key is not present.
+
+        Returns:
+            V: The value stored for the key.
+        """
+        values = self.value
+
+        if key in values:
+            return values[key]
+
+        self[key] = default
+        return default
+
+    def update(self, other: Optional[Mapping[K, V]] = None, **kwargs: V) -> None:
+        """
+        Update the DataDict with the entries of another mapping and trigger the change events once.
+
+        Args:
+            other (Optional[Mapping[K, V]]): The mapping to update the entries from.
+            **kwargs (V): Additional entries to update.
+        """
+        with self.batch():
+            if other is not None:
+                for key, value in other.items():
+                    self[key] = value
+
+            for key, value in kwargs.items():
+                self[key] = value
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the DataDict and trigger the change events.
+        """
+        values = self.value
+        changes = [CollectionChange(ChangeType.REMOVED, k, v, None) for k, v in values.items()]
+        values.clear()
+        self._publish_changes(*changes)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__} {self._value}"
+
+    def __str__(self):
+        return self.__repr__()
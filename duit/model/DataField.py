@@ -92,7 +92,7 @@ class DataField(Generic[T]):
         """
         Trigger the 'on_changed' event with the current value.
         """
-        value = self._value
+        value = self._get_fire_value()
 
         if self._plugins:
             for plugin in self._plugins:
@@ -104,7 +104,16 @@ class DataField(Generic[T]):
         """
         Trigger the 'on_changed' event with the current value, invoking only the latest listener.
         """
-        self.on_changed.invoke_latest(self._value)
+        self.on_changed.invoke_latest(self._get_fire_value())
+
+    def _get_fire_value(self) -> T:
+        """
+        Get the value which is published by the 'on_changed' event.
+
+        Returns:
+            T: The value to publish.
+        """
+        return self._value
 
     def bind_to(self, model: "DataField[T]") -> None:
         """
@@ -165,8 +174,7 @@ class DataField(Generic[T]):
         Args:
             *plugins (duit.model.DataFieldPlugin.DataFieldPlugin): One or more DataField plugins to register.
         """
-        self._plugins += plugins
-        self._plugins = sorted(self._plugins, key=lambda x: x.order_index)
+        self._plugins = sorted([*self._plugins, *plugins], key=lambda x: x.order_index)
         for plugin in self._plugins:
             plugin.on_register(self)
 
@@ -177,9 +185,12 @@ class DataField(Generic[T]):
         Args:
             *plugins (duit.model.DataFieldPlugin.DataFieldPlugin): One or more DataField plugins to unregister.
         """
+        # the list is replaced instead of modified, because plugins may unregister while the list is iterated
+        remaining_plugins = list(self._plugins)
         for plugin in plugins:
-            self._plugins.remove(plugin)
+            remaining_plugins.remove(plugin)
             plugin.on_unregister(self)
+        self._plugins = remaining_plugins
 
     def clear_plugins(self):
         """
@@ -209,8 +220,13 @@ class DataField(Generic[T]):
         Returns:
             bool: True if the values are equal, False otherwise.
         """
+        if isinstance(value, np.memmap) or isinstance(new_value, np.memmap):
+            # comparing would read the whole mapped file
+            return value is new_value
+
         if isinstance(value, np.ndarray):
-            return np.array_equal(value, new_value)
+            # subclasses like vector arrays do not implement array_equal
+            return np.array_equal(np.asarray(value), np.asarray(new_value))
 
         result = value == new_value
 
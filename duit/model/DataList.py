@@ -1,25 +1,100 @@
-from typing import List, Generic, Optional
+from typing import List, Generic, Optional, Tuple, Union, Iterable
 
+from duit.event.Event import Event
+from duit.model.DataCollection import CollectionChange, ChangeType
 from duit.model.DataField import DataField, T
 
 
 class DataList(DataField[List[T]], Generic[T]):
     """
     A generic data field for managing a list of values of type T.
+
+    Mutations of single elements (and extending the list) fire the 'on_items_changed' event with the changed indices
+    before the regular 'on_changed' event. Other mutations (e.g. sorting or setting a new list) only fire
+    'on_changed'.
     """
 
-    def __init__(self, values: Optional[List[T]] = None):
+    def __init__(self, values: Optional[List[T]] = None, publish_snapshots: bool = False):
         """
         Initialize a DataList with optional initial values.
 
         Args:
             values (Optional[List[T]]): The initial values for the DataList. Defaults to an empty list if not provided.
+            publish_snapshots (bool): Publish an immutable tuple snapshot instead of the live list with the
+                'on_changed' event. The snapshot is shared by all handlers and can be retained without copying.
         """
         if values is None:
             values = []
 
         super().__init__(values)
 
+        self.publish_snapshots = publish_snapshots
+        self._snapshot: Optional[Tuple[T, ...]] = None
+
+        self.on_items_changed: Event[List[CollectionChange]] = Event[List[CollectionChange]]()
+
+    @property
+    def snapshot(self) -> Tuple[T, ...]:
+        """
+        Get an immutable snapshot of the current elements.
+
+        The snapshot is created at most once per change and renewed whenever the DataList fires or a new value is set.
+
+        Returns:
+            Tuple[T, ...]: The elements of the list as tuple.
+        """
+        if self._snapshot is None:
+            self._snapshot = tuple(self._value)
+        return self._snapshot
+
+    @DataField.value.setter
+    def value(self, new_value: List[T]) -> None:
+        """
+        Set the value of the DataList and trigger the 'on_changed' event if the value changes.
+
+        Args:
+            new_value (List[T]): The new list.
+        """
+        # the snapshot is renewed even if the new value does not fire (e.g. set_silent or an equal list)
+        self._snapshot = None
+        DataField.value.fset(self, new_value)
+
+    def fire(self):
+        """
+        Trigger the 'on_changed' event with the current value (or a snapshot of it if publish_snapshots is enabled).
+        """
+        # every fire marks a change of the list
+        self._snapshot = None
+        super().fire()
+
+    def _fire_changes(self, changes: Optional[Iterable[CollectionChange]] = None) -> None:
+        """
+        Trigger the 'on_items_changed' event with the changes and afterwards the 'on_changed' event.
+
+        Like the other data collections, no event is triggered if publishing is disabled.
+
+        Args:
+            changes (Optional[Iterable[CollectionChange]]): The changes, with the index of the element as key. The
+                changes are only created if a handler is registered. If None, only the 'on_changed' event is
+                triggered.
+        """
+        if not self.publish_enabled:
+            # the list has changed anyway
+            self._snapshot = None
+            return
+
+        if changes is not None and self.on_items_changed.handler_size > 0:
+            self.on_items_changed(list(changes))
+        self.fire()
+
+    def _get_index(self, index: int) -> int:
+        return index + len(self._value) if index < 0 else index
+
+    def _get_fire_value(self) -> Union[List[T], Tuple[T, ...]]:
+        if self.publish_snapshots:
+            return self.snapshot
+        return self._value
+
     def __len__(self) -> int:
         """
         Get the number of elements in the DataList.
@@ -49,8 +124,15 @@ class DataList(DataField[List[T]], Generic[T]):
             index (int): The index of the element to set.
             value (T): The new value to set at the specified index.
         """
+        if isinstance(index, slice):
+            self.value[index] = value
+            self._fire_changes()
+            return
+
+        index = self._get_index(index)
+        old_value = self.value[index]
         self.value[index] = value
-        self.fire()
+        self._fire_changes([CollectionChange(ChangeType.UPDATED, index, old_value, value)])
 
     def __delitem__(self, index: int) -> None:
         """
@@ -59,8 +141,14 @@ class DataList(DataField[List[T]], Generic[T]):
         Args:
             index (int): The index of the element to delete.
         """
-        del self.value[index]
-        self.fire()
+        if isinstance(index, slice):
+            del self.value[index]
+            self._fire_changes()
+            return
+
+        index = self._get_index(index)
+        old_value = self.value.pop(index)
+        self._fire_changes([CollectionChange(ChangeType.REMOVED, index, old_value=old_value)])
 
     def insert(self, index: int, value: T) -> None:
         """
@@ -70,8 +158,10 @@ class DataList(DataField[List[T]], Generic[T]):
             index (int): The index at which to insert the value.
             value (T): The value to insert.
         """
+        # insert clamps the index to the bounds of the list
+        index = min(max(self._get_index(index), 0), len(self._value))
         self.value.insert(index, value)
-        self.fire()
+        self._fire_changes([CollectionChange(ChangeType.ADDED, index, new_value=value)])
 
     def append(self, value: T) -> None:
         """
@@ -81,7 +171,7 @@ class DataList(DataField[List[T]], Generic[T]):
             value (T): The value to append.
         """
         self.value.append(value)
-        self.fire()
+        self._fire_changes([CollectionChange(ChangeType.ADDED, len(self._value) - 1, new_value=value)])
 
     def extend(self, other: List[T]) -> None:
         """
@@ -90,8 +180,10 @@ class DataList(DataField[List[T]], Generic[T]):
         Args:
             other (List[T]): The list of values to extend with.
         """
+        start = len(self._value)
         self.value.extend(other)
-        self.fire()
+        self._fire_changes(CollectionChange(ChangeType.ADDED, i, new_value=self._value[i])
+                           for i in range(start, len(self._value)))
 
     def pop(self, index: int = -1) -> T:
         """
@@ -103,8 +195,9 @@ class DataList(DataField[List[T]], Generic[T]):
         Returns:
             T: The removed element.
         """
+        index = self._get_index(index)
         value = self.value.pop(index)
-        self.fire()
+        self._fire_changes([CollectionChange(ChangeType.REMOVED, index, old_value=value)])
         return value
 
     def remove(self, value: T) -> None:
@@ -114,15 +207,16 @@ class DataList(DataField[List[T]], Generic[T]):
         Args:
             value (T): The value to remove.
         """
-        self.value.remove(value)
-        self.fire()
+        index = self.value.index(value)
+        old_value = self.value.pop(index)
+        self._fire_changes([CollectionChange(ChangeType.REMOVED, index, old_value=old_value)])
 
     def clear(self) -> None:
         """
         Remove all elements from the DataList and trigger the 'on_changed' event.
         """
         self.value.clear()
-        self.fire()
+        self._fire_changes()
 
     def index(self, value: T, start: int = 0, end: int = None) -> int:
         """
@@ -159,14 +253,14 @@ class DataList(DataField[List[T]], Generic[T]):
             reverse (bool): Whether to sort in reverse order.
         """
         self.value.sort(key=key, reverse=reverse)
-        self.fire()
+        self._fire_changes()
 
     def reverse(self) -> None:
         """
         Reverse the order of elements in the DataList and trigger the 'on_changed' event.
         """
         self.value.reverse()
-        self.fire()
+        self._fire_changes()
 
     def __iter__(self):
         """
@@ -196,3 +290,9 @@ class DataList(DataField[List[T]], Generic[T]):
 
     def __str__(self):
         return self.__repr__()
+
+    def __getstate__(self):
+        d = super().__getstate__()
+        # reset the event because handlers may not be pickled
+        d["on_items_changed"] = Event()
+        return d
@@ -0,0 +1,146 @@
+from typing import Set, Generic, Optional, Iterable, Iterator, Any
+
+from duit.model.DataCollection import DataCollection, CollectionChange, ChangeType
+from duit.model.DataField import T
+
+
+class DataSet(DataCollection[Set[T]], Generic[T]):
+    """
+    A generic data field for managing a set of values of type T.
+
+    Each added or removed element is published as a `CollectionChange`.
+    """
+
+    def __init__(self, values: Optional[Iterable[T]] = None):
+        """
+        Initialize a DataSet with optional initial values.
+
+        Args:
+            values (Optional[Iterable[T]]): The initial values for the DataSet. Defaults to an empty set if not provided.
+        """
+        super().__init__(set() if values is None else set(values))
+
+    def __len__(self) -> int:
+        """
+        Get the number of elements in the DataSet.
+
+        Returns:
+            int: The number of elements in the set.
+        """
+        return len(self.value)
+
+    def __contains__(self, value: Any) -> bool:
+        """
+        Check if the DataSet contains the specified element.
+
+        Args:
+            value (Any): The element to check.
+
+        Returns:
+            bool: True if the element is present, False otherwise.
+        """
+        return value in self.value
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterate over the elements of the DataSet.
+
+        Returns:
+            Iterator[T]: An iterator over the elements.
+        """
+        return iter(self.value)
+
+    def add(self, value: T) -> None:
+        """
+        Add an element to the DataSet and trigger the change events if it was not present.
+
+        Args:
+            value (T): The element to add.
+        """
+        values = self.value
+
+        if value in values:
+            return
+
+        values.add(value)
+        self._publish_changes(CollectionChange(ChangeType.ADDED, value, None, value))
+
+    def discard(self, value: T) -> None:
+        """
+        Remove an element from the DataSet if it is present and trigger the change events.
+
+        Args:
+            value (T): The element to remove.
+        """
+        values = self.value
+
+        if value not in values:
+            return
+
+        values.remove(value)
+        self._publish_changes(CollectionChange(ChangeType.REMOVED, value, value, None))
+
+    def remove(self, value: T) -> None:
+        """
+        Remove an element from the DataSet and trigger the change events.
+
+        Args:
+            value (T): The element to remove.
+
+        Raises:
+            KeyError: If the element is not present.
+        """
+        if value not in self.value:
+            raise KeyError(value)
+
+        self.discard(value)
+
+    def pop(self) -> T:
+        """
+        Remove and return an arbitrary element from the DataSet and trigger the change events.
+
+        Returns:
+            T: The removed element.
+        """
+        value = self.value.pop()
+        self._publish_changes(CollectionChange(ChangeType.REMOVED, value, value, None))
+        return value
+
+    def update(self, *others: Iterable[T]) -> None:
+        """
+        Add the elements of the given iterables to the DataSet and trigger the change events once.
+
+        Args:
+            *others (Iterable[T]): The iterables to add the elements from.
+        """
+        with self.batch():
+            for other in others:
+                for value in other:
+                    self.add(value)
+
+    def difference_update(self, *others: Iterable[T]) -> None:
+        """
+        Remove the elements of the given iterables from the DataSet and trigger the change events once.
+
+        Args:
+            *others (Iterable[T]): The iterables to remove the elements from.
+        """
+        with self.batch():
+            for other in others:
+                for value in other:
+                    self.discard(value)
+
+    def clear(self) -> None:
+        """
+        Remove all elements from the DataSet and trigger the change events.
+        """
+        values = self.value
+        changes = [CollectionChange(ChangeType.REMOVED, v, v, None) for v in values]
+        values.clear()
+        self._publish_changes(*changes)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__} {self._value}"
+
+    def __str__(self):
+        return self.__repr__()
@@ -0,0 +1,222 @@
+from typing import Any, Dict, Tuple, List, Optional, Type, Callable, Iterator, Set
+
+from duit.annotation.Annotation import Annotation
+from duit.annotation.AnnotationSchema import DefaultAnnotationSchemaCache
+from duit.model.AttributeIdentifier import AttributeIdentifier
+from duit.model.DataField import DataField
+
+_ROOT_PATH = ""
+
+
+class FieldIndex:
+    """
+    An index of all DataFields of an object tree by their attribute path (e.g. "camera.exposure").
+
+    The index is built once and allows to get and set fields by path in O(1). Nested objects are found through
+    the values of DataFields, the same way the AnnotationFinder recurses into objects. If the value of such a
+    DataField is replaced, the fields of the new sub-object are indexed again.
+    """
+
+    def __init__(self, obj: Any, watch_changes: bool = True):
+        """
+        Initialize a FieldIndex and index all DataFields of the object.
+
+        Args:
+            obj (Any): The root object of the tree to index.
+            watch_changes (bool): Whether the index is updated when sub-objects are replaced (default is True).
+        """
+        self.obj = obj
+        self.watch_changes = watch_changes
+
+        self._entries: Dict[str, Tuple[AttributeIdentifier, DataField]] = {}
+        self._children: Dict[str, List[str]] = {}
+        self._watchers: Dict[str, Tuple[DataField, Callable[[Any], None]]] = {}
+
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """
+        Clear the index and index all DataFields of the root object again.
+        """
+        self._remove_subtree(_ROOT_PATH)
+        self._index(self.obj, (), {id(self.obj)})
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __getitem__(self, path: str) -> DataField:
+        """
+        Get the DataField at the specified path.
+
+        Args:
+            path (str): The attribute path of the DataField.
+
+        Returns:
+            DataField: The DataField at the path.
+
+        Raises:
+            KeyError: If no DataField is indexed at the path.
+        """
+        return self._entries[path][1]
+
+    def get(self, path: str, default: Optional[DataField] = None) -> Optional[DataField]:
+        """
+        Get the DataField at the specified path or a default value if the path is not indexed.
+
+        Args:
+            path (str): The attribute path of the DataField.
+            default (Optional[DataField]): The value returned if the path is not indexed.
+
+        Returns:
+            Optional[DataField]: The DataField at the path or the default value.
+        """
+        entry = self._entries.get(path)
+        return default if entry is None else entry[1]
+
+    def get_identifier(self, path: str) -> AttributeIdentifier:
+        """
+        Get the AttributeIdentifier of the DataField at the specified path.
+
+        Args:
+            path (str): The attribute path of the DataField.
+
+        Returns:
+            AttributeIdentifier: The identifier of the DataField.
+        """
+        return self._entries[path][0]
+
+    def get_value(self, path: str) -> Any:
+        """
+        Get the value of the DataField at the specified path.
+
+        Args:
+            path (str): The attribute path of the DataField.
+
+        Returns:
+            Any: The value of the DataField.
+        """
+        return self._entries[path][1].value
+
+    def set_value(self, path: str, value: Any) -> None:
+        """
+        Set the value of the DataField at the specified path.
+
+        Args:
+            path (str): The attribute path of the DataField.
+            value (Any): The new value.
+        """
+        self._entries[path][1].value = value
+
+    def query(self, prefix: str = _ROOT_PATH,
+              annotation_type: Optional[Type[Annotation]] = None) -> Dict[str, DataField]:
+        """
+        Get all DataFields at or below the specified path, optionally filtered by annotation type.
+
+        Args:
+            prefix (str): The attribute path to start from (default is the root object).
+            annotation_type (Optional[Type[Annotation]]): Only return fields which are annotated with this type.
+
+        Returns:
+            Dict[str, DataField]: The matching DataFields by path.
+        """
+        attribute_name = None
+        if annotation_type is not None:
+            attribute_name = annotation_type._get_annotation_attribute_name()
+
+        paths: List[str] = []
+        if prefix in self._entries:
+            paths.append(prefix)
+
+        stack = list(reversed(self._children.get(prefix, [])))
+        while stack:
+            path = stack.pop()
+            paths.append(path)
+            stack.extend(reversed(self._children.get(path, [])))
+
+        result: Dict[str, DataField] = {}
+        for path in paths:
+            field = self._entries[path][1]
+
+            if attribute_name is not None:
+                annotation = field.__dict__.get(attribute_name)
+                if annotation is None or not isinstance(annotation, annotation_type):
+                    continue
+
+            result[path] = field
+        return result
+
+    def dispose(self) -> None:
+        """
+        Remove all event handlers the index has registered on the DataFields.
+        """
+        for field, handler in self._watchers.values():
+            if field.on_changed.contains(handler):
+                field.on_changed.remove(handler)
+        self._watchers.clear()
+
+    def _index(self, obj: Any, parents: Tuple[str, ...], processed_objects: Set[int]) -> None:
+        stack: List[Tuple[Any, Tuple[str, ...]]] = [(obj, parents)]
+
+        while stack:
+            current, current_parents = stack.pop()
+
+            fields = DefaultAnnotationSchemaCache.get_fields(current)
+            if not fields:
+                continue
+
+            children = self._children.setdefault(AttributeIdentifier.get_path_separator().join(current_parents), [])
+
+            for name, field in fields:
+                identifier = AttributeIdentifier(name, current_parents)
+                path = identifier.path
+
+                self._entries[path] = (identifier, field)
+                children.append(path)
+
+                value = field.value
+                is_container = value is None or (hasattr(value, "__dict__") and not callable(value))
+
+                if self.watch_changes and is_container:
+                    self._watch(identifier, field)
+
+                if value is not None and is_container and id(value) not in processed_objects:
+                    processed_objects.add(id(value))
+                    stack.append((value, (*current_parents, name)))
+
+    def _remove_subtree(self, prefix: str) -> None:
+        stack = [prefix]
+
+        while stack:
+            path = stack.pop()
+
+            for child in self._children.pop(path, []):
+                self._entries.pop(child, None)
+                self._unwatch(child)
+                stack.append(child)
+
+    def _watch(self, identifier: AttributeIdentifier, field: DataField) -> None:
+        path = identifier.path
+        if path in self._watchers:
+            return
+
+        def on_changed(value: Any):
+            self._remove_subtree(path)
+            self._index(value, (*identifier.parents, identifier.name), {id(self.obj)})
+
+        field.on_changed.append(on_changed)
+        self._watchers[path] = (field, on_changed)
+
+    def _unwatch(self, path: str) -> None:
+        watcher = self._watchers.pop(path, None)
+        if watcher is None:
+            return
+
+        field, handler = watcher
+        if field.on_changed.contains(handler):
+            field.on_changed.remove(handler)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import sys
+from typing import TypeVar, Generic, Callable, Optional
+
+import duit.model.DataField
+from duit.model.DataFieldPlugin import DataFieldPlugin
+
+T = TypeVar("T")
+
+
+class LazyValuePlugin(DataFieldPlugin[T], Generic[T]):
+    """
+    A DataField plugin which defers loading the value of a DataField until it is read for the first time.
+
+    Until then, the DataField keeps its previous value internally. On first access, the loader is called and its
+    result is set as the value of the DataField, which triggers the 'on_changed' event if the value differs.
+    If a new value is set before the value has been loaded, the loader is discarded. In both cases the plugin
+    unregisters itself.
+    """
+
+    def __init__(self, loader: Callable[[], T]):
+        """
+        Initialize a LazyValuePlugin.
+
+        Args:
+            loader (Callable[[], T]): A function which returns the value of the DataField.
+        """
+        super().__init__()
+        # lazy values have to be loaded before any other plugin processes the value
+        self.order_index = -sys.maxsize
+
+        self._loader: Optional[Callable[[], T]] = loader
+
+    @property
+    def is_loaded(self) -> bool:
+        """
+        Check if the loader has been called (or discarded).
+
+        Returns:
+            bool: True if the value does not need to be loaded anymore.
+        """
+        return self._loader is None
+
+    def load(self, field: duit.model.DataField.DataField[T], publish: bool = True) -> None:
+        """
+        Call the loader and set its result as value of the DataField, if this has not happened yet.
+
+        Args:
+            field (duit.model.DataField.DataField[T]): The DataField the plugin is registered with.
+            publish (bool): Whether to trigger the 'on_changed' event of the DataField (default is True).
+        """
+        loader = self._loader
+        if loader is None:
+            return
+
+        self._loader = None
+        value = loader()
+
+        if publish:
+            field.value = value
+        else:
+            field.set_silent(value)
+
+        field.unregister_plugin(self)
+
+    def discard(self, field: duit.model.DataField.DataField[T]) -> None:
+        """
+        Discard the loader without calling it and unregister the plugin. The DataField keeps its previous value.
+
+        Args:
+            field (duit.model.DataField.DataField[T]): The DataField the plugin is registered with.
+        """
+        if self._loader is None:
+            return
+
+        self._loader = None
+        field.unregister_plugin(self)
+
+    @staticmethod
+    def get_pending(field: duit.model.DataField.DataField[T]) -> Optional[LazyValuePlugin[T]]:
+        """
+        Get the LazyValuePlugin of a DataField, which has not loaded its value yet.
+
+        Args:
+            field (duit.model.DataField.DataField[T]): The DataField.
+
+        Returns:
+            Optional[LazyValuePlugin[T]]: The pending plugin or None.
+        """
+        for plugin in field.plugins:
+            if isinstance(plugin, LazyValuePlugin) and not plugin.is_loaded:
+                return plugin
+        return None
+
+    def on_set_value(self, field: duit.model.DataField.DataField[T], old_value: T, new_value: T) -> T:
+        self.discard(field)
+        return new_value
+
+    def on_get_value(self, field: duit.model.DataField.DataField[T], value: T) -> T:
+        if self._loader is None:
+            return value
+
+        self.load(field)
+        return field._value
+
+    def on_fire(self, field: duit.model.DataField.DataField[T], value: T) -> T:
+        if self._loader is None:
+            return value
+
+        self.load(field, publish=False)
+        return field._value
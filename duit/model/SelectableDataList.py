@@ -10,18 +10,20 @@ class SelectableDataList(DataList[T], Generic[T]):
     A generic data list that supports selecting items with an associated index.
     """
 
-    def __init__(self, values: Optional[List[T]] = None, selected_index: Optional[int] = None):
+    def __init__(self, values: Optional[List[T]] = None, selected_index: Optional[int] = None,
+                 publish_snapshots: bool = False):
         """
         Initialize a SelectableDataList with optional initial values and a selected index.
 
         Args:
             values (Optional[List[T]]): The initial values for the SelectableDataList. Defaults to an empty list if not provided.
             selected_index (Optional[int]): The initial selected index. If not provided, it defaults to 0 if there are values.
+            publish_snapshots (bool): Publish an immutable tuple snapshot instead of the live list with the 'on_changed' event.
         """
         if values is None:
             values = []
 
-        super().__init__(values)
+        super().__init__(values, publish_snapshots)
 
         if len(values) > 0:
             selected_index = 0
@@ -0,0 +1,258 @@
+import hashlib
+import logging
+import os
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from string import hexdigits
+from typing import Optional, Dict, Any, Union, BinaryIO, Sequence, List
+
+import numpy as np
+
+OFFSET_ATTRIBUTE = "offset"
+SIZE_ATTRIBUTE = "size"
+FILE_ATTRIBUTE = "file"
+
+# the number of bytes of the content hash which names a version of the sidecar file
+_HASH_SIZE = 8
+
+_active_writer: ContextVar[Optional["ArraySidecarWriter"]] = ContextVar("active_array_sidecar_writer", default=None)
+_active_reader: ContextVar[Optional["ArraySidecarReader"]] = ContextVar("active_array_sidecar_reader", default=None)
+
+
+class ArraySidecarWriter:
+    """
+    Writes numpy arrays into a binary sidecar file next to a settings file.
+
+    The arrays are written one after another as raw C-ordered bytes, each aligned to `alignment` bytes, so they
+    can be memory-mapped when loading. Each version of the sidecar file is named by the hash of its content
+    (`<path>.<hash>`), which means that saving unchanged arrays references the same file again. The sidecar has to
+    be committed before the settings file is written, and the previous versions are only removed afterwards with
+    `remove_stale()`. This keeps the settings file consistent if the process stops in between, and memory-mapped
+    arrays of a previously loaded version valid.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], min_size: int = 4096, alignment: int = 64):
+        """
+        Initialize an ArraySidecarWriter.
+
+        Args:
+            path (Union[str, os.PathLike]): The path of the sidecar file.
+            min_size (int): Arrays with fewer bytes are not written to the sidecar file (default is 4096).
+            alignment (int): The byte alignment of each array in the sidecar file (default is 64).
+        """
+        self.path = Path(path)
+        self.min_size = min_size
+        self.alignment = alignment
+
+        self._temp_path: Optional[Path] = None
+        self._file_path: Optional[Path] = None
+        self._file: Optional[BinaryIO] = None
+        self._offset = 0
+
+        self._hash = hashlib.blake2b(digest_size=_HASH_SIZE)
+        self._references: List[Dict[str, Any]] = []
+
+    def write(self, array: np.ndarray) -> Optional[Dict[str, Any]]:
+        """
+        Write an array into the sidecar file. The file name of the reference is set by `commit()`.
+
+        Args:
+            array (np.ndarray): The array to write.
+
+        Returns:
+            Optional[Dict[str, Any]]: The reference of the array in the sidecar file, or None if the array is
+            too small or cannot be stored as raw bytes (e.g. object arrays).
+        """
+        if array.nbytes < self.min_size or array.dtype.hasobject:
+            return None
+
+        if self._file is None:
+            # every writer uses its own temporary file, so concurrent saves of the same path do not interfere
+            # the file is created with open() to get the default permissions (mkstemp only allows the owner)
+            self._temp_path = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}.tmp")
+            self._file = open(self._temp_path, "xb")
+
+        padding = -self._offset % self.alignment
+        if padding > 0:
+            self._write(b"\0" * padding)
+            self._offset += padding
+
+        # contiguous arrays are written without an intermediate copy
+        data = np.ascontiguousarray(array)
+        self._write(memoryview(data).cast("B"))
+
+        reference = {FILE_ATTRIBUTE: None, OFFSET_ATTRIBUTE: self._offset, SIZE_ATTRIBUTE: data.nbytes}
+        self._references.append(reference)
+        self._offset += data.nbytes
+        return reference
+
+    def commit(self, fsync: bool = False) -> None:
+        """
+        Close the sidecar file, move it to its versioned path and set the file name of all references. This has
+        to happen before the settings file is written.
+
+        Args:
+            fsync (bool): Whether to sync the sidecar file to the storage device (default is False).
+        """
+        if self._file is None:
+            return
+
+        self._file.flush()
+        if fsync:
+            os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+
+        self._file_path = self.path.with_name(f"{self.path.name}.{self._hash.hexdigest()}")
+
+        # an existing version has the same content and may still be memory-mapped
+        if self._file_path.exists():
+            self._temp_path.unlink()
+        else:
+            os.replace(self._temp_path, self._file_path)
+        self._temp_path = None
+
+        for reference in self._references:
+            reference[FILE_ATTRIBUTE] = self._file_path.name
+
+    def abort(self) -> None:
+        """
+        Close and remove the temporary sidecar file without touching the existing versions.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        if self._temp_path is not None and self._temp_path.exists():
+            self._temp_path.unlink()
+        self._temp_path = None
+
+    def remove_stale(self) -> None:
+        """
+        Remove the previous versions of the sidecar file, after the settings file references the new version.
+
+        Files which cannot be removed (e.g. because they are still memory-mapped on Windows) are kept and removed
+        by a later save.
+        """
+        for path in self._get_version_paths():
+            if path == self._file_path:
+                continue
+
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _write(self, data: Union[bytes, memoryview]) -> None:
+        self._file.write(data)
+        self._hash.update(data)
+
+    def _get_version_paths(self) -> List[Path]:
+        if not self.path.parent.is_dir():
+            return []
+
+        prefix = f"{self.path.name}."
+        paths = []
+
+        for name in os.listdir(self.path.parent):
+            version = name[len(prefix):]
+            if name.startswith(prefix) and len(version) == _HASH_SIZE * 2 and all(c in hexdigits for c in version):
+                paths.append(self.path.with_name(name))
+
+        return paths
+
+    @contextmanager
+    def activate(self):
+        """
+        Use this writer for all numpy arrays serialized in the current context.
+        """
+        token = _active_writer.set(self)
+        try:
+            yield self
+        finally:
+            _active_writer.reset(token)
+
+    @staticmethod
+    def get_active() -> Optional["ArraySidecarWriter"]:
+        """
+        Get the writer of the current context.
+
+        Returns:
+            Optional[ArraySidecarWriter]: The active writer or None.
+        """
+        return _active_writer.get()
+
+
+class ArraySidecarReader:
+    """
+    Reads numpy arrays from a binary sidecar file written by an ArraySidecarWriter.
+
+    The file is only accessed if an array is read. By default, arrays are memory-mapped read-only, which means that
+    their data is only loaded by the operating system when it is accessed.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], mmap_mode: Optional[str] = "r"):
+        """
+        Initialize an ArraySidecarReader.
+
+        Args:
+            path (Union[str, os.PathLike]): The path of the sidecar file. The version referenced by an array is
+                resolved next to it.
+            mmap_mode (Optional[str]): The numpy memmap mode ("r", "c" or "r+"), or None to read the arrays into memory.
+        """
+        self.path = Path(path)
+        self.mmap_mode = mmap_mode
+
+    def read(self, reference: Dict[str, Any], shape: Sequence[int], dtype: np.dtype) -> Optional[np.ndarray]:
+        """
+        Read an array from the sidecar file.
+
+        Args:
+            reference (Dict[str, Any]): The reference returned by the writer.
+            shape (Sequence[int]): The shape of the array.
+            dtype (np.dtype): The data type of the array.
+
+        Returns:
+            Optional[np.ndarray]: The array or None if the sidecar file does not exist.
+        """
+        offset = int(reference[OFFSET_ATTRIBUTE])
+        size = int(reference[SIZE_ATTRIBUTE])
+        shape = tuple(shape)
+
+        if size == 0:
+            return np.empty(shape, dtype)
+
+        path = self.path.with_name(str(reference[FILE_ATTRIBUTE]))
+
+        try:
+            if self.mmap_mode is not None:
+                return np.memmap(path, dtype=dtype, mode=self.mmap_mode, offset=offset, shape=shape)
+
+            count = size // dtype.itemsize
+            return np.fromfile(path, dtype=dtype, count=count, offset=offset).reshape(shape)
+        except FileNotFoundError:
+            logging.warning(f"Could not read array from missing sidecar file '{path}'")
+            return None
+
+    @contextmanager
+    def activate(self):
+        """
+        Use this reader for all numpy arrays deserialized in the current context.
+        """
+        token = _active_reader.set(self)
+        try:
+            yield self
+        finally:
+            _active_reader.reset(token)
+
+    @staticmethod
+    def get_active() -> Optional["ArraySidecarReader"]:
+        """
+        Get the reader of the current context.
+
+        Returns:
+            Optional[ArraySidecarReader]: The active reader or None.
+        """
+        return _active_reader.get()
@@ -0,0 +1,208 @@
+import logging
+import threading
+import time
+from typing import Generic, TypeVar, Optional
+
+from duit.event.Event import Event
+from duit.settings.Settings import Settings
+from duit.settings.SettingsChangeTracker import SettingsChangeTracker, SettingsPath
+from duit.settings.SettingsJournal import SettingsJournal
+from duit.utils.file_utils import FsyncPolicy
+
+T = TypeVar("T")
+
+
+class AutoSaver(Generic[T]):
+    """
+    Saves the settings of an object automatically on a background thread after its setting fields have changed.
+
+    Changes are debounced: the settings are saved `delay` seconds after the last change, but at the latest
+    `max_delay` seconds after the first unsaved change. The settings file is written atomically (temporary file and
+    rename), so a power loss never leaves a partially written settings file behind.
+
+    The object is serialized on the background thread. The `on_saved` and `on_error` events are invoked on the
+    background thread as well.
+    """
+
+    def __init__(self, settings: Settings, obj: T, file_path: str,
+                 delay: float = 0.5, max_delay: Optional[float] = 5.0,
+                 fsync_policy: FsyncPolicy = FsyncPolicy.FILE,
+                 journal_entries: Optional[int] = None):
+        """
+        Initialize an AutoSaver. Call `start()` to start saving changes.
+
+        Args:
+            settings (Settings): The settings used to serialize the object.
+            obj (T): The object to save.
+            file_path (str): The path to the settings file.
+            delay (float): The time in seconds without changes after which the settings are saved (default is 0.5).
+            max_delay (Optional[float]): The maximum time in seconds a change stays unsaved while changes keep
+                coming in, or None to wait until the changes stop (default is 5.0).
+            fsync_policy (FsyncPolicy): Defines how the written files are synced to the storage device.
+            journal_entries (Optional[int]): If set, only changed fields are appended to a SettingsJournal, which is
+                compacted after this number of entries. Otherwise, the whole settings file is written on each save.
+        """
+        self.settings = settings
+        self.obj = obj
+        self.file_path = file_path
+        self.delay = delay
+        self.max_delay = max_delay
+        self.fsync_policy = fsync_policy
+
+        self.on_saved: Event[str] = Event[str]()
+        self.on_error: Event[Exception] = Event[Exception]()
+
+        self._journal: Optional[SettingsJournal[T]] = None
+        self._tracker: SettingsChangeTracker
+
+        if journal_entries is not None:
+            self._journal = SettingsJournal(settings, obj, file_path, journal_entries, fsync_policy)
+            self._tracker = self._journal.tracker
+        else:
+            self._tracker = SettingsChangeTracker(settings, obj)
+
+        self._tracker.on_changed.append(self._on_field_changed)
+
+        self._condition = threading.Condition()
+        self._save_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pending = False
+        self._stopped = False
+        self._first_change_time = 0.0
+        self._deadline = 0.0
+
+    @property
+    def journal(self) -> Optional[SettingsJournal[T]]:
+        """
+        Get the journal used to save the changes incrementally.
+
+        Returns:
+            Optional[SettingsJournal[T]]: The journal or None if the whole settings file is written on each save.
+        """
+        return self._journal
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check if the background thread is running.
+
+        Returns:
+            bool: True if the AutoSaver has been started and not stopped yet.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def has_pending_changes(self) -> bool:
+        """
+        Check if there are changes which have not been saved yet.
+
+        Returns:
+            bool: True if a save is scheduled.
+        """
+        return self._pending
+
+    def start(self) -> None:
+        """
+        Start the background thread which saves the settings.
+        """
+        if self.is_running:
+            return
+
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="duit-autosaver", daemon=True)
+        self._thread.start()
+
+    def stop(self, flush: bool = True) -> None:
+        """
+        Stop the background thread.
+
+        Args:
+            flush (bool): Whether to save pending changes before stopping (default is True).
+        """
+        with self._condition:
+            self._stopped = True
+            if not flush:
+                self._pending = False
+            self._condition.notify()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        elif flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Save pending changes immediately on the calling thread.
+        """
+        with self._condition:
+            if not self._pending:
+                return
+            self._pending = False
+
+        self._save()
+
+    def dispose(self) -> None:
+        """
+        Stop the background thread (saving pending changes) and stop tracking the object.
+        """
+        self.stop(flush=True)
+        self._tracker.dispose()
+
+    def __enter__(self) -> "AutoSaver[T]":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.dispose()
+
+    def _on_field_changed(self, path: SettingsPath) -> None:
+        with self._condition:
+            now = time.monotonic()
+
+            if not self._pending:
+                self._pending = True
+                self._first_change_time = now
+
+            self._deadline = now + self.delay
+            if self.max_delay is not None:
+                self._deadline = min(self._deadline, self._first_change_time + self.max_delay)
+
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    if self._pending:
+                        timeout = self._deadline - time.monotonic()
+                        if timeout <= 0:
+                            break
+                    else:
+                        timeout = None
+
+                    self._condition.wait(timeout)
+
+                has_pending = self._pending
+                stopped = self._stopped
+                self._pending = False
+
+            if has_pending:
+                self._save()
+
+            if stopped:
+                return
+
+    def _save(self) -> None:
+        with self._save_lock:
+            try:
+                if self._journal is not None:
+                    self._journal.save()
+                else:
+                    self.settings.save(self.file_path, self.obj, atomic=True, fsync_policy=self.fsync_policy)
+            except Exception as ex:
+                logging.warning(f"Could not save settings to '{self.file_path}': {ex}")
+                self.on_error(ex)
+                return
+
+        self.on_saved(self.file_path)
@@ -0,0 +1,99 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, List, Tuple, Callable, Any, Union
+
+_active_batch: ContextVar[Optional["ParallelValueBatch"]] = ContextVar("active_parallel_value_batch", default=None)
+
+ValueResult = Tuple[bool, Any]
+ValueCallback = Callable[[ValueResult], None]
+
+
+class ParallelValueBatch:
+    """
+    Converts expensive values (e.g. encoding numpy arrays) concurrently on a thread pool, while the results are
+    applied on the calling thread in the order they have been added.
+
+    Results of conversions which have been done on the calling thread (see `defer()`) are applied immediately if
+    no submitted conversion is pending, otherwise they wait for their turn. This keeps the order of the results
+    deterministic and identical to a sequential conversion.
+    """
+
+    def __init__(self, max_workers: int):
+        """
+        Initialize a ParallelValueBatch.
+
+        Args:
+            max_workers (int): The maximum number of worker threads.
+        """
+        self.max_workers = max_workers
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Tuple[ValueCallback, Union[Future, ValueResult]]] = []
+
+    def submit(self, callback: ValueCallback, fn: Callable[..., ValueResult], *args: Any) -> None:
+        """
+        Run a conversion on the thread pool. The conversion runs in a copy of the current context.
+
+        Args:
+            callback (ValueCallback): Applies the result of the conversion.
+            fn (Callable[..., ValueResult]): The conversion which returns a success flag and the converted value.
+            *args (Any): The arguments of the conversion.
+        """
+        if self._executor is None:
+            raise Exception("ParallelValueBatch has to be activated before values can be submitted.")
+
+        context = contextvars.copy_context()
+        self._pending.append((callback, self._executor.submit(context.run, fn, *args)))
+
+    def defer(self, callback: ValueCallback, result: ValueResult) -> None:
+        """
+        Apply the result of a conversion done on the calling thread after all previously submitted results.
+
+        Args:
+            callback (ValueCallback): Applies the result.
+            result (ValueResult): The success flag and the converted value.
+        """
+        if len(self._pending) == 0:
+            callback(result)
+            return
+
+        self._pending.append((callback, result))
+
+    def complete(self) -> None:
+        """
+        Wait for all submitted conversions and apply the pending results in order.
+        """
+        pending, self._pending = self._pending, []
+
+        for callback, result in pending:
+            if isinstance(result, Future):
+                result = result.result()
+            callback(result)
+
+    @contextmanager
+    def activate(self):
+        """
+        Start the thread pool and use this batch for all values converted in the current context. Results which
+        have not been completed are discarded when the context is left.
+        """
+        token = _active_batch.set(self)
+        self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="duit-settings")
+        try:
+            yield self
+        finally:
+            _active_batch.reset(token)
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            self._pending.clear()
+
+    @staticmethod
+    def get_active() -> Optional["ParallelValueBatch"]:
+        """
+        Get the batch of the current context.
+
+        Returns:
+            Optional[ParallelValueBatch]: The active batch or None.
+        """
+        return _active_batch.get()
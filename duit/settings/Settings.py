@@ -1,26 +1,53 @@
+import contextvars
+import copy
 import json
 import logging
 import typing
+from collections import deque
 from collections.abc import Hashable
 from functools import partial
-from typing import Generic, TypeVar, Optional, Any, Dict, Set, Tuple, List
+from typing import Generic, TypeVar, Optional, Any, Dict, Set, Tuple, List, TextIO, Iterator, Iterable, Union, \
+    Sequence, Deque
 
 import numpy as np
 import vector
 
 from duit.annotation.AnnotationFinder import AnnotationFinder
 from duit.model.DataField import DataField
+from duit.model.LazyValuePlugin import LazyValuePlugin
+from duit.settings.ArraySidecar import ArraySidecarWriter, ArraySidecarReader
+from duit.settings.ParallelValueBatch import ParallelValueBatch
+from duit.settings.SettingsCache import SettingsCache, SettingsCacheEntry
+from duit.settings import SETTING_ANNOTATION_ATTRIBUTE_NAME
 from duit.settings.Setting import Setting
+from duit.settings.SettingsContainer import ContainerCompression, write_settings_container, \
+    read_settings_container, is_settings_container
+from duit.settings.SettingsLoadPlan import SettingsLoadPlan, LoadPlanEntry, ResolvedValueType, AnnotationSignature
+from duit.settings.backend.JsonBackend import JsonBackend
+from duit.settings.backend.JsonStreamReader import JsonStreamReader
+from duit.settings.backend.StdJsonBackend import StdJsonBackend
 from duit.settings.serialiser.BaseSerializer import BaseSerializer
 from duit.settings.serialiser.DefaultSerializer import DefaultSerializer
 from duit.settings.serialiser.EnumSerializer import EnumSerializer
 from duit.settings.serialiser.NumpySerializer import NumpySerializer
 from duit.settings.serialiser.PathSerializer import PathSerializer
+from duit.settings.serialiser.SetSerializer import SetSerializer
 from duit.settings.serialiser.VectorSerializer import VectorSerializer
+from duit.utils.file_utils import FsyncPolicy, write_file_atomic
 from duit.utils.name_reference import create_name_reference
+from duit.utils.type_dispatch import TypeDispatchCache
 
 T = TypeVar('T')
 
+# a top-level setting name or the path of a setting, e.g. ("camera", "exposure")
+SettingsSelector = Union[str, Sequence[str]]
+
+# entries with the path of a setting and its serialized value, e.g. {"path": ["camera", "exposure"], "value": 5}
+SettingsPatch = List[Dict[str, Any]]
+
+PATH_ATTRIBUTE = "path"
+VALUE_ATTRIBUTE = "value"
+
 
 class Settings(Generic[T]):
     """
@@ -30,23 +57,68 @@ class Settings(Generic[T]):
         None
     """
 
-    def __init__(self):
+    _STREAM_INDENT = "    "
+
+    def __init__(self, array_sidecar: bool = False, array_sidecar_min_bytes: int = 4096,
+                 array_mmap_mode: Optional[str] = "r", lazy_loading: bool = False,
+                 json_backend: Optional[JsonBackend] = None, compact_json: bool = False,
+                 container_compression: Optional[ContainerCompression] = None,
+                 container_min_compress_bytes: int = 1024, parallel_workers: int = 0,
+                 compact_vectors: bool = False, cache: Optional[SettingsCache] = None):
         """
         Initialize a Settings instance.
 
         Args:
-            None
+            array_sidecar (bool): Store large numpy arrays in a binary sidecar file next to the settings file
+                instead of base64 encoded in the JSON (only applies to `save()`, default is False).
+            array_sidecar_min_bytes (int): Arrays with fewer bytes are always stored in the JSON (default is 4096).
+            array_mmap_mode (Optional[str]): The numpy memmap mode used to load arrays from a sidecar file, or None to
+                read them into memory (default is "r").
+            lazy_loading (bool): Defer deserializing values of the `lazy_types` until they are read for the first
+                time (default is False).
+            json_backend (Optional[JsonBackend]): The backend to encode and decode JSON (default is the standard library
+                json module, see `duit.settings.backend.create_fastest_json_backend()`).
+            compact_json (bool): Write JSON without indentation and whitespace (default is False).
+            container_compression (Optional[ContainerCompression]): If set, `save()` writes a container (zip archive)
+                with one compressed entry per top-level setting instead of a JSON file (default is None).
+            container_min_compress_bytes (int): Container entries with fewer bytes are stored uncompressed
+                (default is 1024).
+            parallel_workers (int): The number of threads used to serialize and deserialize values of the
+                `parallel_types` concurrently, or 0 to convert all values on the calling thread (default is 0).
+            compact_vectors (bool): Store vectors as a list of their components instead of a dictionary
+                (default is False).
+            cache (Optional[SettingsCache]): A cache of parsed and decoded settings files used by `load()`. Values of
+                the `cached_types` loaded from the cache are shared and read-only (default is None).
         """
         self.serializers: List[BaseSerializer] = [
             EnumSerializer(),
-            VectorSerializer(),
+            VectorSerializer(compact=compact_vectors),
             PathSerializer(),
+            SetSerializer(),
             NumpySerializer()
         ]
         self.default_serializer: BaseSerializer = DefaultSerializer()
+        self._serializer_cache: TypeDispatchCache[BaseSerializer] = TypeDispatchCache()
+        self._load_plans: Dict[Tuple[type, Tuple[str, ...], AnnotationSignature], SettingsLoadPlan] = {}
+        self._load_plan_serializers: Tuple[Any, ...] = ()
+
+        self.array_sidecar = array_sidecar
+        self.array_sidecar_min_bytes = array_sidecar_min_bytes
+        self.array_mmap_mode = array_mmap_mode
 
         self.non_unpackable_types = [vector.Vector, np.ndarray]
 
+        self.lazy_loading = lazy_loading
+        self.json_backend: JsonBackend = StdJsonBackend() if json_backend is None else json_backend
+        self.compact_json = compact_json
+        self.container_compression = container_compression
+        self.container_min_compress_bytes = container_min_compress_bytes
+        self.lazy_types = [np.ndarray]
+        self.parallel_workers = parallel_workers
+        self.parallel_types = [np.ndarray]
+        self.cache = cache
+        self.cached_types = [np.ndarray]
+
         self._is_serializing: bool = False
         self._is_deserializing: bool = False
 
@@ -62,19 +134,93 @@ class Settings(Generic[T]):
         self._annotation_finder = AnnotationFinder(Setting, _is_field_valid, recursive=False)
         self._ann_ref = create_name_reference(Setting())
 
-    def load(self, file_path: str, obj: T) -> T:
+    def load(self, file_path: str, obj: T, partial: Optional[Iterable[SettingsSelector]] = None) -> T:
         """
         Load settings from a file and apply them to an object.
 
+        Both JSON files and containers written with `container_compression` are supported. Arrays which have been
+        stored in a sidecar file are loaded from it (memory-mapped by default).
+
         Args:
             file_path (str): The path to the settings file.
             obj (T): The object to which the settings will be applied.
+            partial (Optional[Iterable[SettingsSelector]]): The setting names or paths (e.g. `("camera", "exposure")`)
+                to load, or None to load all settings. Of a container, only the entries of the requested top-level
+                settings are decompressed and decoded.
 
         Returns:
             T: The object with applied settings.
         """
-        with open(file_path, "r") as file:
-            return self.load_json(file.read(), obj)
+        reader = ArraySidecarReader(self.get_array_sidecar_path(file_path), self.array_mmap_mode)
+
+        if self.cache is None:
+            with reader.activate():
+                self._deserialize(obj, self.read_file(file_path, partial))
+            return obj
+
+        entry = self.cache.get(file_path, lambda: self.read_file(file_path))
+        data = entry.data if partial is None else self._select_paths(entry.data, self._get_paths(partial))
+
+        with reader.activate(), entry.activate():
+            self._deserialize(obj, data)
+        return obj
+
+    def read_file(self, file_path: str, partial: Optional[Iterable[SettingsSelector]] = None) -> Dict[str, Any]:
+        """
+        Read the serialized settings of a JSON file or container without applying them.
+
+        Args:
+            file_path (str): The path to the settings file.
+            partial (Optional[Iterable[SettingsSelector]]): The setting names or paths to read, or None to
+                read all settings.
+
+        Returns:
+            Dict[str, Any]: The serialized settings.
+        """
+        paths = None if partial is None else self._get_paths(partial)
+
+        if is_settings_container(file_path):
+            names = None if paths is None else {path[0] for path in paths if len(path) > 0}
+            entries = read_settings_container(file_path, names)
+            data = {name: self.json_backend.loads(content) for name, content in entries.items()}
+        else:
+            with open(file_path, "r") as file:
+                data = self.json_backend.loads(file.read())
+
+        if paths is not None:
+            data = self._select_paths(data, paths)
+        return data
+
+    @staticmethod
+    def _get_paths(selectors: Iterable[SettingsSelector]) -> List[Tuple[str, ...]]:
+        return [(selector,) if isinstance(selector, str) else tuple(selector) for selector in selectors]
+
+    @staticmethod
+    def _select_paths(data: Dict[str, Any], paths: List[Tuple[str, ...]]) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+
+        for path in paths:
+            source, target = data, result
+
+            for index, key in enumerate(path):
+                if not isinstance(source, dict) or key not in source:
+                    break
+
+                value = source[key]
+                if index == len(path) - 1:
+                    target[key] = value
+                    break
+
+                # the parent has already been selected as a whole
+                sub_target = target.get(key)
+                if sub_target is value:
+                    break
+
+                if sub_target is None:
+                    sub_target = target[key] = {}
+                source, target = value, sub_target
+
+        return result
 
     def load_json(self, content: str, obj: T) -> T:
         """
@@ -87,10 +233,62 @@ class Settings(Generic[T]):
         Returns:
             T: The object with applied settings.
         """
-        data = json.loads(content)
+        data = self.json_backend.loads(content)
         self._deserialize(obj, data)
         return obj
 
+    def load_stream(self, stream: TextIO, obj: T, chunk_size: int = 1 << 16) -> T:
+        """
+        Load settings from a JSON text stream and apply each value as soon as it has been read.
+
+        In contrast to `load_json()`, the document is never held in memory as a whole, only the value which is
+        currently decoded. Because the values are applied in the order of the stream, the `load_order` of the
+        settings is not respected. The values are always decoded by the standard library json module.
+
+        Args:
+            stream (TextIO): The stream containing the settings.
+            obj (T): The object to which the settings will be applied.
+            chunk_size (int): The number of characters which are read from the stream at once (default is 65536).
+
+        Returns:
+            T: The object with applied settings.
+        """
+        reader = JsonStreamReader(stream, chunk_size)
+        obj_history: Set[Any] = set()
+
+        field_list = self._get_serialization_fields(obj, obj_history) or []
+
+        # nested objects are applied depth-first, each frame holds the fields of an object and its remaining keys
+        stack: List[Tuple[Dict[str, DataField], Iterator[str]]] = [
+            (dict(self._get_named_fields(field_list)), reader.iter_object())
+        ]
+
+        while stack:
+            fields, keys = stack[-1]
+
+            for key in keys:
+                field = fields.get(key)
+
+                # values of unknown keys are read and dropped
+                if field is None:
+                    reader.read_value()
+                    continue
+
+                if reader.peek() == "{":
+                    sub_field_list = self._get_serialization_fields(field.value, obj_history)
+                    if sub_field_list:
+                        stack.append((dict(self._get_named_fields(sub_field_list)), reader.iter_object()))
+                        break
+
+                self._deserialize_field(field, key, reader.read_value(), obj_history)
+            else:
+                stack.pop()
+
+        if reader.peek() != "":
+            raise json.JSONDecodeError("Extra data", reader.peek(), 0)
+
+        return obj
+
     def deserialize(self, data: Dict[str, Any], obj: T) -> T:
         """
         Deserialize a dictionary of settings and apply them to an object.
@@ -103,25 +301,87 @@ class Settings(Generic[T]):
             T: The object with applied settings.
         """
         self._is_deserializing = True
-        result = self._deserialize(obj, data)
-        self._is_deserializing = False
-        return result
+        try:
+            self._deserialize(obj, data)
+        finally:
+            self._is_deserializing = False
+        return obj
 
-    def save(self, file_path: str, obj: T):
+    def save(self, file_path: str, obj: T, atomic: bool = False, fsync_policy: FsyncPolicy = FsyncPolicy.FILE):
         """
         Save settings from an object to a file.
 
+        If `array_sidecar` is enabled, large numpy arrays are written into a binary sidecar file
+        (see `get_array_sidecar_path()`). If `container_compression` is set, the settings are written into a
+        container with one compressed entry per top-level setting.
+
         Args:
             file_path (str): The path to the settings file.
             obj (T): The object from which settings will be saved.
+            atomic (bool): Write into a temporary file which replaces the settings file, so that the file is never
+                partially written (default is False).
+            fsync_policy (FsyncPolicy): Defines how atomically written files are synced to the storage device.
 
         Returns:
             None
         """
-        data = self.save_json(obj)
-        with open(file_path, "w") as file:
+        # the cached version of the file is outdated after saving
+        if self.cache is not None:
+            self.cache.invalidate(file_path)
+
+        if not self.array_sidecar:
+            data = self._encode_file(obj)
+            self._write_file(file_path, data, atomic, fsync_policy)
+            return
+
+        # the sidecar is completely written before the settings file references it
+        writer = ArraySidecarWriter(self.get_array_sidecar_path(file_path), self.array_sidecar_min_bytes)
+        try:
+            with writer.activate():
+                data = self._serialize(obj)
+
+            # the commit sets the file name of the array references
+            writer.commit(fsync=atomic and fsync_policy != FsyncPolicy.NONE)
+            self._write_file(file_path, self._encode_data(data), atomic, fsync_policy)
+        except BaseException:
+            writer.abort()
+            raise
+
+        writer.remove_stale()
+
+    def _encode_file(self, obj: T) -> Union[str, bytes]:
+        return self._encode_data(self._serialize(obj))
+
+    def _encode_data(self, data: Dict[str, Any]) -> Union[str, bytes]:
+        if self.container_compression is None:
+            return self.json_backend.dumps(data, compact=self.compact_json)
+
+        entries = {name: self.json_backend.dumps(value, compact=self.compact_json) for name, value in data.items()}
+        return write_settings_container(entries, self.container_compression, self.container_min_compress_bytes)
+
+    @staticmethod
+    def _write_file(file_path: str, data: Union[str, bytes], atomic: bool, fsync_policy: FsyncPolicy) -> None:
+        if atomic:
+            write_file_atomic(file_path, data, fsync_policy)
+            return
+
+        with open(file_path, "wb" if isinstance(data, bytes) else "w") as file:
             file.write(data)
 
+    @staticmethod
+    def get_array_sidecar_path(file_path: str) -> str:
+        """
+        Get the path of the binary sidecar file which stores the numpy arrays of a settings file. The versions of
+        the sidecar file are named by the hash of their content (`<path>.<hash>`).
+
+        Args:
+            file_path (str): The path to the settings file.
+
+        Returns:
+            str: The path to the sidecar file.
+        """
+        return f"{file_path}.arrays"
+
     def save_json(self, obj: T) -> str:
         """
         Save settings from an object to a JSON string.
@@ -133,7 +393,80 @@ class Settings(Generic[T]):
             str: The JSON string containing the settings.
         """
         data = self._serialize(obj)
-        return json.dumps(data, indent=4, sort_keys=True)
+        return self.json_backend.dumps(data, compact=self.compact_json)
+
+    def save_stream(self, stream: TextIO, obj: T) -> None:
+        """
+        Save settings from an object to a JSON text stream, writing each field as soon as it has been serialized.
+
+        In contrast to `save_json()`, the settings are never held in memory as a whole, only the value which is
+        currently encoded. The fields are written in their `save_order`, arrays are always stored in the JSON.
+
+        Args:
+            stream (TextIO): The stream to write the settings to.
+            obj (T): The object from which settings will be saved.
+
+        Returns:
+            None
+        """
+        obj_history: Set[Any] = set()
+        field_list = self._get_serialization_fields(obj, obj_history) or []
+
+        # each frame holds the remaining fields of an object and whether no field has been written yet
+        stack: List[list] = [[iter(field_list), True]]
+        stream.write("{")
+
+        while stack:
+            frame = stack[-1]
+            depth = len(stack)
+
+            for name, values in frame[0]:
+                field, setting = values
+
+                if setting.name is not None:
+                    name = setting.name
+
+                # datamodel values are written as nested objects
+                sub_field_list = self._get_serialization_fields(field.value, obj_history)
+                if sub_field_list:
+                    self._write_stream_key(stream, frame, name, depth)
+                    stream.write("{")
+                    stack.append([iter(sub_field_list), True])
+                    break
+
+                serializer = self._get_matching_serializer(field)
+                success, value = serializer.serialize(field.value)
+
+                if not success:
+                    logging.warning(f"Could not serialize '{name}': {field.value}")
+                    continue
+
+                if not self.json_backend.is_jsonable(value):
+                    logging.warning(f"Could not convert '{name}' to json: {field.value}")
+                    continue
+
+                content = self.json_backend.dumps(value, compact=self.compact_json)
+                if not self.compact_json:
+                    content = content.replace("\n", "\n" + self._STREAM_INDENT * depth)
+
+                self._write_stream_key(stream, frame, name, depth)
+                stream.write(content)
+            else:
+                stack.pop()
+
+                if not frame[1] and not self.compact_json:
+                    stream.write("\n" + self._STREAM_INDENT * (depth - 1))
+                stream.write("}")
+
+    def _write_stream_key(self, stream: TextIO, frame: list, name: str, depth: int) -> None:
+        if not frame[1]:
+            stream.write(",")
+        frame[1] = False
+
+        if self.compact_json:
+            stream.write(f"{json.dumps(name)}:")
+        else:
+            stream.write(f"\n{self._STREAM_INDENT * depth}{json.dumps(name)}: ")
 
     def serialize(self, obj: T) -> Dict[str, Any]:
         """
@@ -150,116 +483,505 @@ class Settings(Generic[T]):
         self._is_serializing = False
         return result
 
+    def get_fields(self, obj: Any) -> List[Tuple[str, DataField]]:
+        """
+        Get the exposed setting fields of an object (not recursive) by their setting name in save order.
+
+        Args:
+            obj (Any): The object containing the fields.
+
+        Returns:
+            List[Tuple[str, DataField]]: The setting names and fields.
+        """
+        return self._get_named_fields(self._get_serialization_fields(obj, set()))
+
+    @staticmethod
+    def _get_named_fields(field_list: List[Tuple[str, Tuple[DataField, Setting]]]) -> List[Tuple[str, DataField]]:
+        return [(name if setting.name is None else setting.name, field) for name, (field, setting) in field_list]
+
+    def serialize_field(self, field: DataField) -> Tuple[bool, Any]:
+        """
+        Serialize the value of a single field the same way it is stored by `serialize()`.
+
+        Args:
+            field (DataField): The field to serialize.
+
+        Returns:
+            Tuple[bool, Any]: A success flag and the serialized value.
+        """
+        serializer = self._get_matching_serializer(field)
+        success, value = serializer.serialize(field.value)
+
+        sub_data = self._serialize(field.value)
+        if len(sub_data) != 0:
+            success, value = True, sub_data
+
+        if not success or not self.json_backend.is_jsonable(value):
+            return False, None
+
+        return True, value
+
+    def diff(self, obj: T, baseline: Union[T, Dict[str, Any]],
+             current: Optional[Dict[str, Any]] = None) -> SettingsPatch:
+        """
+        Create a minimal patch containing only the settings of an object which differ from a baseline.
+
+        Nested datamodels are compared field by field, all other values are compared by their serialized value.
+        The patch can be applied to another instance with `apply_patch()`.
+
+        Args:
+            obj (T): The object with the current settings.
+            baseline (Union[T, Dict[str, Any]]): An object with the previous settings or its serialized settings
+                (see `serialize()`).
+            current (Optional[Dict[str, Any]]): Serialized settings which are compared instead of the settings of
+                the object, which then only defines the structure (default is None).
+
+        Returns:
+            SettingsPatch: The patch entries with the path and the serialized value of each changed setting.
+        """
+        if current is None:
+            current = self._serialize(obj)
+
+        if not isinstance(baseline, dict):
+            baseline = self._serialize(baseline)
+
+        patch: SettingsPatch = []
+        obj_history: Set[Any] = set()
+
+        field_list = self._get_serialization_fields(obj, obj_history) or []
+        # the objects are compared breadth-first to keep the patch entries of an object together
+        queue: Deque[Tuple[List[Tuple[str, DataField]], Dict[str, Any], Any, Tuple[str, ...]]] = deque(
+            [(self._get_named_fields(field_list), current, baseline, ())]
+        )
+
+        while queue:
+            fields, current_data, baseline_data, parent_path = queue.popleft()
+
+            if not isinstance(baseline_data, dict):
+                baseline_data = {}
+
+            for name, field in fields:
+                if name not in current_data:
+                    continue
+
+                value = current_data[name]
+                path = parent_path + (name,)
+
+                # nested datamodels are compared by their fields
+                sub_field_list = self._get_serialization_fields(self._get_loaded_value(field), obj_history)
+                if sub_field_list and isinstance(value, dict) and isinstance(baseline_data.get(name), dict):
+                    queue.append((self._get_named_fields(sub_field_list), value, baseline_data[name], path))
+                    continue
+
+                if name not in baseline_data or baseline_data[name] != value:
+                    patch.append({PATH_ATTRIBUTE: list(path), VALUE_ATTRIBUTE: value})
+
+        return patch
+
+    def apply_patch(self, obj: T, patch: SettingsPatch) -> T:
+        """
+        Apply a patch created by `diff()` to an object. Only the settings contained in the patch are changed and all
+        of them are deserialized in a single pass (respecting the `load_order`). The 'on_changed' events of the
+        changed fields are only triggered after all settings have been applied.
+
+        Args:
+            obj (T): The object to which the patch will be applied.
+            patch (SettingsPatch): The patch entries.
+
+        Returns:
+            T: The object with applied patch.
+        """
+        data: Dict[str, Any] = {}
+
+        for entry in patch:
+            if VALUE_ATTRIBUTE not in entry:
+                continue
+
+            path = entry[PATH_ATTRIBUTE]
+            if len(path) == 0:
+                continue
+
+            target = data
+            for name in path[:-1]:
+                child = target.get(name)
+                if not isinstance(child, dict):
+                    child = {}
+                    target[name] = child
+                target = child
+
+            target[path[-1]] = entry[VALUE_ATTRIBUTE]
+
+        # the events are deferred, so that listeners never see a partially applied patch
+        states = [(field, field.publish_enabled, field._value) for field in self._get_patch_fields(obj, patch)]
+        for field, _, _ in states:
+            field.publish_enabled = False
+
+        try:
+            self._deserialize(obj, data)
+        finally:
+            for field, publish_enabled, _ in states:
+                field.publish_enabled = publish_enabled
+
+        for field, publish_enabled, old_value in states:
+            # lazy values trigger the event when they are loaded
+            if not publish_enabled or LazyValuePlugin.get_pending(field) is not None:
+                continue
+
+            if not field._is_equal(field._value, old_value):
+                field.fire()
+
+        return obj
+
+    def _get_patch_fields(self, obj: Any, patch: SettingsPatch) -> List[DataField]:
+        fields: Dict[int, DataField] = {}
+
+        for entry in patch:
+            value = obj
+            for name in entry[PATH_ATTRIBUTE]:
+                field_list = self._get_serialization_fields(value, set()) or []
+                field = dict(self._get_named_fields(field_list)).get(name)
+                if field is None:
+                    break
+
+                fields[id(field)] = field
+                value = self._get_loaded_value(field)
+
+        return list(fields.values())
+
     def _serialize(self, obj: Any,
                    data: Optional[Dict[str, Any]] = None,
                    obj_history: Optional[Set[Any]] = None) -> Dict[str, Any]:
         if obj_history is None:
             obj_history = set()
 
-        if isinstance(obj, Hashable) and obj in obj_history:
-            return {}
+            # arrays written into a sidecar file are serialized in order to keep the file deterministic
+            if self._use_parallel_batch() and ArraySidecarWriter.get_active() is None:
+                with ParallelValueBatch(self.parallel_workers).activate() as batch:
+                    data = self._serialize(obj, data, obj_history)
+                    batch.complete()
+                return data
 
         if data is None:
             data = {}
 
+        field_list = self._get_serialization_fields(obj, obj_history)
+        if field_list is None:
+            return {}
+
+        # the object tree is serialized depth-first with an explicit stack to support deeply nested objects
+        # each frame holds the data of an object, its remaining fields and the field waiting for its nested data
+        stack: List[list] = [[data, iter(field_list), None]]
+        batch = ParallelValueBatch.get_active()
+        parallel_types = tuple(self.parallel_types)
+
+        while stack:
+            frame = stack[-1]
+            frame_data, field_iterator, pending = frame
+
+            if pending is not None:
+                frame[2] = None
+                name, field, result = pending
+
+                # the values of the nested data have already been validated
+                if len(result) != 0:
+                    frame_data[name] = result
+                else:
+                    self._validate_json_value(frame_data, name, field)
+
+            # fill datamodel fields into data
+            for name, values in field_iterator:
+                field, setting = values
+
+                if setting.name is not None:
+                    name = setting.name
+
+                # check which serializer to use
+                serializer = self._get_matching_serializer(field)
+
+                # expensive values are serialized concurrently, the placeholder keeps the order of the keys
+                if batch is not None and isinstance(field.value, parallel_types):
+                    frame_data[name] = None
+                    callback = partial(self._apply_serialized_value, frame_data, name, field)
+                    batch.submit(callback, serializer.serialize, field.value)
+                    continue
+
+                success, value = serializer.serialize(field.value)
+
+                if success:
+                    frame_data[name] = value
+                else:
+                    logging.warning(f"Could not serialize '{name}': {field.value}")
+
+                # continue with each datamodel value to catch subfields
+                sub_field_list = self._get_serialization_fields(field.value, obj_history)
+                if sub_field_list:
+                    result = {}
+                    frame[2] = (name, field, result)
+                    stack.append([result, iter(sub_field_list), None])
+                    break
+
+                self._validate_json_value(frame_data, name, field)
+            else:
+                stack.pop()
+
+        return data
+
+    def _get_serialization_fields(self, obj: Any,
+                                  obj_history: Set[Any]) -> Optional[List[Tuple[str, Tuple[DataField, Setting]]]]:
+        if isinstance(obj, Hashable) and obj in obj_history:
+            return None
+
         if isinstance(obj, Hashable):
             obj_history.add(obj)
 
         # extract data-model fields
         fields = self._annotation_finder.find(obj)
         field_list = sorted(fields.items(), key=partial(self._annotation_sorting, self._ann_ref.save_order))
-        field_list = typing.cast(List[Tuple[str, Tuple[DataField, Setting]]], field_list)
+        return typing.cast(List[Tuple[str, Tuple[DataField, Setting]]], field_list)
 
-        # fill datamodel fields into data
-        for name, values in field_list:
-            field, setting = values
+    def _apply_serialized_value(self, data: Dict[str, Any], name: str, field: DataField,
+                                result: Tuple[bool, Any]) -> None:
+        success, value = result
 
-            if setting.name is not None:
-                name = setting.name
+        if not success:
+            logging.warning(f"Could not serialize '{name}': {field.value}")
+            data.pop(name)
+            return
 
-            # check which serializer to use
-            serializer = self._get_matching_serializer(field)
-            success, value = serializer.serialize(field.value)
+        data[name] = value
+        self._validate_json_value(data, name, field)
 
-            if success:
-                data[name] = value
-            else:
-                logging.warning(f"Could not serialize '{name}': {field.value}")
+    def _use_parallel_batch(self) -> bool:
+        return self.parallel_workers > 0 and ParallelValueBatch.get_active() is None
 
-            # call again for each datamodel value to catch subfields
-            result = self._serialize(field.value, {}, obj_history)
-            if len(result) != 0:
-                data[name] = result
+    def _validate_json_value(self, data: Dict[str, Any], name: str, field: DataField) -> None:
+        if name not in data:
+            return
 
-            if not self._is_jsonable(data[name]):
-                logging.warning(f"Could not convert '{name}' to json: {field.value}")
-                data.pop(name)
-                continue
-
-        return data
+        if not self.json_backend.is_jsonable(data[name]):
+            logging.warning(f"Could not convert '{name}' to json: {field.value}")
+            data.pop(name)
 
     def _deserialize(self, obj: Any, data: Dict[str, Any],
                      obj_history: Optional[Set[Any]] = None) -> Tuple[bool, Any]:
         if obj_history is None:
             obj_history = set()
+            self._validate_load_plans()
+
+            if self._use_parallel_batch():
+                with ParallelValueBatch(self.parallel_workers).activate() as batch:
+                    result = self._deserialize(obj, data, obj_history)
+                    batch.complete()
+                return result
 
         if isinstance(obj, Hashable) and obj in obj_history:
             return True, obj
 
-        if not isinstance(data, Dict):
+        fields = self._get_deserialization_fields(obj, data, obj_history)
+        if fields is None:
             return False, None
 
+        # the object tree is loaded depth-first with an explicit stack to support deeply nested objects
+        # each frame holds an object, its data and fields, its remaining load plan entries,
+        # whether it has loadable fields and the field waiting for its nested object
+        stack: List[list] = [[obj, data, fields, iter(self._get_load_plan(obj, fields).entries), False, None]]
+        result: Tuple[bool, Any] = (False, None)
+
+        while stack:
+            frame = stack[-1]
+            frame_obj, frame_data, fields, entry_iterator, _, pending = frame
+
+            if pending is not None:
+                frame[5] = None
+                field, value, key, raw_value, serializer = pending
+                success, sub_obj = result
+
+                if success and type(value) == type(sub_obj):
+                    field.value = sub_obj
+                else:
+                    if serializer is None:
+                        serializer = self._serializer_cache.get(value, self.serializers, self.default_serializer)
+                    self._deserialize_value(field, serializer, key, raw_value)
+
+            # map data to fields
+            for entry in entry_iterator:
+                field = fields[entry.field_index][1]
+                value = self._get_loaded_value(field)
+
+                resolved = entry.resolved
+                if resolved is None or type(value) is not resolved[0]:
+                    resolved = self._resolve_load_plan_entry(entry, value)
+
+                _, is_skipped, is_nested, serializer = resolved
+                if is_skipped:
+                    continue
+
+                frame[4] = True
+                if entry.key not in frame_data:
+                    continue
+
+                raw_value = frame_data[entry.key]
+
+                # check if is subtype
+                if is_nested:
+                    if isinstance(value, Hashable) and value in obj_history:
+                        field.value = value
+                        continue
+
+                    sub_fields = self._get_deserialization_fields(value, raw_value, obj_history)
+                    if sub_fields is not None:
+                        frame[5] = (field, value, entry.key, raw_value, serializer)
+                        sub_entries = iter(self._get_load_plan(value, sub_fields).entries)
+                        stack.append([value, raw_value, sub_fields, sub_entries, False, None])
+                        break
+
+                if serializer is None:
+                    serializer = self._serializer_cache.get(value, self.serializers, self.default_serializer)
+
+                self._deserialize_value(field, serializer, entry.key, raw_value)
+            else:
+                stack.pop()
+
+                # objects without fields (e.g. plain dicts) have to be handled by a serializer
+                result = (True, frame_obj) if frame[4] else (False, None)
+
+        return result
+
+    def _get_deserialization_fields(self, obj: Any, data: Any,
+                                    obj_history: Set[Any]) -> Optional[List[Tuple[str, DataField]]]:
+        if not isinstance(data, Dict):
+            return None
+
         for t in self.non_unpackable_types:
             if isinstance(obj, t):
-                return False, None
+                return None
 
         if isinstance(obj, Hashable):
             obj_history.add(obj)
 
-        # create string to field index
-        fields_table: Dict[str, Any] = {}
+        fields = self._annotation_finder.schema_cache.get_fields(obj)
+        if not fields:
+            return None
 
-        fields = self._annotation_finder.find(obj)
-        field_list = sorted(fields.items(), key=partial(self._annotation_sorting, self._ann_ref.load_order))
-        field_list = typing.cast(List[Tuple[str, Tuple[DataField, Setting]]], field_list)
-
-        # create name to field table
-        for name, values in field_list:
-            field, setting = values
-
-            if setting.name is not None:
-                name = setting.name
-            fields_table.update({name: field})
-
-        # map data to fields
-        for name, values in field_list:
-            field, setting = values
-            key = name if setting.name is None else setting.name
-            if key not in data:
-                continue
-            raw_value = data[key]
+        return fields
 
-            # check if is subtype
-            success, sub_obj = self._deserialize(field.value, raw_value, obj_history)
-            if success and type(field.value) == type(sub_obj):
-                field.value = sub_obj
-                continue
+    def _get_load_plan(self, obj: Any, fields: List[Tuple[str, DataField]]) -> SettingsLoadPlan:
+        annotations = [field.__dict__.get(SETTING_ANNOTATION_ATTRIBUTE_NAME) for _, field in fields]
+        signature = SettingsLoadPlan.get_signature(annotations)
 
-            serializer = self._get_matching_serializer(field)
-            success, value = serializer.deserialize(type(field.value), raw_value)
+        key = (type(obj), tuple(name for name, _ in fields), signature)
+        plan = self._load_plans.get(key)
 
-            if success:
-                field.value = value
-            else:
+        if plan is None:
+            plan = SettingsLoadPlan.compile(fields, signature)
+            self._load_plans[key] = plan
+
+        return plan
+
+    def _resolve_load_plan_entry(self, entry: LoadPlanEntry, value: Any) -> ResolvedValueType:
+        # only objects with an instance dict can contain setting fields
+        is_nested = hasattr(value, "__dict__") and not isinstance(value, tuple(self.non_unpackable_types))
+
+        # serializers which depend on the value itself have to be looked up for every value
+        serializer: Optional[BaseSerializer] = None
+        if all(getattr(s, "is_type_based", False) for s in self.serializers):
+            serializer = self._serializer_cache.get(value, self.serializers, self.default_serializer)
+
+        entry.resolved = (type(value), callable(value), is_nested, serializer)
+        return entry.resolved
+
+    def _validate_load_plans(self) -> None:
+        # the resolved serializers of the load plans are only valid for the current serializers
+        serializers = (*self.serializers, self.default_serializer, *self.non_unpackable_types)
+        if serializers != self._load_plan_serializers:
+            self._load_plans.clear()
+            self._load_plan_serializers = serializers
+
+    def _deserialize_field(self, field: DataField, key: str, raw_value: Any, obj_history: Set[Any]) -> None:
+        value = self._get_loaded_value(field)
+
+        # check if is subtype
+        success, sub_obj = self._deserialize(value, raw_value, obj_history)
+        if success and type(value) == type(sub_obj):
+            field.value = sub_obj
+            return
+
+        serializer = self._serializer_cache.get(value, self.serializers, self.default_serializer)
+        self._deserialize_value(field, serializer, key, raw_value)
+
+    def _deserialize_value(self, field: DataField, serializer: BaseSerializer, key: str, raw_value: Any) -> None:
+        value = self._get_loaded_value(field)
+
+        if self.lazy_loading and isinstance(value, tuple(self.lazy_types)):
+            self._deserialize_lazy(field, serializer, key, raw_value)
+            return
+
+        batch = ParallelValueBatch.get_active()
+        if batch is None:
+            self._apply_deserialized_value(field, key, raw_value, self._decode_value(serializer, field, raw_value))
+            return
+
+        # the values are assigned in load order after the expensive values have been deserialized concurrently
+        callback = partial(self._apply_deserialized_value, field, key, raw_value)
+        if isinstance(value, tuple(self.parallel_types)):
+            batch.submit(callback, self._decode_value, serializer, field, raw_value)
+        else:
+            batch.defer(callback, self._decode_value(serializer, field, raw_value))
+
+    def _decode_value(self, serializer: BaseSerializer, field: DataField, raw_value: Any) -> Tuple[bool, Any]:
+        data_type = type(self._get_loaded_value(field))
+
+        entry = SettingsCacheEntry.get_active()
+        if entry is None:
+            return serializer.deserialize(data_type, raw_value)
+
+        # decoded values of the cached types are shared, all other values must not share the cached data
+        if issubclass(data_type, tuple(self.cached_types)):
+            return entry.get_or_decode(raw_value, data_type, partial(serializer.deserialize, data_type, raw_value))
+
+        if isinstance(raw_value, (dict, list)):
+            raw_value = copy.deepcopy(raw_value)
+        return serializer.deserialize(data_type, raw_value)
+
+    @staticmethod
+    def _apply_deserialized_value(field: DataField, key: str, raw_value: Any, result: Tuple[bool, Any]) -> None:
+        success, value = result
+
+        if success:
+            field.value = value
+        else:
+            logging.warning(f"Could not deserialize {key}: {raw_value}")
+
+    @staticmethod
+    def _get_loaded_value(field: DataField) -> Any:
+        # the value of a field which is not loaded yet has the same type, and reading it would load it
+        if LazyValuePlugin.get_pending(field) is not None:
+            return field._value
+        return field.value
+
+    @staticmethod
+    def _deserialize_lazy(field: DataField, serializer: BaseSerializer, key: str, raw_value: Any) -> None:
+        # a value which has not been read yet is replaced without loading it
+        pending = LazyValuePlugin.get_pending(field)
+        if pending is not None:
+            pending.discard(field)
+
+        current_value = field.value
+
+        def _load() -> Any:
+            success, value = serializer.deserialize(type(current_value), raw_value)
+
+            if not success:
                 logging.warning(f"Could not deserialize {key}: {raw_value}")
+                return current_value
+            return value
 
-        return True, obj
+        # the loader runs in a copy of the current context to keep the active array sidecar reader
+        context = contextvars.copy_context()
+        field.register_plugin(LazyValuePlugin(partial(context.run, _load)))
 
     def _get_matching_serializer(self, field: DataField) -> BaseSerializer:
-        for serializer in self.serializers:
-            if serializer.handles_type(field.value):
-                return serializer
-        return self.default_serializer
+        return self._serializer_cache.get(field.value, self.serializers, self.default_serializer)
 
     @staticmethod
     def _annotation_sorting(sort_key: str, item: Tuple[str, Tuple[DataField, Setting]]) -> int:
@@ -267,14 +989,6 @@ class Settings(Generic[T]):
         _, ann = values
         return getattr(ann, sort_key)
 
-    @staticmethod
-    def _is_jsonable(x):
-        try:
-            json.dumps(x)
-            return True
-        except (TypeError, OverflowError):
-            return False
-
     @property
     def is_serializing(self) -> bool:
         return self._is_serializing
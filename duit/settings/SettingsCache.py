@@ -0,0 +1,209 @@
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Tuple, Dict, Any, Callable, Optional
+
+import numpy as np
+
+# identifies a version of a settings file: (absolute path, modification time, size)
+CacheKey = Tuple[str, int, int]
+
+_active_entry: ContextVar[Optional["SettingsCacheEntry"]] = ContextVar("active_settings_cache_entry", default=None)
+
+
+class SettingsCacheEntry:
+    """
+    The parsed content of a settings file and the values which have been decoded from it.
+
+    Decoded numpy arrays are shared between all objects loaded from the entry and are therefore read-only.
+    """
+
+    def __init__(self, cache: "SettingsCache", key: CacheKey, data: Dict[str, Any], size: int):
+        """
+        Initialize a SettingsCacheEntry.
+
+        Args:
+            cache (SettingsCache): The cache which contains the entry.
+            key (CacheKey): The key of the entry.
+            data (Dict[str, Any]): The parsed settings.
+            size (int): The estimated memory size of the parsed settings in bytes.
+        """
+        self.cache = cache
+        self.key = key
+        self.data = data
+        self.size = size
+
+        # the raw values are kept alive by the data, which keeps their ids valid
+        self._values: Dict[Tuple[int, type], Any] = {}
+        self._lock = threading.Lock()
+
+    def get_or_decode(self, raw_value: Any, data_type: type,
+                      decode: Callable[[], Tuple[bool, Any]]) -> Tuple[bool, Any]:
+        """
+        Get the decoded value of a raw value of the entry data, or decode and store it.
+
+        Args:
+            raw_value (Any): The raw value inside the data of this entry.
+            data_type (type): The type the raw value is decoded to.
+            decode (Callable[[], Tuple[bool, Any]]): Decodes the raw value.
+
+        Returns:
+            Tuple[bool, Any]: A success flag and the decoded value.
+        """
+        key = (id(raw_value), data_type)
+
+        with self._lock:
+            if key in self._values:
+                return True, self._values[key]
+
+        success, value = decode()
+        if not success:
+            return success, value
+
+        size = 0
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+
+            # memory-mapped arrays are not held in memory
+            if not isinstance(value, np.memmap):
+                size = value.nbytes
+
+        with self._lock:
+            if key in self._values:
+                return True, self._values[key]
+            self._values[key] = value
+            self.size += size
+
+        self.cache._on_entry_grown(self)
+        return True, value
+
+    @contextmanager
+    def activate(self):
+        """
+        Use this entry for all values deserialized in the current context.
+        """
+        token = _active_entry.set(self)
+        try:
+            yield self
+        finally:
+            _active_entry.reset(token)
+
+    @staticmethod
+    def get_active() -> Optional["SettingsCacheEntry"]:
+        """
+        Get the entry of the current context.
+
+        Returns:
+            Optional[SettingsCacheEntry]: The active entry or None.
+        """
+        return _active_entry.get()
+
+
+class SettingsCache:
+    """
+    A least recently used cache of parsed and decoded settings files.
+
+    The files are identified by their path, modification time and size, which means that a changed file is parsed
+    again. If the estimated memory size of all entries exceeds `max_bytes`, the least recently used entries are
+    removed.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize an empty SettingsCache.
+
+        Args:
+            max_bytes (int): The memory budget of the cache in bytes (default is 64 MiB).
+        """
+        self.max_bytes = max_bytes
+
+        self._entries: "OrderedDict[CacheKey, SettingsCacheEntry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.RLock()
+
+    @property
+    def size(self) -> int:
+        """
+        Get the estimated memory size of all entries.
+
+        Returns:
+            int: The size in bytes.
+        """
+        return self._size
+
+    def get(self, file_path: str, load: Callable[[], Dict[str, Any]]) -> SettingsCacheEntry:
+        """
+        Get the entry of a settings file, or parse the file and add it to the cache.
+
+        Args:
+            file_path (str): The path to the settings file.
+            load (Callable[[], Dict[str, Any]]): Reads and parses the settings file.
+
+        Returns:
+            SettingsCacheEntry: The entry of the file.
+        """
+        stat = os.stat(file_path)
+        key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        # the file size is used as estimation for the memory size of the parsed data
+        entry = SettingsCacheEntry(self, key, load(), stat.st_size)
+
+        with self._lock:
+            self._remove_path(key[0])
+            self._entries[key] = entry
+            self._size += entry.size
+            self._evict(entry)
+
+        return entry
+
+    def invalidate(self, file_path: str) -> None:
+        """
+        Remove all entries of a settings file.
+
+        Args:
+            file_path (str): The path to the settings file.
+        """
+        with self._lock:
+            self._remove_path(os.path.abspath(file_path))
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _on_entry_grown(self, entry: SettingsCacheEntry) -> None:
+        with self._lock:
+            if self._entries.get(entry.key) is not entry:
+                return
+
+            self._size = sum(e.size for e in self._entries.values())
+            self._evict(entry)
+
+    def _remove_path(self, path: str) -> None:
+        # older versions of the same file are not needed anymore
+        for key in [key for key in self._entries if key[0] == path]:
+            self._size -= self._entries.pop(key).size
+
+    def _evict(self, keep: SettingsCacheEntry) -> None:
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            key, entry = next(iter(self._entries.items()))
+            if entry is keep:
+                self._entries.move_to_end(key)
+                continue
+
+            self._entries.pop(key)
+            self._size -= entry.size
@@ -0,0 +1,114 @@
+from typing import Any, Dict, Tuple, Callable, Set, List, Optional
+
+from duit.event.Event import Event
+from duit.model.DataField import DataField
+from duit.settings.Settings import Settings
+
+SettingsPath = Tuple[str, ...]
+"""
+The path of a setting field inside the serialized settings (the setting names from the root object to the field).
+"""
+
+
+class SettingsChangeTracker:
+    """
+    Tracks changes of the setting fields of an object tree by listening to their `on_changed` events.
+
+    The fields are identified by their path inside the serialized settings. If the value of a field which contains
+    a sub-object is replaced, the fields of the new sub-object are tracked instead.
+    """
+
+    def __init__(self, settings: Settings, obj: Any):
+        """
+        Initialize a SettingsChangeTracker and start tracking the setting fields of the object.
+
+        Args:
+            settings (Settings): The settings which define the setting fields.
+            obj (Any): The root object to track.
+        """
+        self.settings = settings
+        self.obj = obj
+
+        self.on_changed: Event[SettingsPath] = Event[SettingsPath]()
+
+        self._tracked: Dict[SettingsPath, Tuple[DataField, Callable[[Any], None]]] = {}
+        self._containers: Set[SettingsPath] = set()
+
+        self._track(self.obj, ())
+
+    def get_field(self, path: SettingsPath) -> Optional[DataField]:
+        """
+        Get the tracked field at the specified path.
+
+        Args:
+            path (SettingsPath): The path of the field.
+
+        Returns:
+            Optional[DataField]: The field or None if no field is tracked at this path.
+        """
+        tracked = self._tracked.get(path)
+        return None if tracked is None else tracked[0]
+
+    def find_paths(self, field: DataField) -> List[SettingsPath]:
+        """
+        Find the paths of a tracked field.
+
+        Args:
+            field (DataField): The field.
+
+        Returns:
+            List[SettingsPath]: The paths at which the field is tracked.
+        """
+        return [path for path, (tracked_field, _) in self._tracked.items() if tracked_field is field]
+
+    def dispose(self) -> None:
+        """
+        Stop tracking the setting fields of the object.
+        """
+        self._untrack(())
+
+    def _track(self, obj: Any, parent_path: SettingsPath) -> None:
+        stack: List[Tuple[Any, SettingsPath]] = [(obj, parent_path)]
+        visited = {id(obj)}
+
+        while stack:
+            current, current_path = stack.pop()
+
+            fields = self.settings.get_fields(current)
+            if fields and current_path:
+                self._containers.add(current_path)
+
+            for name, field in fields:
+                path = (*current_path, name)
+
+                if path not in self._tracked:
+                    handler = self._create_change_handler(path)
+                    field.on_changed.append(handler)
+                    self._tracked[path] = (field, handler)
+
+                value = field.value
+                if id(value) not in visited:
+                    visited.add(id(value))
+                    stack.append((value, path))
+
+    def _untrack(self, parent_path: SettingsPath) -> None:
+        length = len(parent_path)
+
+        for path in [p for p in self._containers if p[:length] == parent_path]:
+            self._containers.discard(path)
+
+        for path in [p for p in self._tracked if len(p) > length and p[:length] == parent_path]:
+            field, handler = self._tracked.pop(path)
+            if field.on_changed.contains(handler):
+                field.on_changed.remove(handler)
+
+    def _create_change_handler(self, path: SettingsPath) -> Callable[[Any], None]:
+        def on_changed(value: Any):
+            # the value may be a new sub-object, which has different fields
+            if path in self._containers or hasattr(value, "__dict__"):
+                self._untrack(path)
+                self._track(value, path)
+
+            self.on_changed(path)
+
+        return on_changed
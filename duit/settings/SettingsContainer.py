@@ -0,0 +1,89 @@
+import io
+import os
+import zipfile
+from enum import Enum
+from typing import Dict, Optional, Iterable, Union
+
+ENTRY_SUFFIX = ".json"
+
+
+class ContainerCompression(Enum):
+    """
+    Enum defining the compression method of the entries in a settings container.
+    """
+    STORED = zipfile.ZIP_STORED
+    """The entries are not compressed."""
+    DEFLATED = zipfile.ZIP_DEFLATED
+    """The entries are compressed with deflate (fast, widely supported)."""
+    BZIP2 = zipfile.ZIP_BZIP2
+    """The entries are compressed with bzip2."""
+    LZMA = zipfile.ZIP_LZMA
+    """The entries are compressed with lzma (smallest, but slowest)."""
+
+
+def write_settings_container(entries: Dict[str, str],
+                             compression: ContainerCompression = ContainerCompression.DEFLATED,
+                             min_compress_bytes: int = 1024) -> bytes:
+    """
+    Write settings entries into a container (zip archive) with one file per entry.
+
+    Each entry is compressed on its own, which allows reading single entries without decoding the others.
+    Entries smaller than `min_compress_bytes` are stored uncompressed, because compressing them does not pay off.
+
+    Args:
+        entries (Dict[str, str]): The JSON content of each entry by its name.
+        compression (ContainerCompression): The compression method for entries which are large enough.
+        min_compress_bytes (int): The minimal size of an entry in bytes to be compressed (default is 1024).
+
+    Returns:
+        bytes: The content of the container.
+    """
+    buffer = io.BytesIO()
+
+    with zipfile.ZipFile(buffer, "w") as container:
+        for name, content in entries.items():
+            data = content.encode("utf-8")
+            method = compression.value if len(data) >= min_compress_bytes else zipfile.ZIP_STORED
+            container.writestr(f"{name}{ENTRY_SUFFIX}", data, compress_type=method)
+
+    return buffer.getvalue()
+
+
+def read_settings_container(path: Union[str, os.PathLike],
+                            names: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """
+    Read the entries of a settings container. Only the requested entries are decompressed.
+
+    Args:
+        path (Union[str, os.PathLike]): The path of the container file.
+        names (Optional[Iterable[str]]): The names of the entries to read or None to read all entries. Missing
+            entries are ignored.
+
+    Returns:
+        Dict[str, str]: The JSON content of each entry by its name.
+    """
+    entries: Dict[str, str] = {}
+
+    with zipfile.ZipFile(path, "r") as container:
+        available = {info.filename[:-len(ENTRY_SUFFIX)]: info for info in container.infolist()
+                     if info.filename.endswith(ENTRY_SUFFIX)}
+
+        selected = available.keys() if names is None else [name for name in names if name in available]
+
+        for name in selected:
+            entries[name] = container.read(available[name]).decode("utf-8")
+
+    return entries
+
+
+def is_settings_container(path: Union[str, os.PathLike]) -> bool:
+    """
+    Check if a file is a settings container instead of a plain JSON settings file.
+
+    Args:
+        path (Union[str, os.PathLike]): The path of the file.
+
+    Returns:
+        bool: True if the file is a container.
+    """
+    return zipfile.is_zipfile(path)
@@ -0,0 +1,259 @@
+import logging
+import os
+from typing import Generic, TypeVar, Dict, Any, Set, List, Optional
+
+from duit.model.DataField import DataField
+from duit.settings.ArraySidecar import ArraySidecarReader
+from duit.settings.Settings import Settings, PATH_ATTRIBUTE, VALUE_ATTRIBUTE
+from duit.settings.SettingsChangeTracker import SettingsChangeTracker, SettingsPath
+from duit.utils.file_utils import FsyncPolicy, write_file_atomic
+
+T = TypeVar("T")
+
+
+class SettingsJournal(Generic[T]):
+    """
+    Saves the settings of an object incrementally.
+
+    The journal tracks which setting fields changed since the last save by listening to their `on_changed` events.
+    On `save()`, only the changed fields are serialized and appended to a journal file next to the settings file
+    (one JSON line per field). After `max_entries` journal entries, the journal is compacted into the settings file.
+    A cached copy of the serialized settings is patched with every change, so the compaction does not need to
+    serialize the object again.
+
+    Changes which do not trigger the `on_changed` event (e.g. modifying a numpy array in place) have to be marked
+    with `mark_dirty()`. Use `load()` of the journal to load the settings file together with its journal.
+    """
+
+    def __init__(self, settings: Settings, obj: T, file_path: str, max_entries: int = 100,
+                 fsync_policy: FsyncPolicy = FsyncPolicy.NONE):
+        """
+        Initialize a SettingsJournal and start tracking the setting fields of the object.
+
+        Args:
+            settings (Settings): The settings used to serialize and deserialize the object.
+            obj (T): The object to track.
+            file_path (str): The path to the settings file.
+            max_entries (int): The number of journal entries after which the journal is compacted (default is 100).
+            fsync_policy (FsyncPolicy): Defines how the journal and the compacted settings file are synced to the
+                storage device. The settings file is written atomically if a policy other than NONE is set.
+        """
+        self.settings = settings
+        self.obj = obj
+        self.file_path = file_path
+        self.max_entries = max_entries
+        self.fsync_policy = fsync_policy
+
+        self._data: Dict[str, Any] = {}
+        self._dirty: Set[SettingsPath] = set()
+        self._journal_entries = 0
+        self._synced = False
+
+        self._tracker = SettingsChangeTracker(settings, obj)
+        self._tracker.on_changed.append(self._on_field_changed)
+
+    @property
+    def tracker(self) -> SettingsChangeTracker:
+        """
+        Get the tracker which detects the changed setting fields.
+
+        Returns:
+            SettingsChangeTracker: The change tracker.
+        """
+        return self._tracker
+
+    @property
+    def journal_path(self) -> str:
+        """
+        Get the path of the journal file.
+
+        Returns:
+            str: The path of the journal file.
+        """
+        return f"{self.file_path}.journal"
+
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Check if there are changes which have not been saved.
+
+        Returns:
+            bool: True if a save is required.
+        """
+        return not self._synced or len(self._dirty) > 0
+
+    def mark_dirty(self, field: Optional[DataField] = None) -> None:
+        """
+        Mark a field (or the whole object) as changed.
+
+        Args:
+            field (Optional[DataField]): The changed field, or None to save the whole object on the next save.
+        """
+        if field is None:
+            self._synced = False
+            return
+
+        self._dirty.update(self._tracker.find_paths(field))
+
+    def load(self) -> T:
+        """
+        Load the settings file, apply the entries of its journal and start tracking changes from this state.
+
+        Returns:
+            T: The object with applied settings.
+        """
+        data: Dict[str, Any] = {}
+        if os.path.exists(self.file_path):
+            data = self.settings.read_file(self.file_path)
+
+        self._journal_entries = 0
+        for line in self._read_journal_lines():
+            if line.strip() == "":
+                continue
+
+            entry = self.settings.json_backend.loads(line)
+            path = tuple(entry[PATH_ATTRIBUTE])
+            self._apply_patch(data, path, entry.get(VALUE_ATTRIBUTE), VALUE_ATTRIBUTE in entry)
+            self._journal_entries += 1
+
+        reader = ArraySidecarReader(self.settings.get_array_sidecar_path(self.file_path), self.settings.array_mmap_mode)
+        with reader.activate():
+            self.settings.deserialize(data, self.obj)
+
+        # loading fires the change events of the fields, which is not a change compared to the file
+        self._data = data
+        self._dirty.clear()
+        self._synced = True
+        return self.obj
+
+    def save(self) -> None:
+        """
+        Save the changed fields into the journal, or write the whole settings file if it has not been written by
+        this journal yet or the journal is full.
+        """
+        if not self._synced:
+            self.compact()
+            return
+
+        paths = self._take_dirty_paths()
+        if len(paths) == 0:
+            return
+
+        lines: List[str] = []
+        for path in paths:
+            entry = self._update_data(path)
+            if entry is not None:
+                lines.append(self.settings.json_backend.dumps(entry, compact=True))
+
+        with open(self.journal_path, "a") as file:
+            file.write("".join(f"{line}\n" for line in lines))
+
+            if self.fsync_policy != FsyncPolicy.NONE:
+                file.flush()
+                os.fsync(file.fileno())
+
+        self._journal_entries += len(lines)
+
+        if self._journal_entries >= self.max_entries:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Write the whole settings file and remove the journal.
+        """
+        paths = self._take_dirty_paths()
+        atomic = self.fsync_policy != FsyncPolicy.NONE
+
+        if self.settings.array_sidecar or self.settings.container_compression is not None:
+            # arrays have to be written into the sidecar file and containers are re-encoded, which requires a full save
+            self.settings.save(self.file_path, self.obj, atomic=atomic, fsync_policy=self.fsync_policy)
+        else:
+            if self._synced:
+                for path in paths:
+                    self._update_data(path)
+            else:
+                self._data = self.settings.serialize(self.obj)
+
+            content = self.settings.json_backend.dumps(self._data, compact=self.settings.compact_json)
+            if atomic:
+                write_file_atomic(self.file_path, content, self.fsync_policy)
+            else:
+                with open(self.file_path, "w") as file:
+                    file.write(content)
+
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+        self._journal_entries = 0
+        self._synced = True
+
+    def dispose(self) -> None:
+        """
+        Stop tracking the setting fields of the object.
+        """
+        self._tracker.dispose()
+
+    def _read_journal_lines(self) -> List[str]:
+        if not os.path.exists(self.journal_path):
+            return []
+
+        with open(self.journal_path, "rb") as file:
+            content = file.read()
+
+        # every entry ends with a line break, a last line without it has been torn by an interrupted save
+        end = content.rfind(b"\n") + 1
+        if content[end:].strip():
+            logging.warning(f"Ignoring incomplete last entry of journal '{self.journal_path}'")
+
+            # the incomplete entry is removed, so that the next entry is appended on a new line
+            with open(self.journal_path, "r+b") as file:
+                file.truncate(end)
+
+        return content[:end].decode("utf-8").splitlines()
+
+    def _on_field_changed(self, path: SettingsPath) -> None:
+        self._dirty.add(path)
+
+    def _take_dirty_paths(self) -> List[SettingsPath]:
+        # the set is swapped instead of cleared, so that changes from other threads are not lost
+        dirty, self._dirty = self._dirty, set()
+
+        # a changed parent field already contains its changed children
+        paths = sorted(dirty)
+        result: List[SettingsPath] = []
+        for path in paths:
+            if result and path[:len(result[-1])] == result[-1]:
+                continue
+            result.append(path)
+        return result
+
+    def _update_data(self, path: SettingsPath) -> Optional[Dict[str, Any]]:
+        field = self._tracker.get_field(path)
+        if field is None:
+            return None
+
+        success, value = self.settings.serialize_field(field)
+
+        if not success:
+            logging.warning(f"Could not serialize '{'.'.join(path)}': {field.value}")
+            self._apply_patch(self._data, path, None, False)
+            return {PATH_ATTRIBUTE: list(path)}
+
+        self._apply_patch(self._data, path, value, True)
+        return {PATH_ATTRIBUTE: list(path), VALUE_ATTRIBUTE: value}
+
+    @staticmethod
+    def _apply_patch(data: Dict[str, Any], path: SettingsPath, value: Any, has_value: bool) -> None:
+        for name in path[:-1]:
+            child = data.get(name)
+            if not isinstance(child, dict):
+                if not has_value:
+                    return
+                child = {}
+                data[name] = child
+            data = child
+
+        if has_value:
+            data[path[-1]] = value
+        else:
+            data.pop(path[-1], None)
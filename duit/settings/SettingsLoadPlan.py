@@ -0,0 +1,89 @@
+from typing import Tuple, List, Optional, Sequence
+
+from duit.model.DataField import DataField
+from duit.settings.Setting import Setting
+from duit.settings.serialiser.BaseSerializer import BaseSerializer
+
+# the resolved handling of a value type: (value type, is skipped, is nested, serializer or None to look it up per value)
+ResolvedValueType = Tuple[type, bool, bool, Optional[BaseSerializer]]
+
+# the exposed setting name and load order of each DataField attribute, or None if it is not loaded
+AnnotationSignature = Tuple[Optional[Tuple[Optional[str], int]], ...]
+
+
+class LoadPlanEntry:
+    """
+    A setting field of a SettingsLoadPlan.
+
+    Attributes:
+        field_index (int): The index of the field in the DataField attributes of the object.
+        key (str): The setting name used in the serialized data.
+        resolved (Optional[ResolvedValueType]): How the values of the last seen value type are deserialized. The
+            tuple is replaced as a whole, which allows to share the entry between threads.
+    """
+    __slots__ = ("field_index", "key", "resolved")
+
+    def __init__(self, field_index: int, key: str):
+        self.field_index = field_index
+        self.key = key
+        self.resolved: Optional[ResolvedValueType] = None
+
+
+class SettingsLoadPlan:
+    """
+    A compiled deserialization plan for objects with the same class, DataField attributes and setting annotations.
+
+    The plan contains the setting fields ordered by their `load_order`. Each entry caches how the values of its field
+    are deserialized (see `LoadPlanEntry.resolved`), so that loading many objects of the same class does not need to
+    find, sort and inspect the fields again.
+    """
+
+    def __init__(self, entries: Sequence[LoadPlanEntry]):
+        """
+        Initialize a SettingsLoadPlan.
+
+        Args:
+            entries (Sequence[LoadPlanEntry]): The setting fields in load order.
+        """
+        self.entries: Tuple[LoadPlanEntry, ...] = tuple(entries)
+
+    @staticmethod
+    def get_signature(annotations: Sequence[Optional[Setting]]) -> AnnotationSignature:
+        """
+        Get the part of the setting annotations which defines a load plan.
+
+        Args:
+            annotations (Sequence[Optional[Setting]]): The setting annotation of each DataField attribute.
+
+        Returns:
+            AnnotationSignature: The signature of the annotations.
+        """
+        return tuple(None if a is None or not a.exposed else (a.name, a.load_order) for a in annotations)
+
+    @staticmethod
+    def compile(fields: List[Tuple[str, DataField]], signature: AnnotationSignature) -> "SettingsLoadPlan":
+        """
+        Compile a load plan from the DataField attributes of an object.
+
+        Args:
+            fields (List[Tuple[str, DataField]]): The attribute names and DataFields of the object.
+            signature (AnnotationSignature): The signature of the setting annotations of the fields.
+
+        Returns:
+            SettingsLoadPlan: The compiled load plan.
+        """
+        entries: List[Tuple[int, LoadPlanEntry]] = []
+
+        for index, ((name, _), values) in enumerate(zip(fields, signature)):
+            if values is None:
+                continue
+
+            setting_name, load_order = values
+            entries.append((load_order, LoadPlanEntry(index, name if setting_name is None else setting_name)))
+
+        # the sort is stable, fields with the same load order keep their attribute order
+        entries.sort(key=lambda item: item[0])
+        return SettingsLoadPlan([entry for _, entry in entries])
+
+    def __len__(self) -> int:
+        return len(self.entries)
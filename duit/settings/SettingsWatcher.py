@@ -0,0 +1,184 @@
+import logging
+import os
+import threading
+from typing import Generic, TypeVar, Optional, Callable, Tuple, Any, Dict
+
+from duit.event.Event import Event
+from duit.settings.ArraySidecar import ArraySidecarReader
+from duit.settings.Settings import Settings, SettingsPatch
+
+T = TypeVar("T")
+
+# identifies a version of a file: (modification time, size, inode)
+FileSignature = Tuple[int, int, int]
+
+
+class SettingsWatcher(Generic[T]):
+    """
+    Watches a settings file and applies external changes to a live object (hot reload).
+
+    The file is polled on a background thread every `interval` seconds. If its modification time, size or inode
+    changed, the file is parsed on the background thread and compared with the previously parsed version of the
+    file. Only the settings which differ are applied with `Settings.apply_patch()` in a single pass, and the
+    'on_changed' events of the fields are triggered after all of them have been applied.
+
+    By default, the patch is applied on the background thread. Use a `dispatcher` to apply it on another thread
+    (e.g. the UI thread). The object is only accessed by the function which applies the patch. The `on_reloaded`
+    and `on_error` events are invoked on the thread which applies the patch and the background thread respectively.
+    """
+
+    def __init__(self, settings: Settings, obj: T, file_path: str, interval: float = 0.25,
+                 dispatcher: Optional[Callable[[Callable[[], None]], None]] = None):
+        """
+        Initialize a SettingsWatcher. Call `start()` to start watching the file.
+
+        Args:
+            settings (Settings): The settings used to load the file.
+            obj (T): The object to which the changes are applied.
+            file_path (str): The path to the settings file.
+            interval (float): The time in seconds between two checks of the file (default is 0.25).
+            dispatcher (Optional[Callable[[Callable[[], None]], None]]): Runs the function which applies a patch,
+                e.g. on the UI thread (default is None, which applies it on the background thread).
+        """
+        self.settings = settings
+        self.obj = obj
+        self.file_path = file_path
+        self.interval = interval
+        self.dispatcher = dispatcher
+
+        self.on_reloaded: Event[SettingsPatch] = Event[SettingsPatch]()
+        self.on_error: Event[Exception] = Event[Exception]()
+
+        # the version of the file which has been applied, changes are detected relative to it
+        self._signature: Optional[FileSignature] = self._get_signature()
+        self._data: Dict[str, Any] = self._read_baseline()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check if the background thread is running.
+
+        Returns:
+            bool: True if the watcher has been started and not stopped yet.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def load(self) -> T:
+        """
+        Load the settings file into the object. Changes are detected relative to this version of the file.
+
+        Returns:
+            T: The object with applied settings.
+        """
+        self._signature = self._get_signature()
+        self._data = self.settings.read_file(self.file_path)
+
+        with self._activate_reader():
+            self.settings.deserialize(self._data, self.obj)
+        return self.obj
+
+    def start(self) -> None:
+        """
+        Start the background thread which watches the file.
+        """
+        if self.is_running:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="duit-settings-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background thread.
+        """
+        self._stop_event.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def dispose(self) -> None:
+        """
+        Stop watching the file.
+        """
+        self.stop()
+
+    def check(self) -> bool:
+        """
+        Check the file for changes on the calling thread and apply them.
+
+        Returns:
+            bool: True if the file has changed and its changes have been applied (or dispatched).
+        """
+        signature = self._get_signature()
+        if signature is None or signature == self._signature:
+            return False
+
+        # a file which cannot be parsed (e.g. while it is written) is reported once per version
+        self._signature = signature
+
+        try:
+            data = self.settings.read_file(self.file_path)
+        except Exception as ex:
+            logging.warning(f"Could not reload settings from '{self.file_path}': {ex}")
+            self.on_error(ex)
+            return False
+
+        baseline = self._data
+        if data == baseline:
+            return False
+
+        self._data = data
+
+        if self.dispatcher is not None:
+            self.dispatcher(lambda: self._apply_changes(data, baseline))
+        else:
+            self._apply_changes(data, baseline)
+        return True
+
+    def __enter__(self) -> "SettingsWatcher[T]":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.dispose()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.check()
+
+    def _apply_changes(self, data: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+        # both versions of the file are compared, the object only defines which settings exist
+        patch = self.settings.diff(self.obj, baseline, current=data)
+        if len(patch) == 0:
+            return
+
+        with self._activate_reader():
+            self.settings.apply_patch(self.obj, patch)
+
+        self.on_reloaded(patch)
+
+    def _activate_reader(self):
+        reader = ArraySidecarReader(self.settings.get_array_sidecar_path(self.file_path), self.settings.array_mmap_mode)
+        return reader.activate()
+
+    def _read_baseline(self) -> Dict[str, Any]:
+        if self._signature is None:
+            return {}
+
+        try:
+            return self.settings.read_file(self.file_path)
+        except Exception as ex:
+            logging.warning(f"Could not read settings from '{self.file_path}': {ex}")
+            return {}
+
+    def _get_signature(self) -> Optional[FileSignature]:
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
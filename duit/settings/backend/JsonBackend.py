@@ -0,0 +1,111 @@
+from abc import ABC, abstractmethod
+from typing import Any, Tuple, Optional
+
+_JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+_JSON_KEY_TYPES = (str, int, float, bool, type(None))
+
+
+class JsonBackend(ABC):
+    """
+    An abstract base class for the JSON encoders and decoders used by the Settings.
+
+    Attributes:
+        native_types (Tuple[type, ...]): Additional types the backend can encode without conversion.
+        integer_bits (Optional[int]): The maximum number of bits of integers the backend supports (None for unlimited).
+    """
+
+    native_types: Tuple[type, ...] = ()
+    integer_bits: Optional[int] = None
+
+    @abstractmethod
+    def dumps(self, data: Any, compact: bool = False) -> str:
+        """
+        Encode data into a JSON string with sorted keys.
+
+        Args:
+            data (Any): The data to encode.
+            compact (bool): Whether to omit indentation and whitespace (default is False).
+
+        Returns:
+            str: The JSON string.
+        """
+        pass
+
+    @abstractmethod
+    def loads(self, content: str) -> Any:
+        """
+        Decode a JSON string.
+
+        Args:
+            content (str): The JSON string.
+
+        Returns:
+            Any: The decoded data.
+        """
+        pass
+
+    def is_jsonable(self, value: Any) -> bool:
+        """
+        Check if a value can be encoded by the backend by inspecting its types instead of encoding it.
+
+        Args:
+            value (Any): The value to check.
+
+        Returns:
+            bool: True if the value can be encoded, False otherwise.
+        """
+        visited_containers = set()
+        stack = [value]
+
+        while stack:
+            current = stack.pop()
+
+            if isinstance(current, _JSON_SCALAR_TYPES):
+                if self.integer_bits is not None and isinstance(current, int) and not self._is_int_in_range(current):
+                    return False
+                continue
+
+            if self.native_types and isinstance(current, self.native_types):
+                if not self.is_native(current):
+                    return False
+                continue
+
+            if isinstance(current, (list, tuple, dict)):
+                # containers which are referenced more than once may be circular, which is checked by encoding
+                if id(current) in visited_containers:
+                    return self._is_encodable(value)
+                visited_containers.add(id(current))
+
+                if isinstance(current, dict):
+                    if not all(isinstance(k, _JSON_KEY_TYPES) for k in current.keys()):
+                        return False
+                    stack.extend(current.values())
+                else:
+                    stack.extend(current)
+                continue
+
+            return False
+
+        return True
+
+    def is_native(self, value: Any) -> bool:
+        """
+        Check if a value of one of the `native_types` can be encoded by the backend (e.g. its data type is supported).
+
+        Args:
+            value (Any): The value to check.
+
+        Returns:
+            bool: True if the value can be encoded without conversion, False otherwise.
+        """
+        return True
+
+    def _is_encodable(self, value: Any) -> bool:
+        try:
+            self.dumps(value, compact=True)
+            return True
+        except (TypeError, ValueError, OverflowError):
+            return False
+
+    def _is_int_in_range(self, value: int) -> bool:
+        return -(1 << (self.integer_bits - 1)) <= value < (1 << self.integer_bits)
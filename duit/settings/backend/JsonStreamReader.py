@@ -0,0 +1,142 @@
+import json
+from typing import TextIO, Any, Iterator
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = ",:]}"
+
+
+class JsonStreamReader:
+    """
+    An incremental JSON reader which reads a document from a text stream in chunks.
+
+    Objects can be iterated key by key with `iter_object()`, while the values are either read as a whole with
+    `read_value()` or iterated further. Only the currently decoded value has to fit into memory, not the whole
+    document.
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int = 1 << 16):
+        """
+        Initialize a JsonStreamReader.
+
+        Args:
+            stream (TextIO): The text stream to read from.
+            chunk_size (int): The number of characters which are read at once (default is 65536).
+        """
+        self.stream = stream
+        self.chunk_size = chunk_size
+
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def peek(self) -> str:
+        """
+        Skip whitespace and get the next character without consuming it.
+
+        Returns:
+            str: The next character or an empty string at the end of the stream.
+        """
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+
+            if self._pos < len(self._buffer) or not self._read(self.chunk_size):
+                break
+
+        return self._buffer[self._pos:self._pos + 1]
+
+    def expect(self, char: str) -> None:
+        """
+        Skip whitespace and consume the expected character.
+
+        Args:
+            char (str): The expected character.
+
+        Raises:
+            json.JSONDecodeError: If the next character is not the expected one.
+        """
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buffer, self._pos)
+        self._pos += 1
+
+    def read_value(self) -> Any:
+        """
+        Read and decode the next JSON value.
+
+        Returns:
+            Any: The decoded value.
+
+        Raises:
+            json.JSONDecodeError: If the value is invalid or the stream ends before the value is complete.
+        """
+        self.peek()
+        read_size = self.chunk_size
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+
+                # a value may be incomplete (e.g. a number which continues in the next chunk) if it is not followed
+                # by a delimiter, because the decoder stops at the first character which does not fit
+                if self._eof or self._is_delimited(end):
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+
+            # the read size grows to decode large values in linear time
+            self._read(read_size)
+            read_size *= 2
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Iterate over the keys of the next JSON object. The value of each key has to be consumed (with `read_value()`
+        or `iter_object()`) before the iteration continues.
+
+        Returns:
+            Iterator[str]: The keys of the object.
+        """
+        self.expect("{")
+
+        if self.peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expecting property name", self._buffer, self._pos)
+
+            self.expect(":")
+            yield key
+
+            char = self.peek()
+            self._pos += 1
+
+            if char == "}":
+                return
+
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", self._buffer, self._pos - 1)
+
+    def _is_delimited(self, pos: int) -> bool:
+        while pos < len(self._buffer) and self._buffer[pos] in _WHITESPACE:
+            pos += 1
+
+        return pos < len(self._buffer) and self._buffer[pos] in _DELIMITERS
+
+    def _read(self, size: int) -> bool:
+        if self._eof:
+            return False
+
+        chunk = self.stream.read(size)
+        if chunk == "":
+            self._eof = True
+            return False
+
+        # drop the consumed part of the buffer
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
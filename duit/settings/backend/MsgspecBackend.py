@@ -0,0 +1,31 @@
+from typing import Any
+
+import msgspec
+
+from duit.settings.backend.JsonBackend import JsonBackend
+
+
+class MsgspecBackend(JsonBackend):
+    """
+    A JSON backend based on [msgspec](https://github.com/jcrist/msgspec). Formatted output is indented by four spaces.
+    """
+
+    integer_bits = 64
+
+    def __init__(self):
+        """
+        Initialize a MsgspecBackend with a reusable encoder and decoder.
+        """
+        self._encoder = msgspec.json.Encoder(order="sorted")
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, data: Any, compact: bool = False) -> str:
+        content = self._encoder.encode(data)
+
+        if not compact:
+            content = msgspec.json.format(content, indent=4)
+
+        return content.decode("utf-8")
+
+    def loads(self, content: str) -> Any:
+        return self._decoder.decode(content)
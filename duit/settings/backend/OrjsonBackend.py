@@ -0,0 +1,41 @@
+from typing import Any
+
+import numpy as np
+import orjson
+
+from duit.settings.backend.JsonBackend import JsonBackend
+
+# the numpy data types orjson can encode (e.g. no float16, complex or object arrays)
+_NATIVE_DTYPES = frozenset(np.dtype(t) for t in (
+    np.float64, np.float32, np.int64, np.int32, np.int16, np.int8,
+    np.uint64, np.uint32, np.uint16, np.uint8, np.bool_
+))
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    A JSON backend based on [orjson](https://github.com/ijl/orjson), which encodes numpy arrays and scalars natively.
+    Formatted output is indented by two spaces (the only indentation orjson supports).
+    """
+
+    native_types = (np.ndarray, np.generic)
+    integer_bits = 64
+
+    def is_native(self, value: Any) -> bool:
+        # orjson only encodes C-contiguous arrays (no subclasses or 0-d arrays) of some data types
+        if isinstance(value, np.ndarray):
+            return (type(value) is np.ndarray and value.ndim > 0 and value.flags.c_contiguous
+                    and value.dtype in _NATIVE_DTYPES)
+
+        return value.dtype in _NATIVE_DTYPES
+
+    def dumps(self, data: Any, compact: bool = False) -> str:
+        options = orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+        if not compact:
+            options |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, option=options).decode("utf-8")
+
+    def loads(self, content: str) -> Any:
+        return orjson.loads(content)
@@ -0,0 +1,18 @@
+import json
+from typing import Any
+
+from duit.settings.backend.JsonBackend import JsonBackend
+
+
+class StdJsonBackend(JsonBackend):
+    """
+    A JSON backend based on the json module of the standard library. Formatted output is indented by four spaces.
+    """
+
+    def dumps(self, data: Any, compact: bool = False) -> str:
+        if compact:
+            return json.dumps(data, sort_keys=True, separators=(",", ":"))
+        return json.dumps(data, indent=4, sort_keys=True)
+
+    def loads(self, content: str) -> Any:
+        return json.loads(content)
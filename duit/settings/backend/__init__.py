@@ -0,0 +1,54 @@
+import importlib.util
+
+from duit.settings.backend.JsonBackend import JsonBackend
+from duit.settings.backend.StdJsonBackend import StdJsonBackend
+
+
+def create_orjson_backend() -> JsonBackend:
+    """
+    Create a JSON backend based on orjson.
+
+    Returns:
+        JsonBackend: The orjson backend.
+
+    Raises:
+        ImportError: If orjson is not installed.
+    """
+    try:
+        from duit.settings.backend.OrjsonBackend import OrjsonBackend
+    except ImportError:
+        raise ImportError("Could not import orjson. Please install with:\npip install orjson")
+    return OrjsonBackend()
+
+
+def create_msgspec_backend() -> JsonBackend:
+    """
+    Create a JSON backend based on msgspec.
+
+    Returns:
+        JsonBackend: The msgspec backend.
+
+    Raises:
+        ImportError: If msgspec is not installed.
+    """
+    try:
+        from duit.settings.backend.MsgspecBackend import MsgspecBackend
+    except ImportError:
+        raise ImportError("Could not import msgspec. Please install with:\npip install msgspec")
+    return MsgspecBackend()
+
+
+def create_fastest_json_backend() -> JsonBackend:
+    """
+    Create the fastest JSON backend which is installed (orjson, msgspec or the standard library json module).
+
+    Returns:
+        JsonBackend: The JSON backend.
+    """
+    if importlib.util.find_spec("orjson") is not None:
+        return create_orjson_backend()
+
+    if importlib.util.find_spec("msgspec") is not None:
+        return create_msgspec_backend()
+
+    return StdJsonBackend()
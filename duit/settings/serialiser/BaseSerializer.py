@@ -6,10 +6,14 @@ class BaseSerializer(ABC):
     """
     An abstract base class for serializers.
 
-    Args:
-        None
+    Attributes:
+        is_type_based (bool): Whether `handles_type()` only depends on the type of the object. This allows the
+            Settings to cache the matching serializer per type. Only set it to True if the value itself is not
+            inspected (default is False).
     """
 
+    is_type_based: bool = False
+
     @abstractmethod
     def handles_type(self, obj: Any) -> bool:
         """
@@ -11,6 +11,8 @@ class DefaultSerializer(BaseSerializer):
         None
     """
 
+    is_type_based = True
+
     def handles_type(self, obj: Any) -> bool:
         """
         Check if the serializer can handle a given object.
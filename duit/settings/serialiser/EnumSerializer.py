@@ -12,6 +12,8 @@ class EnumSerializer(BaseSerializer):
         None
     """
 
+    is_type_based = True
+
     def handles_type(self, obj: Any) -> bool:
         """
         Check if the serializer can handle a given object.
@@ -53,9 +55,10 @@ class EnumSerializer(BaseSerializer):
         Raises:
             None
         """
-        options = {o.name: o for o in list(data_type)}
+        # the member map of the enum class is used instead of iterating all members
+        option = data_type.__members__.get(obj) if isinstance(obj, str) else None
 
-        if obj not in options:
+        if option is None:
             return False, obj
 
-        return True, options[obj]
+        return True, option
@@ -1,24 +1,27 @@
 import base64
-from pathlib import Path
 from typing import Any, Type
 
 import numpy as np
 
+from duit.settings.ArraySidecar import ArraySidecarWriter, ArraySidecarReader
 from duit.settings.serialiser.BaseSerializer import BaseSerializer
 
 SHAPE_ATTRIBUTE = "shape"
 DTYPE_ATTRIBUTE = "dtype"
 DATA_ATTRIBUTE = "data"
+SIDECAR_ATTRIBUTE = "sidecar"
 
 
 class NumpySerializer(BaseSerializer):
     """
-    A serializer for Python's pathlib.Path objects.
+    A serializer for numpy arrays.
 
-    Args:
-        None
+    Arrays are stored base64 encoded inside the settings. If an ArraySidecarWriter is active, large arrays are
+    written into the sidecar file instead and only a reference is stored.
     """
 
+    is_type_based = True
+
     def handles_type(self, obj: Any) -> bool:
         """
         Check if the serializer can handle a given object.
@@ -27,23 +30,34 @@ class NumpySerializer(BaseSerializer):
             obj (Any): The object to check.
 
         Returns:
-            bool: True if the object is an instance of a pathlib.Path object, otherwise False.
+            bool: True if the object is a numpy array, otherwise False.
         """
         return isinstance(obj, np.ndarray)
 
     def serialize(self, obj: np.ndarray) -> [bool, Any]:
         """
-        Serialize a Path object by returning its string representation.
+        Serialize a numpy array into its shape, data type and data (or sidecar reference).
 
         Args:
-            obj (Path): The Path object to be serialized.
+            obj (np.ndarray): The array to be serialized.
 
         Returns:
-            [bool, Any]: A tuple containing a success flag (True) and the string representation of the Path.
+            [bool, Any]: A tuple containing a success flag (True) and the serialized array.
 
         Raises:
             None
         """
+        writer = ArraySidecarWriter.get_active()
+        if writer is not None:
+            reference = writer.write(obj)
+
+            if reference is not None:
+                return True, {
+                    SHAPE_ATTRIBUTE: list(obj.shape),
+                    DTYPE_ATTRIBUTE: str(obj.dtype),
+                    SIDECAR_ATTRIBUTE: reference
+                }
+
         data = {
             SHAPE_ATTRIBUTE: list(obj.shape),
             DTYPE_ATTRIBUTE: str(obj.dtype),
@@ -53,14 +67,14 @@ class NumpySerializer(BaseSerializer):
 
     def deserialize(self, data_type: Type, obj: Any) -> [bool, Any]:
         """
-        Deserialize data into a pathlib.Path object.
+        Deserialize data into a numpy array.
 
         Args:
             data_type (Type): The expected data type for deserialization.
-            obj (Any): The data to be deserialized (a string representing a Path).
+            obj (Any): The data to be deserialized (shape, data type and data or sidecar reference).
 
         Returns:
-            [bool, Any]: A tuple containing a success flag (True) and the corresponding pathlib.Path object.
+            [bool, Any]: A tuple containing a success flag and the corresponding numpy array.
 
         Raises:
             None
@@ -68,6 +82,13 @@ class NumpySerializer(BaseSerializer):
         shape = tuple(obj[SHAPE_ATTRIBUTE])
         dtype = np.dtype(obj[DTYPE_ATTRIBUTE])
 
+        if SIDECAR_ATTRIBUTE in obj:
+            reader = ArraySidecarReader.get_active()
+            if reader is None:
+                return False, None
+            data = reader.read(obj[SIDECAR_ATTRIBUTE], shape, dtype)
+            return data is not None, data
+
         data_bytes = str(obj[DATA_ATTRIBUTE]).encode("utf-8")
         buffer = base64.b64decode(data_bytes)
         data = np.frombuffer(buffer, dtype).reshape(shape)
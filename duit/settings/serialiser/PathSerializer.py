@@ -12,6 +12,8 @@ class PathSerializer(BaseSerializer):
         None
     """
 
+    is_type_based = True
+
     def handles_type(self, obj: Any) -> bool:
         """
         Check if the serializer can handle a given object.
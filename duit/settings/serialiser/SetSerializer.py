@@ -0,0 +1,63 @@
+from typing import Any, Type
+
+from duit.settings.serialiser.BaseSerializer import BaseSerializer
+
+
+class SetSerializer(BaseSerializer):
+    """
+    A serializer for Python set and frozenset objects.
+
+    Args:
+        None
+    """
+
+    is_type_based = True
+
+    def handles_type(self, obj: Any) -> bool:
+        """
+        Check if the serializer can handle a given object.
+
+        Args:
+            obj (Any): The object to check.
+
+        Returns:
+            bool: True if the object is an instance of a set or frozenset, otherwise False.
+        """
+        return isinstance(obj, (set, frozenset))
+
+    def serialize(self, obj: set) -> [bool, Any]:
+        """
+        Serialize a set by returning its elements as list (sorted if possible to keep the output stable).
+
+        Args:
+            obj (set): The set to be serialized.
+
+        Returns:
+            [bool, Any]: A tuple containing a success flag (True) and the list of elements.
+
+        Raises:
+            None
+        """
+        try:
+            return True, sorted(obj)
+        except TypeError:
+            return True, list(obj)
+
+    def deserialize(self, data_type: Type, obj: Any) -> [bool, Any]:
+        """
+        Deserialize a list of elements into a set.
+
+        Args:
+            data_type (Type): The expected data type for deserialization (set or frozenset).
+            obj (Any): The data to be deserialized (a list of elements).
+
+        Returns:
+            [bool, Any]: A tuple containing a success flag and the corresponding set.
+
+        Raises:
+            None
+        """
+        if not isinstance(obj, list):
+            return False, obj
+
+        return True, data_type(obj)
@@ -1,19 +1,38 @@
-from typing import Any
+from typing import Any, Dict
 
+import numpy as np
 import vector
 
 from duit.settings.serialiser.BaseSerializer import BaseSerializer
+from duit.settings.serialiser.NumpySerializer import NumpySerializer
 from duit.utils import _vector
 
+COMPONENTS_ATTRIBUTE = "components"
+BLOCK_ATTRIBUTE = "block"
+
 
 class VectorSerializer(BaseSerializer):
     """
     A serializer for the `vector` library's Vector objects.
 
-    Args:
-        None
+    Vector objects are stored as a dictionary of their components (e.g. `{"x": 1, "y": 2}`) or, if `compact` is
+    enabled, as a list of their components (e.g. `[1, 2]`). Both representations can be deserialized.
+    Vector arrays (`vector.array()`) are stored as a single numpy block with one column per component.
     """
 
+    is_type_based = True
+
+    def __init__(self, compact: bool = False):
+        """
+        Initialize a VectorSerializer.
+
+        Args:
+            compact (bool): Store vector objects as a list of their components instead of a dictionary
+                (default is False).
+        """
+        self.compact = compact
+        self._array_serializer = NumpySerializer()
+
     def handles_type(self, obj: Any) -> bool:
         """
         Check if the serializer can handle a given object.
@@ -34,14 +53,24 @@ class VectorSerializer(BaseSerializer):
             obj (vector.Vector): The `vector.Vector` object to be serialized.
 
         Returns:
-            [bool, Any]: A tuple containing a success flag (True) and a dictionary with the components of the vector.
+            [bool, Any]: A tuple containing a success flag and the components of the vector.
 
         Raises:
             None
         """
-        components = _vector.get_vector_attributes(obj)
-        result = {c: getattr(obj, c) for c in components}
-        return True, result
+        components = _vector.get_vector_type_attributes(type(obj))
+        if components is None:
+            return False, None
+
+        if isinstance(obj, vector.VectorNumpy):
+            block = np.stack([getattr(obj, c) for c in components], axis=-1)
+            success, data = self._array_serializer.serialize(block)
+            return success, {COMPONENTS_ATTRIBUTE: list(components), BLOCK_ATTRIBUTE: data}
+
+        if self.compact:
+            return True, [getattr(obj, c) for c in components]
+
+        return True, {c: getattr(obj, c) for c in components}
 
     def deserialize(self, data_type: type, obj: Any) -> [bool, Any]:
         """
@@ -57,11 +86,25 @@ class VectorSerializer(BaseSerializer):
         Raises:
             None
         """
-        if issubclass(data_type, vector.Vector2D):
-            return True, vector.obj(x=obj["x"], y=obj["y"])
-        elif issubclass(data_type, vector.Vector3D):
-            return True, vector.obj(x=obj["x"], y=obj["y"], z=obj["z"])
-        elif issubclass(data_type, vector.Vector4D):
-            return True, vector.obj(x=obj["x"], y=obj["y"], z=obj["z"], t=obj["t"])
-        else:
+        components = _vector.get_vector_type_attributes(data_type)
+        if components is None:
             return False, None
+
+        if issubclass(data_type, vector.VectorNumpy):
+            return self._deserialize_array(obj)
+
+        if isinstance(obj, list):
+            if len(obj) != len(components):
+                return False, None
+            return True, vector.obj(**dict(zip(components, obj)))
+
+        return True, vector.obj(**{c: obj[c] for c in components})
+
+    def _deserialize_array(self, obj: Dict[str, Any]) -> [bool, Any]:
+        components = obj[COMPONENTS_ATTRIBUTE]
+
+        success, block = self._array_serializer.deserialize(np.ndarray, obj[BLOCK_ATTRIBUTE])
+        if not success or block.shape[-1] != len(components):
+            return False, None
+
+        return True, vector.array({c: block[..., i] for i, c in enumerate(components)})
@@ -0,0 +1,210 @@
+from typing import Any, Callable, List, Optional, Tuple
+
+from duit.model.DataCollection import CollectionChange, ChangeType
+from duit.model.SelectableDataList import SelectableDataList
+
+
+class VirtualListModel:
+    """
+    A backend independent view onto a SelectableDataList which only materializes the rows that are requested.
+
+    Option names are created lazily and cached. Changes of single elements only invalidate the names of the changed
+    rows, all other changes of the list invalidate all names. The rows can be filtered by a (case-insensitive)
+    prefix, in which case a row refers to the n-th matching item of the list.
+    """
+
+    def __init__(self, model: SelectableDataList, get_option_name: Callable[[Any], str], page_size: int = 100):
+        """
+        Initialize a VirtualListModel.
+
+        :param model: The list which is viewed.
+        :param get_option_name: Method to convert an item of the list into its display name.
+        :param page_size: The number of rows per page.
+        """
+        self.model = model
+        self.get_option_name = get_option_name
+        self.page_size = max(1, page_size)
+
+        self._filter_prefix: str = ""
+        self._names: List[Optional[str]] = []
+        self._filtered_indices: Optional[List[int]] = None
+        self._changes_applied = False
+
+        self.model.on_items_changed.append(self._on_items_changed)
+        self.model.on_changed.append(self._on_model_changed)
+        self.invalidate()
+
+    def _on_items_changed(self, changes: List[CollectionChange]) -> None:
+        for change in changes:
+            if change.change_type == ChangeType.ADDED:
+                self._names.insert(change.key, None)
+            elif change.change_type == ChangeType.REMOVED:
+                del self._names[change.key]
+            else:
+                self._names[change.key] = None
+
+        # the filter only has to be evaluated again, the names of the other rows are kept
+        self._filtered_indices = None
+        self._changes_applied = True
+
+    def _on_model_changed(self, *args) -> None:
+        # 'on_changed' follows 'on_items_changed' if the changes are known
+        changes_applied = self._changes_applied
+        self._changes_applied = False
+
+        if changes_applied and len(self._names) == len(self.model.value):
+            return
+
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Invalidate the cached option names and filter results (e.g. after the list has changed).
+        """
+        self._names = [None] * len(self.model.value)
+        self._filtered_indices = None
+
+    @property
+    def filter_prefix(self) -> str:
+        """
+        Get the prefix the rows are filtered by.
+
+        :return: The current filter prefix (empty if no filter is applied).
+        """
+        return self._filter_prefix
+
+    @filter_prefix.setter
+    def filter_prefix(self, value: Optional[str]):
+        """
+        Set the prefix the rows are filtered by.
+
+        :param value: The new filter prefix (empty or None to disable filtering).
+        """
+        value = "" if value is None else value
+
+        if value == self._filter_prefix:
+            return
+
+        self._filter_prefix = value
+        self._filtered_indices = None
+
+    @property
+    def row_count(self) -> int:
+        """
+        Get the number of rows that match the current filter.
+
+        :return: The number of matching rows.
+        """
+        if not self._filter_prefix:
+            return len(self._names)
+        return len(self._get_filtered_indices())
+
+    @property
+    def page_count(self) -> int:
+        """
+        Get the number of pages that are required to show all matching rows.
+
+        :return: The number of pages (at least one).
+        """
+        return max(1, -(-self.row_count // self.page_size))
+
+    def get_name(self, index: int) -> str:
+        """
+        Get the (cached) display name of the item at the specified list index.
+
+        :param index: The index of the item in the list.
+        :return: The display name of the item.
+        """
+        name = self._names[index]
+
+        if name is None:
+            name = self.get_option_name(self.model.value[index])
+            self._names[index] = name
+
+        return name
+
+    def get_index(self, row: int) -> int:
+        """
+        Get the list index of the specified row.
+
+        :param row: The row that matches the current filter.
+        :return: The index of the item in the list.
+        """
+        if not self._filter_prefix:
+            return row
+        return self._get_filtered_indices()[row]
+
+    def get_row(self, index: Optional[int]) -> Optional[int]:
+        """
+        Get the row of the specified list index.
+
+        :param index: The index of the item in the list.
+        :return: The row of the item or None if the item does not match the current filter.
+        """
+        if index is None or index < 0 or index >= len(self._names):
+            return None
+
+        if not self._filter_prefix:
+            return index
+
+        indices = self._get_filtered_indices()
+
+        # filtered indices are sorted ascending
+        low, high = 0, len(indices)
+        while low < high:
+            mid = (low + high) // 2
+            if indices[mid] < index:
+                low = mid + 1
+            else:
+                high = mid
+
+        if low < len(indices) and indices[low] == index:
+            return low
+        return None
+
+    def get_row_name(self, row: int) -> str:
+        """
+        Get the display name of the specified row.
+
+        :param row: The row that matches the current filter.
+        :return: The display name of the row.
+        """
+        return self.get_name(self.get_index(row))
+
+    def get_page(self, page: int) -> List[Tuple[int, str]]:
+        """
+        Get the list indices and display names of all rows on the specified page.
+
+        :param page: The zero-based page number.
+        :return: A list of (list index, display name) tuples.
+        """
+        start = max(0, page) * self.page_size
+        end = min(start + self.page_size, self.row_count)
+        return [(self.get_index(row), self.get_row_name(row)) for row in range(start, end)]
+
+    def get_page_of_index(self, index: Optional[int]) -> int:
+        """
+        Get the page which contains the specified list index.
+
+        :param index: The index of the item in the list.
+        :return: The zero-based page number (0 if the item does not match the current filter).
+        """
+        row = self.get_row(index)
+        return 0 if row is None else row // self.page_size
+
+    def _get_filtered_indices(self) -> List[int]:
+        if self._filtered_indices is None:
+            prefix = self._filter_prefix.casefold()
+            self._filtered_indices = [i for i in range(len(self._names))
+                                      if self.get_name(i).casefold().startswith(prefix)]
+        return self._filtered_indices
+
+    def dispose(self) -> None:
+        """
+        Detach the VirtualListModel from the underlying list.
+        """
+        if self.model.on_items_changed.contains(self._on_items_changed):
+            self.model.on_items_changed.remove(self._on_items_changed)
+
+        if self.model.on_changed.contains(self._on_model_changed):
+            self.model.on_changed.remove(self._on_model_changed)
@@ -2,12 +2,17 @@ from duit.ui.annotations import UIAnnotation
 
 
 class ListAnnotation(UIAnnotation):
-    def __init__(self, name: str, tooltip: str = "", readonly: bool = False):
+    def __init__(self, name: str, tooltip: str = "", readonly: bool = False,
+                 virtualized: bool = False, page_size: int = 100):
         """
         Initialize a ListAnnotation.
 
         :param name: The name of the list annotation.
         :param tooltip: The tooltip text for the annotation.
         :param readonly: Whether the annotation is read-only (default is False).
+        :param virtualized: Whether only the visible rows of the list should be rendered, with a prefix filter (default is False).
+        :param page_size: The maximum number of rows rendered at once in virtualized mode (default is 100).
         """
         super().__init__(name, tooltip, readonly)
+        self.virtualized = virtualized
+        self.page_size = page_size
@@ -1,5 +1,6 @@
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Mapping
 
+from duit.model.DataDict import DataDict
 from duit.model.DataField import DataField
 from duit.ui.annotations.NumberAnnotation import NumberAnnotation
 from duit.ui.annotations.UIAnnotation import UIAnnotation, UI_ANNOTATION_ATTRIBUTE_NAME
@@ -13,11 +14,19 @@ def find_all_ui_annotations(ctx) -> Dict[str, Tuple[DataField, List[UIAnnotation
     returns a dictionary with the names of the attributes containing UI annotations and the associated
     DataField objects along with the list of UI annotations applied to them.
 
+    The context can also be a mapping (or a DataDict) of names to DataField objects, in which case the keys are used
+    as attribute names.
+
     :param ctx: The context in which to search for UI annotations.
     :return: A dictionary of attribute names to (DataField, List[UIAnnotation]) pairs.
     """
+    if isinstance(ctx, DataDict):
+        ctx = ctx.value
+
+    items = ctx.items() if isinstance(ctx, Mapping) else ctx.__dict__.items()
+
     annotations = {}
-    for n, v in ctx.__dict__.items():
+    for n, v in items:
         if isinstance(v, DataField) and hasattr(v, UI_ANNOTATION_ATTRIBUTE_NAME):
-            annotations[n] = (v, v.__getattribute__(UI_ANNOTATION_ATTRIBUTE_NAME))
+            annotations[str(n)] = (v, v.__getattribute__(UI_ANNOTATION_ATTRIBUTE_NAME))
     return annotations
@@ -1,4 +1,4 @@
-from typing import Any, Sequence
+from typing import Any, Sequence, Optional
 
 from duit.collections.Stack import Stack
 from duit.ui.annotations import find_all_ui_annotations
@@ -13,47 +13,73 @@ def build_meta_tree(obj: Any) -> list[MetaNode]:
     """
     Walks obj’s UI annotations and builds a tree of MetaNode.
     Sections (StartSection/EndSection) form interior nodes;
-    SubSection recurses immediately into its value and returns.
+    SubSection expands its value into the children of its node.
+
+    Subsections are expanded with an explicit work list instead of recursion, to support deeply nested objects.
+    A subsection whose value is one of its own ancestors is not expanded again.
     """
 
     root = MetaNode(name="root", annotation=TitleAnnotation())
-    stack: Stack[MetaNode] = Stack()
-    stack.push(root)
 
-    # find_all_ui_annotations returns a dict in insertion order
-    annotations = find_all_ui_annotations(obj)
+    # each entry holds the object to expand, the node to expand it into and the linked ids of its ancestors
+    pending: list[tuple[Any, MetaNode, Optional[tuple]]] = [(obj, root, (id(obj), None))]
 
-    for var_name, (model, anns) in annotations.items():
-        # sort the per-field annotations to keep deterministic
-        sorted_anns = sorted(anns)
+    while pending:
+        current, parent, ancestors = pending.pop()
 
-        for ann in sorted_anns:
-            if isinstance(ann, StartSectionAnnotation):
-                node = MetaNode(name=ann.name, annotation=ann)
-                stack.peek().children.append(node)
+        stack: Stack[MetaNode] = Stack()
+        stack.push(parent)
 
-                if isinstance(ann, SubSectionAnnotation):
-                    sub_tree = build_meta_tree(model.value)
-                    node.children.extend(sub_tree)
-                    continue
+        # find_all_ui_annotations returns a dict in insertion order
+        annotations = find_all_ui_annotations(current)
+
+        for var_name, (model, anns) in annotations.items():
+            # sort the per-field annotations to keep deterministic
+            sorted_anns = sorted(anns)
 
-                stack.push(node)
-                continue
+            for ann in sorted_anns:
+                if isinstance(ann, StartSectionAnnotation):
+                    node = MetaNode(name=ann.name, annotation=ann)
+                    stack.peek().children.append(node)
+
+                    if isinstance(ann, SubSectionAnnotation):
+                        value = model.value
+                        if not _is_ancestor(id(value), ancestors):
+                            pending.append((value, node, (id(value), ancestors)))
+                        continue
+
+                    stack.push(node)
+                    continue
 
-            if isinstance(ann, EndSectionAnnotation):
-                if stack.is_empty:
-                    raise Exception(f"Unmatched EndSectionAnnotation on {var_name}")
+                if isinstance(ann, EndSectionAnnotation):
+                    if stack.is_empty:
+                        raise Exception(f"Unmatched EndSectionAnnotation on {var_name}")
 
-                stack.pop()
-                continue
+                    stack.pop()
+                    continue
 
-            # add regular field annotation
-            node = MetaNode(name=ann.name, annotation=ann, model=model)
-            stack.peek().children.append(node)
+                # add regular field annotation
+                node = MetaNode(name=ann.name, annotation=ann, model=model)
+                stack.peek().children.append(node)
 
     return root.children
 
 
+def _is_ancestor(object_id: int, ancestors: Optional[tuple]) -> bool:
+    """
+    Check if an object id is part of the linked ancestor ids.
+
+    :param object_id: The id of the object.
+    :param ancestors: The linked ancestor ids (id, parent ids).
+    :return: True if the object is an ancestor.
+    """
+    while ancestors is not None:
+        ancestor_id, ancestors = ancestors
+        if ancestor_id == object_id:
+            return True
+    return False
+
+
 def generate_meta_tree_str(
         node_or_nodes: MetaNode | Sequence[MetaNode],
         indent_str: str = "    ",
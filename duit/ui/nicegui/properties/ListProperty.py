@@ -5,6 +5,7 @@ from nicegui.element import Element
 
 from duit.model.SelectableDataList import SelectableDataList
 from duit.ui.BaseProperty import BaseProperty
+from duit.ui.VirtualListModel import VirtualListModel
 from duit.ui.annotations.ListAnnotation import ListAnnotation
 from duit.ui.nicegui.NiceGUIFieldProperty import NiceGUIFieldProperty
 
@@ -12,6 +13,7 @@ from duit.ui.nicegui.NiceGUIFieldProperty import NiceGUIFieldProperty
 class ListProperty(NiceGUIFieldProperty[ListAnnotation, SelectableDataList]):
     """
     A property class representing a list field with selectable options.
+    In virtualized mode, only a single page of options is sent to the client, which can be filtered by prefix.
     """
 
     def create_field(self) -> Element:
@@ -22,6 +24,9 @@ class ListProperty(NiceGUIFieldProperty[ListAnnotation, SelectableDataList]):
         """
         ann = self.annotation
 
+        if ann.virtualized:
+            return self._create_virtual_field()
+
         element = ui.select([]).props(self._default_props)
 
         if self.annotation.read_only:
@@ -53,6 +58,65 @@ class ListProperty(NiceGUIFieldProperty[ListAnnotation, SelectableDataList]):
 
         return element
 
+    def _create_virtual_field(self) -> Element:
+        """
+        Creates a filter input, a select showing a single page of options and a pagination element.
+
+        :return: An Element containing the virtualized list.
+        """
+        ann = self.annotation
+        list_model = VirtualListModel(self.model, self.get_option_name, ann.page_size)
+
+        with ui.column().classes("gap-1 w-full") as container:
+            filter_input = ui.input(placeholder="Filter").props(f"{self._default_props} clearable").classes("w-full")
+            element = ui.select({}).props(self._default_props).classes("w-full")
+            pagination = ui.pagination(1, 1, direction_links=True).props("dense")
+
+        if ann.read_only:
+            element.props("readonly")
+
+        if ann.tooltip is not None and ann.tooltip != "":
+            element.tooltip(ann.tooltip)
+
+        def update_page(page: int):
+            options = dict(list_model.get_page(page))
+
+            # the selected item always has to be part of the options
+            index = self.model.selected_index
+            if index is not None and index not in options:
+                options[index] = list_model.get_name(index)
+
+            pagination._props["max"] = list_model.page_count
+            pagination.value = page + 1
+            element.set_options(options, value=index)
+
+        @BaseProperty.suppress_updates
+        def on_ui_changed(*args, **kwargs):
+            self.model.selected_index = element.value
+
+        @BaseProperty.suppress_updates
+        def on_ui_page_changed(*args, **kwargs):
+            update_page(int(pagination.value) - 1)
+
+        @BaseProperty.suppress_updates
+        def on_ui_filter_changed(*args, **kwargs):
+            list_model.filter_prefix = filter_input.value
+            update_page(0)
+
+        @BaseProperty.suppress_updates
+        def on_model_changed(*args, **kwargs):
+            update_page(list_model.get_page_of_index(self.model.selected_index))
+
+        element.on_value_change(on_ui_changed)
+        pagination.on_value_change(on_ui_page_changed)
+        filter_input.on_value_change(on_ui_filter_changed)
+
+        self.model.on_changed += on_model_changed
+        self.model.on_index_changed += on_model_changed
+        self.model.fire_latest()
+
+        return container
+
     @property
     def options(self) -> List[Any]:
         """
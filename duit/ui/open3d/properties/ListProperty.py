@@ -4,6 +4,7 @@ from open3d.cpu.pybind.visualization.gui import Widget
 from open3d.visualization import gui
 
 from duit.model.SelectableDataList import SelectableDataList
+from duit.ui.VirtualListModel import VirtualListModel
 from duit.ui.annotations.ListAnnotation import ListAnnotation
 from duit.ui.open3d.Open3dFieldProperty import Open3dFieldProperty
 
@@ -13,7 +14,7 @@ class ListProperty(Open3dFieldProperty[ListAnnotation, SelectableDataList]):
     Property class for handling ListAnnotation.
 
     This property generates a combobox or selection box widget for selecting from a list of options.
-
+    In virtualized mode, the combobox only contains the first page of options matching a prefix filter.
     """
 
     def __init__(self, annotation: ListAnnotation, model: Optional[SelectableDataList] = None):
@@ -33,6 +34,9 @@ class ListProperty(Open3dFieldProperty[ListAnnotation, SelectableDataList]):
 
         :return: The combobox or selection box widget.
         """
+        if self.annotation.virtualized:
+            return self._create_virtual_field()
+
         field = gui.Combobox()
         field.enabled = not self.annotation.read_only
         field.tooltip = self.annotation.tooltip
@@ -58,6 +62,59 @@ class ListProperty(Open3dFieldProperty[ListAnnotation, SelectableDataList]):
         self.model.on_index_changed.invoke_latest(self.model.selected_index)
         return field
 
+    def _create_virtual_field(self) -> Widget:
+        """
+        Create a filter field and a combobox, which only contains the first page of matching options.
+
+        :return: The container widget with the filter field and the combobox.
+        """
+        list_model = VirtualListModel(self.model, self.get_option_name, self.annotation.page_size)
+        page_indices = []
+
+        search = gui.TextEdit()
+        search.placeholder_text = "Filter"
+        search.tooltip = self.annotation.tooltip
+
+        field = gui.Combobox()
+        field.enabled = not self.annotation.read_only
+        field.tooltip = self.annotation.tooltip
+
+        def update_ui():
+            field.clear_items()
+            page_indices.clear()
+
+            for index, name in list_model.get_page(list_model.get_page_of_index(self.model.selected_index)):
+                field.add_item(name)
+                page_indices.append(index)
+
+            on_dm_selection_changed(self.model.selected_index)
+
+        def on_dm_changed(value):
+            update_ui()
+
+        def on_dm_selection_changed(index):
+            if index is not None and index in page_indices:
+                field.selected_index = page_indices.index(index)
+
+        def on_ui_filter_changed(value):
+            list_model.filter_prefix = value
+            update_ui()
+
+        def on_ui_selection_changed(value, index):
+            self.model.selected_index = page_indices[index]
+
+        self.model.on_changed += on_dm_changed
+        self.model.on_index_changed += on_dm_selection_changed
+        search.set_on_value_changed(on_ui_filter_changed)
+        field.set_on_selection_changed(on_ui_selection_changed)
+
+        self.model.fire_latest()
+
+        container = gui.Vert(4)
+        container.add_child(search)
+        container.add_child(field)
+        return container
+
     @property
     def options(self) -> List[Any]:
         """
@@ -1,10 +1,12 @@
-from typing import Optional, Any, List
+from typing import Optional, Any, List, Union
 
 import wx
 
 from duit.model.SelectableDataList import SelectableDataList
+from duit.ui.VirtualListModel import VirtualListModel
 from duit.ui.annotations.ListAnnotation import ListAnnotation
 from duit.ui.wx.WxFieldProperty import WxFieldProperty
+from duit.ui.wx.widgets.WxVirtualListCtrl import WxVirtualListCtrl
 
 
 class ListProperty(WxFieldProperty[ListAnnotation, SelectableDataList]):
@@ -12,6 +14,7 @@ class ListProperty(WxFieldProperty[ListAnnotation, SelectableDataList]):
     Property class for handling ListAnnotation.
 
     This property generates a combobox or selection box widget for selecting from a list of options.
+    In virtualized mode, a filterable virtual list is used instead, which only renders the visible rows.
     """
 
     def __init__(self, annotation: ListAnnotation, model: Optional[SelectableDataList] = None):
@@ -23,7 +26,7 @@ class ListProperty(WxFieldProperty[ListAnnotation, SelectableDataList]):
         """
         super().__init__(annotation, model)
 
-    def create_field(self, parent) -> wx.ComboBox:
+    def create_field(self, parent) -> Union[wx.ComboBox, wx.BoxSizer]:
         """
         Create the field widget for the ListProperty.
 
@@ -31,6 +34,9 @@ class ListProperty(WxFieldProperty[ListAnnotation, SelectableDataList]):
 
         :return: The combobox or selection box widget.
         """
+        if self.annotation.virtualized:
+            return self._create_virtual_field(parent)
+
         field = wx.ComboBox(parent, choices=[], style=wx.CB_DROPDOWN | wx.CB_READONLY)
         field.Enable(not self.annotation.read_only)
         field.SetToolTip(self.annotation.tooltip)
@@ -58,6 +64,54 @@ class ListProperty(WxFieldProperty[ListAnnotation, SelectableDataList]):
         self.model.fire_latest()
         return field
 
+    def _create_virtual_field(self, parent) -> wx.BoxSizer:
+        """
+        Create a filter field and a virtual list, which only requests the visible rows.
+
+        :param parent: Parent window for the field widgets.
+        :return: The sizer containing the filter and the list widget.
+        """
+        list_model = VirtualListModel(self.model, self.get_option_name, self.annotation.page_size)
+
+        search = wx.SearchCtrl(parent, style=wx.TE_PROCESS_ENTER)
+        search.SetToolTip(self.annotation.tooltip)
+
+        field = WxVirtualListCtrl(parent, list_model)
+        field.Enable(not self.annotation.read_only)
+        field.SetToolTip(self.annotation.tooltip)
+
+        def update_ui():
+            field.refresh_rows()
+            field.select_row(list_model.get_row(self.model.selected_index))
+
+        def on_dm_changed(value):
+            self.silent_ui_update(update_ui)
+
+        def on_dm_selection_changed(index):
+            self.silent_ui_update(field.select_row, list_model.get_row(index))
+
+        def on_ui_filter_changed(event):
+            list_model.filter_prefix = search.GetValue()
+            update_ui()
+
+        def on_ui_selection_changed(event):
+            if self.is_ui_silent:
+                return
+
+            self.model.selected_index = list_model.get_index(event.GetIndex())
+
+        self.model.on_changed += on_dm_changed
+        self.model.on_index_changed += on_dm_selection_changed
+        search.Bind(wx.EVT_TEXT, on_ui_filter_changed)
+        field.Bind(wx.EVT_LIST_ITEM_SELECTED, on_ui_selection_changed)
+
+        self.model.fire_latest()
+
+        container = wx.BoxSizer(orient=wx.VERTICAL)
+        container.Add(search, flag=wx.EXPAND | wx.BOTTOM, border=5)
+        container.Add(field, proportion=1, flag=wx.EXPAND)
+        return container
+
     @property
     def options(self) -> List[Any]:
         """
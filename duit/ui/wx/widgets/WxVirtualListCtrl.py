@@ -0,0 +1,75 @@
+import wx
+
+from duit.ui.VirtualListModel import VirtualListModel
+
+
+class WxVirtualListCtrl(wx.ListCtrl):
+    """
+    A single column list control in virtual mode, which only requests the names of the visible rows
+    from a VirtualListModel.
+    """
+
+    def __init__(self, parent: wx.Window, list_model: VirtualListModel, visible_rows: int = 8):
+        """
+        Initializes the WxVirtualListCtrl.
+
+        Args:
+            parent (wx.Window): The parent window for this widget.
+            list_model (VirtualListModel): The model which provides the rows.
+            visible_rows (int, optional): The number of rows used to calculate the minimal height. Defaults to 8.
+        """
+        super().__init__(parent, style=wx.LC_REPORT | wx.LC_VIRTUAL | wx.LC_NO_HEADER | wx.LC_SINGLE_SEL)
+        self.list_model = list_model
+
+        self.InsertColumn(0, "")
+        self.SetMinSize(wx.Size(-1, self.GetCharHeight() * 2 * visible_rows))
+        self.Bind(wx.EVT_SIZE, self.OnResize)
+
+        self.refresh_rows()
+
+    def OnGetItemText(self, item: int, column: int) -> str:
+        """
+        Called by wx for every visible row.
+
+        Args:
+            item (int): The row which is displayed.
+            column (int): The column which is displayed.
+
+        Returns:
+            str: The display name of the row.
+        """
+        return self.list_model.get_row_name(item)
+
+    def OnResize(self, event: wx.SizeEvent):
+        """
+        Stretches the single column to the width of the control.
+
+        Args:
+            event (wx.SizeEvent): The size event.
+        """
+        self.SetColumnWidth(0, self.GetClientSize().GetWidth())
+        event.Skip()
+
+    def refresh_rows(self):
+        """
+        Updates the row count and redraws the visible rows.
+        """
+        self.SetItemCount(self.list_model.row_count)
+        self.Refresh()
+
+    def select_row(self, row):
+        """
+        Selects the specified row and scrolls it into view.
+
+        Args:
+            row (Optional[int]): The row to select or None to clear the selection.
+        """
+        selected = self.GetFirstSelected()
+        if selected != -1 and selected != row:
+            self.Select(selected, on=False)
+
+        if row is None:
+            return
+
+        self.Select(row)
+        self.EnsureVisible(row)
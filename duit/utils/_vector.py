@@ -1,4 +1,5 @@
-from typing import Sequence
+from functools import lru_cache
+from typing import Sequence, Optional
 
 import vector
 
@@ -16,9 +17,25 @@ def get_vector_attributes(value: vector.Vector) -> Sequence[str]:
     Raises:
         None
     """
-    if isinstance(value, vector.Vector2D):
+    return get_vector_type_attributes(type(value))
+
+
+@lru_cache(maxsize=None)
+def get_vector_type_attributes(vector_type: type) -> Optional[Sequence[str]]:
+    """
+    Get the attribute names (components) of a `vector.Vector` type. The result is cached per type.
+
+    Args:
+        vector_type (type): The `vector.Vector` type to retrieve the attributes from.
+
+    Returns:
+        Optional[Sequence[str]]: A sequence of attribute names (e.g., "x", "y", "z", "t") or None if the type is
+        not a 2D, 3D or 4D vector.
+    """
+    if issubclass(vector_type, vector.Vector2D):
         return "x", "y"
-    elif isinstance(value, vector.Vector3D):
+    elif issubclass(vector_type, vector.Vector3D):
         return "x", "y", "z"
-    elif isinstance(value, vector.Vector4D):
+    elif issubclass(vector_type, vector.Vector4D):
         return "x", "y", "z", "t"
+    return None
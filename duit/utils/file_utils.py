@@ -0,0 +1,71 @@
+import os
+import shutil
+import uuid
+from enum import Enum
+from pathlib import Path
+from typing import Union
+
+
+class FsyncPolicy(Enum):
+    """
+    Enum defining how written files are flushed to the storage device.
+    """
+    NONE = "none"
+    """The operating system decides when the data is written to the storage device."""
+    FILE = "file"
+    """The file content is synced before the file is moved into place."""
+    FILE_AND_DIRECTORY = "file_and_directory"
+    """The file content and the directory entry of the renamed file are synced."""
+
+
+def fsync_directory(path: Union[str, os.PathLike]) -> None:
+    """
+    Sync a directory entry to the storage device. This is a no-op on platforms which do not support it (Windows).
+
+    :param path: The path of the directory.
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_file_atomic(path: Union[str, os.PathLike], content: Union[str, bytes],
+                      fsync_policy: FsyncPolicy = FsyncPolicy.FILE) -> None:
+    """
+    Write a file atomically by writing into a temporary file in the same directory and renaming it afterward.
+
+    Readers either see the previous or the new content of the file, but never a partially written file.
+
+    :param path: The path of the file.
+    :param content: The text or binary content to write.
+    :param fsync_policy: Defines if the file and its directory are synced to the storage device.
+    """
+    target = Path(path)
+    directory = target.parent.absolute()
+
+    # the temporary file is created with open() to get the default permissions (mkstemp only allows the owner)
+    temp_path = directory / f".{target.name}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(temp_path, "xb" if isinstance(content, bytes) else "x") as file:
+            file.write(content)
+            file.flush()
+
+            if fsync_policy != FsyncPolicy.NONE:
+                os.fsync(file.fileno())
+
+        if target.exists():
+            shutil.copymode(target, temp_path)
+
+        os.replace(temp_path, target)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    if fsync_policy == FsyncPolicy.FILE_AND_DIRECTORY:
+        fsync_directory(directory)
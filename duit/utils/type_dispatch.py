@@ -0,0 +1,75 @@
+from typing import TypeVar, Generic, Dict, Sequence, Any, Optional
+
+H = TypeVar("H")
+
+
+class TypeDispatchCache(Generic[H]):
+    """
+    Caches which handler of an ordered handler list handles the values of a type.
+
+    A handler is an object with a `handles_type(obj)` method (e.g. a serializer or a type adapter). The first handler
+    which handles a value is used, otherwise the default handler. Because the handlers are still asked with the value,
+    the cached result respects the MRO of the type (e.g. `isinstance` checks on base classes).
+
+    The cache is invalidated if another handler list or default handler is passed, or if the length of the handler
+    list changes (e.g. a handler has been added). Call `clear()` after replacing a handler in place. Only handlers
+    whose `is_type_based` attribute is True are cached, all other handlers may depend on the value itself, which
+    prevents caching the types they have been asked for.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty TypeDispatchCache.
+        """
+        self._cache: Dict[type, H] = {}
+        self._handlers: Optional[Sequence[H]] = None
+        self._handler_count = 0
+        self._default: Optional[H] = None
+
+    def get(self, value: Any, handlers: Sequence[H], default: H) -> H:
+        """
+        Get the handler for a value.
+
+        Args:
+            value (Any): The value to handle.
+            handlers (Sequence[H]): The ordered handlers.
+            default (H): The handler which is used if no other handler handles the value.
+
+        Returns:
+            H: The matching handler.
+        """
+        # the handler list is referenced to keep its identity unique
+        if handlers is not self._handlers or len(handlers) != self._handler_count or default is not self._default:
+            self._cache.clear()
+            self._handlers = handlers
+            self._handler_count = len(handlers)
+            self._default = default
+
+        value_type = type(value)
+        handler = self._cache.get(value_type)
+        if handler is not None:
+            return handler
+
+        is_cacheable = True
+        handler = default
+
+        for candidate in handlers:
+            is_cacheable = is_cacheable and getattr(candidate, "is_type_based", False)
+
+            if candidate.handles_type(value):
+                handler = candidate
+                break
+
+        if is_cacheable:
+            self._cache[value_type] = handler
+
+        return handler
+
+    def clear(self) -> None:
+        """
+        Remove all cached handlers (e.g. after a handler has been replaced in place).
+        """
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
@@ -0,0 +1,51 @@
+from pathlib import Path
+from typing import Optional, List
+
+BENCHMARK_PATH = Path(__file__).parent.parent / "benchmarks"
+DEFAULT_STORAGE_PATH = BENCHMARK_PATH / ".results"
+BASELINE_NAME = "baseline"
+
+
+def run_benchmarks(save_baseline: bool = False, compare: bool = False, threshold: Optional[str] = "min:20%",
+                   storage: Path = DEFAULT_STORAGE_PATH, extra_args: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmark suite with pytest-benchmark.
+
+    :param save_baseline: Store the results as new baseline.
+    :param compare: Compare the results against the latest stored baseline.
+    :param threshold: Fail if a benchmark regressed more than this threshold (pytest-benchmark compare-fail expression).
+    :param storage: Path where the benchmark results are stored.
+    :param extra_args: Additional pytest arguments.
+    :return: The pytest exit code.
+    """
+    import pytest
+
+    args = [str(BENCHMARK_PATH), f"--benchmark-storage=file://{storage.absolute()}"]
+
+    if save_baseline:
+        args.append(f"--benchmark-save={BASELINE_NAME}")
+
+    if compare:
+        args.append(f"--benchmark-compare=*_{BASELINE_NAME}")
+
+        if threshold is not None:
+            args.append(f"--benchmark-compare-fail={threshold}")
+
+    if extra_args is not None:
+        args += extra_args
+
+    return int(pytest.main(args))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the duit benchmark suite.")
+    parser.add_argument("--save", action="store_true", help="Store the results as new baseline.")
+    parser.add_argument("--compare", action="store_true", help="Compare the results against the stored baseline.")
+    parser.add_argument("--threshold", type=str, default="min:20%",
+                        help="Regression threshold, for example 'min:20%%' or 'min:0.001'.")
+    parser.add_argument("--storage", type=Path, default=DEFAULT_STORAGE_PATH, help="Benchmark result storage path.")
+    args, pytest_args = parser.parse_known_args()
+
+    exit(run_benchmarks(args.save, args.compare, args.threshold, args.storage, pytest_args))
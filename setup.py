@@ -11,7 +11,7 @@ PACKAGE_URL = "https://github.com/cansik/duit"
 
 PACKAGE_DOC_MODULES = ["duit", "!duit.vision"]
 
-required_packages = find_packages(exclude=["tests", "examples", "scripts", "playground"])
+required_packages = find_packages(exclude=["tests", "benchmarks", "examples", "scripts", "playground"])
 
 BASE_NAME = "__required__"
 ALL_NAME = "all"
@@ -81,6 +81,31 @@ class GenerateDoc(distutils.cmd.Command):
                      Path(self.output), PACKAGE_DOC_MODULES, launch=bool(self.launch))
 
 
+class RunBenchmarks(distutils.cmd.Command):
+    description = "run the benchmark suite"
+
+    user_options = [
+        ("save", None, "Store the results as new baseline."),
+        ("compare", None, "Compare the results against the stored baseline."),
+        ("threshold=", None, "Regression threshold (e.g. min:20%)."),
+    ]
+
+    def initialize_options(self):
+        self.save: bool = False
+        self.compare: bool = False
+        self.threshold: str = "min:20%"
+
+    def finalize_options(self):
+        pass
+
+    def run(self) -> None:
+        from scripts.run_benchmarks import run_benchmarks
+        exit_code = run_benchmarks(bool(self.save), bool(self.compare), self.threshold)
+
+        if exit_code != 0:
+            raise SystemExit(exit_code)
+
+
 # read readme
 current_dir = Path(__file__).parent
 long_description = (current_dir / "README.md").read_text()
@@ -100,5 +125,6 @@ setup(
     extras_require=extras_required,
     cmdclass={
         "doc": GenerateDoc,
+        "bench": RunBenchmarks,
     },
 )
@@ -0,0 +1,114 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from duit.annotation.AnnotationFinder import AnnotationFinder
+from duit.annotation.AnnotationSchema import AnnotationSchemaCache
+from duit.arguments.Argument import Argument
+from duit.model.DataField import DataField
+from duit.settings.Settings import Settings
+
+
+class SubConfig:
+    def __init__(self):
+        self.threshold = DataField(0.5) | Argument()
+
+
+class Config:
+    def __init__(self):
+        self.name = DataField("a") | Argument()
+        self.count = 5
+        self.sub = DataField(SubConfig())
+
+
+class AnnotationFinderTest(unittest.TestCase):
+    def test_find_recursive(self):
+        finder = AnnotationFinder(Argument, recursive=True)
+        result = finder.find(Config())
+
+        self.assertEqual(["name", "sub.threshold"], list(result.keys()))
+
+    def test_schema_cache_invalidation(self):
+        cache = AnnotationSchemaCache()
+        finder = AnnotationFinder(Argument, schema_cache=cache)
+
+        config = Config()
+        self.assertEqual(["name"], list(finder.find(config).keys()))
+        self.assertEqual(["name"], list(finder.find(Config()).keys()))
+        self.assertEqual(1, len(cache))
+
+        # changing the shape of the instance dict compiles a new schema
+        config.extra = DataField(1) | Argument()
+        self.assertEqual(["name", "extra"], list(finder.find(config).keys()))
+
+        # replacing a field with a plain value invalidates the schema
+        config.name = "b"
+        self.assertEqual(["extra"], list(finder.find(config).keys()))
+
+    def test_mixed_instances(self):
+        class Model:
+            def __init__(self, has_field: bool):
+                self.a = DataField(1)
+                self.b = DataField(2) if has_field else None
+
+        cache = AnnotationSchemaCache(max_size=2)
+
+        # an attribute without a DataField on the first instance is not skipped on later instances
+        self.assertEqual(["a"], [name for name, _ in cache.get_fields(Model(False))])
+        self.assertEqual(["a", "b"], [name for name, _ in cache.get_fields(Model(True))])
+        self.assertEqual(["a"], [name for name, _ in cache.get_fields(Model(False))])
+
+        settings = Settings()
+        self.assertEqual({"a": 1}, settings.serialize(Model(False)))
+        self.assertEqual({"a": 1, "b": 2}, settings.serialize(Model(True)))
+
+        # the cache is bounded
+        cache.get_fields(Config())
+        self.assertEqual(2, len(cache))
+
+    def test_parallel_find(self):
+        finder = AnnotationFinder(Argument, recursive=True)
+        configs = [Config() for _ in range(64)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(finder.find, configs))
+
+        for config, result in zip(configs, results):
+            self.assertIs(config.sub.value.threshold, result["sub.threshold"][0])
+
+    def test_deep_nesting(self):
+        depth = 2000
+        root = SubConfig()
+        current = root
+        for _ in range(depth):
+            current.sub = DataField(SubConfig())
+            current = current.sub.value
+
+        finder = AnnotationFinder(Argument, recursive=True)
+        result = finder.find(root)
+
+        self.assertEqual(depth + 1, len(result))
+        self.assertIn(".".join(["sub"] * depth + ["threshold"]), result)
+
+    def test_deep_nesting_round_trip(self):
+        def create(depth: int):
+            root = SubConfig()
+            leaf = root
+            for _ in range(depth):
+                leaf.sub = DataField(SubConfig())
+                leaf = leaf.sub.value
+            return root, leaf
+
+        root, leaf = create(3000)
+        leaf.threshold.value = 2.0
+
+        # the json backends are recursive themselves, so the round-trip uses the data dict
+        settings = Settings()
+        data = settings.serialize(root)
+
+        loaded, loaded_leaf = create(3000)
+        self.assertIs(loaded, settings.deserialize(data, loaded))
+        self.assertEqual(2.0, loaded_leaf.threshold.value)
+
+
+if __name__ == '__main__':
+    unittest.main()
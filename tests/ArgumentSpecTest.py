@@ -0,0 +1,80 @@
+import argparse
+import tempfile
+import unittest
+from enum import Enum
+
+from duit.arguments.Argument import Argument
+from duit.arguments.ArgumentSpecCache import ArgumentSpecCache
+from duit.arguments.Arguments import Arguments
+from duit.model.DataField import DataField
+
+
+class Mode(Enum):
+    Fast = 1
+    Accurate = 2
+
+
+class Camera:
+    def __init__(self):
+        self.exposure = DataField(10.0) | Argument(group="camera", help="Exposure time.")
+        self.mode = DataField(Mode.Fast) | Argument(group="camera")
+
+
+class Config:
+    def __init__(self):
+        self.device = DataField(0) | Argument(help="Device id.")
+        self.debug = DataField(False) | Argument()
+        self.camera = DataField(Camera())
+
+
+class ArgumentSpecTest(unittest.TestCase):
+    ARGS = ["--device", "3", "--debug", "--camera.exposure", "2.5", "--camera.mode", "Accurate"]
+
+    def _parse(self, arguments: Arguments) -> Config:
+        config = Config()
+        parser = argparse.ArgumentParser()
+        arguments.add_arguments(parser, config, use_attribute_path_as_name=True)
+        arguments.configure(parser.parse_args(self.ARGS), config)
+        return config
+
+    def test_cached_spec(self):
+        expected = self._parse(Arguments())
+
+        with tempfile.TemporaryDirectory() as directory:
+            self._parse(Arguments(ArgumentSpecCache(directory)))
+
+            # a new cache instance reads the spec from disk
+            cache = ArgumentSpecCache(directory)
+            key = cache.get_key(Config, True, Arguments().type_adapters)
+            self.assertIsNotNone(cache.get(key))
+
+            config = self._parse(Arguments(cache))
+
+        for c in [expected, config]:
+            self.assertEqual(3, c.device.value)
+            self.assertTrue(c.debug.value)
+            self.assertEqual(2.5, c.camera.value.exposure.value)
+            self.assertEqual(Mode.Accurate, c.camera.value.mode.value)
+
+    def test_spec_groups(self):
+        spec = Arguments().compile_spec(Config(), use_attribute_path_as_name=True)
+
+        self.assertEqual(["device", "debug", "camera.exposure", "camera.mode"], [e.path for e in spec.entries])
+        self.assertEqual([None, None, "camera", "camera"], [e.group for e in spec.entries])
+        self.assertEqual("camera.exposure", spec.entries[2].ns_dest)
+
+    def test_different_structure(self):
+        with tempfile.TemporaryDirectory() as directory:
+            arguments = Arguments(ArgumentSpecCache(directory))
+
+            parser = argparse.ArgumentParser()
+            arguments.add_arguments(parser, Config(), use_attribute_path_as_name=True)
+            args = parser.parse_args(self.ARGS)
+
+            # the paths of the cached spec cannot be resolved, the fields are searched instead
+            config = Config()
+            config.camera.value = None
+            arguments.configure(args, config)
+
+        self.assertEqual(3, config.device.value)
+        self.assertTrue(config.debug.value)
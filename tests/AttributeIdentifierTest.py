@@ -0,0 +1,49 @@
+import pickle
+import unittest
+
+from duit.model.AttributeIdentifier import AttributeIdentifier
+from duit.model.DataField import DataField
+
+
+class Exposure:
+    def __init__(self):
+        self.value = DataField(0.5)
+
+
+class Camera:
+    def __init__(self):
+        self.exposure = DataField(Exposure())
+        self.name = "front"
+
+
+class AttributeIdentifierTest(unittest.TestCase):
+    def test_path(self):
+        identifier = AttributeIdentifier.from_path("camera.exposure.value")
+
+        self.assertEqual("value", identifier.name)
+        self.assertEqual(("camera", "exposure"), identifier.parents)
+        self.assertEqual("camera.exposure.value", identifier.path)
+        self.assertEqual(AttributeIdentifier("value", ["camera", "exposure"]), identifier)
+        self.assertEqual(hash(AttributeIdentifier("value", ["camera", "exposure"])), hash(identifier))
+
+    def test_get_set_value(self):
+        camera = Camera()
+        identifier = AttributeIdentifier.from_path("exposure.value")
+
+        self.assertIs(camera.exposure.value.value, identifier.get_field(camera))
+        self.assertEqual(0.5, identifier.get_value(camera))
+
+        identifier.set_value(camera, 0.8)
+        self.assertEqual(0.8, camera.exposure.value.value.value)
+
+        name_identifier = AttributeIdentifier("name")
+        name_identifier.set_value(camera, "back")
+        self.assertEqual("back", camera.name)
+
+    def test_pickle(self):
+        identifier = AttributeIdentifier.from_path("exposure.value")
+        self.assertEqual(identifier, pickle.loads(pickle.dumps(identifier)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from duit.model.DataField import DataField
+from duit.settings.AutoSaver import AutoSaver
+from duit.settings.Settings import Settings
+from duit.utils.file_utils import FsyncPolicy
+
+
+class Config:
+    def __init__(self):
+        self.name = DataField("a")
+        self.count = DataField(0)
+
+
+class AutoSaverTest(unittest.TestCase):
+    def test_debounced_save(self):
+        settings = Settings()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "settings.json")
+            config = Config()
+
+            saved = []
+            is_saved = threading.Event()
+
+            with AutoSaver(settings, config, path, delay=0.05, max_delay=None) as saver:
+                # the handlers are registered before the changes, so that a fast save is not missed
+                saver.on_saved += saved.append
+                saver.on_saved += lambda file_path: is_saved.set()
+
+                for i in range(10):
+                    config.count.value = i + 1
+
+                self.assertTrue(is_saved.wait(5.0))
+                self.assertEqual([path], saved)
+                self.assertEqual(10, settings.load(path, Config()).count.value)
+
+                # pending changes are saved when the saver is disposed
+                config.name.value = "b"
+
+            self.assertEqual("b", settings.load(path, Config()).name.value)
+
+            # no temporary files are left behind
+            self.assertEqual(["settings.json"], os.listdir(directory))
+
+    def test_journal(self):
+        settings = Settings()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "settings.json")
+            config = Config()
+
+            saver = AutoSaver(settings, config, path, delay=60, journal_entries=10, fsync_policy=FsyncPolicy.NONE)
+            config.count.value = 5
+            saver.flush()
+
+            self.assertFalse(saver.has_pending_changes)
+            self.assertEqual(5, settings.load(path, Config()).count.value)
+            saver.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,8 +3,11 @@ import unittest
 
 import numpy as np
 
+from duit.model.DataCollection import ChangeType
+from duit.model.DataDict import DataDict
 from duit.model.DataField import DataField
 from duit.model.DataList import DataList
+from duit.model.DataSet import DataSet
 
 
 class DataFieldTest(unittest.TestCase):
@@ -78,6 +81,117 @@ class DataListTest(unittest.TestCase):
         self.assertEqual([1, 2, 3, 5, 7], field.value)
         self.assertEqual(2, self.events_fired)
 
+    def test_snapshots(self):
+        field = DataList([1, 2], publish_snapshots=True)
+
+        received = []
+        field.on_changed += received.append
+        field.on_changed += received.append
+
+        field.append(3)
+        field.append(4)
+
+        self.assertEqual((1, 2, 3), received[0])
+        self.assertIs(received[0], received[1])
+        self.assertEqual((1, 2, 3, 4), received[2])
+        self.assertEqual([1, 2, 3, 4], field.value)
+
+    def test_snapshot_set_silent(self):
+        field = DataList([1, 2], publish_snapshots=True)
+        self.assertEqual((1, 2), field.snapshot)
+
+        field.set_silent([5, 6, 7])
+        self.assertEqual((5, 6, 7), field.snapshot)
+
+    def test_publish_disabled(self):
+        # every collection type suppresses both events while publishing is disabled
+        for field, mutate in [(DataList([1]), lambda f, v: f.append(v)),
+                              (DataDict(), lambda f, v: f.update(a=v)),
+                              (DataSet(), lambda f, v: f.add(v))]:
+            events = []
+            field.on_changed += events.append
+            field.on_items_changed += events.append
+
+            field.publish_enabled = False
+            mutate(field, 2)
+            self.assertEqual([], events)
+
+            field.publish_enabled = True
+            mutate(field, 3)
+            self.assertEqual(2, len(events))
+
+    def test_snapshot_publish_disabled(self):
+        field = DataList([1, 2], publish_snapshots=True)
+        self.assertEqual((1, 2), field.snapshot)
+
+        field.publish_enabled = False
+        field.append(3)
+        self.assertEqual((1, 2, 3), field.snapshot)
+
+
+class DataDictTest(unittest.TestCase):
+    def test_dict(self):
+        field = DataDict({"a": 1})
+
+        self.changes = []
+        self.events_fired = 0
+
+        def on_fire(value):
+            self.events_fired += 1
+
+        field.on_changed += on_fire
+        field.on_items_changed += self.changes.extend
+
+        field["b"] = 2
+        field["a"] = 3
+        field["a"] = 3
+        del field["b"]
+
+        self.assertEqual({"a": 3}, field.value)
+        self.assertEqual(3, self.events_fired)
+        self.assertEqual([ChangeType.ADDED, ChangeType.UPDATED, ChangeType.REMOVED],
+                         [c.change_type for c in self.changes])
+        self.assertEqual(1, self.changes[1].old_value)
+        self.assertEqual(3, self.changes[1].new_value)
+
+    def test_batch(self):
+        field = DataDict()
+
+        self.changes = []
+        self.events_fired = 0
+
+        def on_fire(value):
+            self.events_fired += 1
+
+        field.on_changed += on_fire
+        field.on_items_changed += self.changes.append
+
+        with field.batch():
+            field["a"] = 1
+            field["b"] = 2
+            field.update(c=3)
+
+        self.assertEqual(1, self.events_fired)
+        self.assertEqual(1, len(self.changes))
+        self.assertEqual(["a", "b", "c"], [c.key for c in self.changes[0]])
+
+
+class DataSetTest(unittest.TestCase):
+    def test_set(self):
+        field = DataSet(["a"])
+
+        self.changes = []
+        field.on_items_changed += self.changes.extend
+
+        field.add("b")
+        field.add("b")
+        field.discard("a")
+        field.discard("x")
+
+        self.assertEqual({"b"}, field.value)
+        self.assertEqual([("b", ChangeType.ADDED), ("a", ChangeType.REMOVED)],
+                         [(c.key, c.change_type) for c in self.changes])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from duit.arguments.Argument import Argument
+from duit.model.DataField import DataField
+from duit.model.FieldIndex import FieldIndex
+
+
+class Exposure:
+    def __init__(self, value: float = 0.5):
+        self.value = DataField(value) | Argument()
+        self.auto = DataField(False)
+
+
+class Camera:
+    def __init__(self):
+        self.name = DataField("front")
+        self.exposure = DataField(Exposure())
+
+
+class FieldIndexTest(unittest.TestCase):
+    def test_lookup(self):
+        camera = Camera()
+        index = FieldIndex(camera)
+
+        self.assertEqual(4, len(index))
+        self.assertIs(camera.exposure.value.value, index["exposure.value"])
+
+        index.set_value("exposure.value", 0.8)
+        self.assertEqual(0.8, camera.exposure.value.value.value)
+        self.assertEqual("front", index.get_value("name"))
+
+    def test_query(self):
+        index = FieldIndex(Camera())
+
+        self.assertEqual(["exposure", "exposure.value", "exposure.auto"], list(index.query("exposure").keys()))
+        self.assertEqual(["exposure.value"], list(index.query(annotation_type=Argument).keys()))
+
+    def test_swap_sub_object(self):
+        camera = Camera()
+        index = FieldIndex(camera)
+
+        exposure = Exposure(1.0)
+        camera.exposure.value = exposure
+
+        self.assertIs(exposure.value, index["exposure.value"])
+        self.assertEqual(4, len(index))
+
+        index.dispose()
+        camera.exposure.value = Exposure(2.0)
+        self.assertIs(exposure.value, index["exposure.value"])
+
+
+if __name__ == '__main__':
+    unittest.main()
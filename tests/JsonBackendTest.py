@@ -0,0 +1,78 @@
+import importlib.util
+import unittest
+
+import numpy as np
+
+from duit.model.DataField import DataField
+from duit.settings.Settings import Settings
+from duit.settings.backend.StdJsonBackend import StdJsonBackend
+from duit.settings.backend import create_orjson_backend
+
+HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+
+
+class Config:
+    def __init__(self):
+        self.name = DataField("a")
+        self.values = DataField([1, 2, 3])
+        self.scale = DataField(np.float32(0.5))
+
+
+class JsonBackendTest(unittest.TestCase):
+    def test_is_jsonable(self):
+        backend = StdJsonBackend()
+
+        self.assertTrue(backend.is_jsonable({"a": [1, 2.0, None, True, ("x", {1: "y"})]}))
+        self.assertFalse(backend.is_jsonable({"a": object()}))
+        self.assertFalse(backend.is_jsonable({(1, 2): "a"}))
+        self.assertFalse(backend.is_jsonable(np.float32(1)))
+
+        # shared containers are valid, circular ones are not
+        shared = [1, 2]
+        self.assertTrue(backend.is_jsonable([shared, shared]))
+
+        circular = []
+        circular.append(circular)
+        self.assertFalse(backend.is_jsonable(circular))
+
+    def test_compact(self):
+        backend = StdJsonBackend()
+        self.assertEqual('{"a":1,"b":[1,2]}', backend.dumps({"b": [1, 2], "a": 1}, compact=True))
+
+    @unittest.skipUnless(HAS_ORJSON, "orjson is not installed")
+    def test_orjson(self):
+        backend = create_orjson_backend()
+        self.assertTrue(backend.is_jsonable(np.float32(1)))
+        self.assertFalse(backend.is_jsonable(1 << 70))
+
+        config = Config()
+        config.values.value = [4, 5]
+
+        settings = Settings(json_backend=backend, compact_json=True)
+        content = settings.save_json(config)
+        self.assertEqual('{"name":"a","scale":0.5,"values":[4,5]}', content)
+
+        new_config = settings.load_json(content, Config())
+        self.assertEqual([4, 5], new_config.values.value)
+
+    @unittest.skipUnless(HAS_ORJSON, "orjson is not installed")
+    def test_unsupported_numpy_values(self):
+        for backend in [StdJsonBackend(), create_orjson_backend()]:
+            config = Config()
+            config.scale.value = np.complex64(1 + 2j)
+
+            # values the backend cannot encode are dropped with a warning
+            settings = Settings(json_backend=backend, compact_json=True)
+            with self.assertLogs(level="WARNING"):
+                content = settings.save_json(config)
+            self.assertEqual('{"name":"a","values":[1,2,3]}', content)
+
+        backend = create_orjson_backend()
+        self.assertTrue(backend.is_jsonable(np.zeros((2, 2), dtype=np.float32)))
+        self.assertFalse(backend.is_jsonable(np.float16(1)))
+        self.assertFalse(backend.is_jsonable(np.zeros((4, 4))[:, ::2]))
+        self.assertFalse(backend.is_jsonable(np.array([object()])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from duit.iterator.DataFieldIterator import DataFieldIterator
+from duit.model.DataField import DataField
+
+
+class Leaf:
+    def __init__(self):
+        self.value = DataField("leaf")
+
+
+class Node:
+    def __init__(self):
+        self.a = DataField("a")
+        self.child = Leaf()
+        self.ignored = Leaf()
+
+
+class ObjectIteratorTest(unittest.TestCase):
+    def test_iterate(self):
+        names = [r.field_name for r in DataFieldIterator(Node())]
+        self.assertEqual(["a", "value", "value"], names)
+
+    def test_max_depth(self):
+        names = [r.field_name for r in DataFieldIterator(Node(), max_depth=0)]
+        self.assertEqual(["a"], names)
+
+    def test_pruning(self):
+        iterator = DataFieldIterator(Node(), should_recurse=lambda path, value: path != "ignored")
+        self.assertEqual(["child"], [r.parent_field_name for r in iterator if r.field_name == "value"])
+
+        iterator = DataFieldIterator(Node(), excluded_types=[Leaf])
+        self.assertEqual(["a"], [r.field_name for r in iterator])
+
+    def test_lazy(self):
+        iterator = iter(DataFieldIterator(Node()))
+        self.assertEqual("a", next(iterator).field_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
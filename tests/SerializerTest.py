@@ -1,9 +1,17 @@
+import json
+import os
+import tempfile
 import unittest
 
 import numpy as np
+import vector
 
+from duit.model.DataDict import DataDict
 from duit.model.DataField import DataField
+from duit.model.DataSet import DataSet
+from duit.settings.ArraySidecar import ArraySidecarWriter, ArraySidecarReader, FILE_ATTRIBUTE
 from duit.settings.Settings import Settings
+from duit.settings.serialiser.NumpySerializer import NumpySerializer
 
 
 class DemoConfig:
@@ -13,6 +21,24 @@ class DemoConfig:
         self.data = DataField(data)
 
 
+class LargeArrayConfig:
+    def __init__(self):
+        self.lut = DataField(np.zeros(shape=(64, 64, 3), dtype=np.float32))
+        self.mask = DataField(np.zeros(shape=(2, 2), dtype=np.uint8))
+
+
+class CollectionConfig:
+    def __init__(self):
+        self.cameras = DataDict({"front": 1.0})
+        self.tags = DataSet({"a"})
+
+
+class VectorConfig:
+    def __init__(self):
+        self.position = DataField(vector.obj(x=0.0, y=0.0, z=0.0))
+        self.markers = DataField(vector.array({"x": np.zeros(3), "y": np.zeros(3), "z": np.zeros(3)}))
+
+
 class SerializerTest(unittest.TestCase):
     def test_default(self):
         config = DemoConfig()
@@ -28,6 +54,176 @@ class SerializerTest(unittest.TestCase):
         settings.deserialize(data, new_config)
         self.assertTrue(np.array_equal(config.data.value, new_config.data.value))
 
+    def test_collections(self):
+        config = CollectionConfig()
+        config.cameras["back"] = 2.0
+        config.tags.add("b")
+
+        settings = Settings()
+        data = settings.serialize(config)
+
+        new_config = CollectionConfig()
+        settings.deserialize(data, new_config)
+
+        self.assertEqual({"front": 1.0, "back": 2.0}, new_config.cameras.value)
+        self.assertEqual({"a", "b"}, new_config.tags.value)
+
+    def test_array_sidecar(self):
+        config = LargeArrayConfig()
+        config.lut.value[:] = np.arange(64 * 64 * 3, dtype=np.float32).reshape(64, 64, 3)
+        config.mask.value[:] = 1
+
+        settings = Settings(array_sidecar=True)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "settings.json")
+            settings.save(path, config)
+
+            with open(path, "r") as file:
+                data = json.load(file)
+
+            # only the large array is moved into the sidecar file
+            self.assertIn("sidecar", data["lut"])
+            self.assertIn("data", data["mask"])
+            self.assertTrue(os.path.exists(os.path.join(directory, data["lut"]["sidecar"]["file"])))
+
+            new_config = Settings().load(path, LargeArrayConfig())
+            self.assertIsInstance(new_config.lut.value, np.memmap)
+            self.assertTrue(np.array_equal(config.lut.value, new_config.lut.value))
+            self.assertTrue(np.array_equal(config.mask.value, new_config.mask.value))
+
+            # saving again replaces the sidecar file without invalidating the mapped arrays
+            config.lut.value[:] = 1
+            settings.save(path, config)
+            self.assertEqual(0, new_config.lut.value[0, 0, 0])
+
+            # the previous version is removed once it is not mapped anymore
+            del new_config
+            settings.save(path, config)
+            self.assertEqual(2, len(os.listdir(directory)))
+
+            # unchanged arrays reference the same version
+            with open(path, "r") as file:
+                reference = json.load(file)["lut"]["sidecar"]
+            settings.save(path, config)
+            with open(path, "r") as file:
+                self.assertEqual(reference, json.load(file)["lut"]["sidecar"])
+
+            # a missing sidecar file is reported like other deserialization failures
+            for name in os.listdir(directory):
+                if name != "settings.json":
+                    os.remove(os.path.join(directory, name))
+
+            with self.assertLogs(level="WARNING"):
+                new_config = Settings().load(path, LargeArrayConfig())
+            self.assertEqual(0, new_config.lut.value[0, 0, 0])
+            self.assertEqual(1, new_config.mask.value[0, 0])
+
+    def test_array_sidecar_writers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "settings.json.sidecar")
+
+            # concurrent writers of the same path use their own temporary files
+            first, second = ArraySidecarWriter(path, min_size=0), ArraySidecarWriter(path, min_size=0)
+            first_reference = first.write(np.full(16, 1, dtype=np.uint8))
+            second.write(np.full(16, 2, dtype=np.uint8))
+            self.assertEqual(2, len(os.listdir(directory)))
+
+            second.abort()
+            first.commit()
+            self.assertEqual([first_reference[FILE_ATTRIBUTE]], os.listdir(directory))
+
+            array = ArraySidecarReader(path, mmap_mode=None).read(first_reference, (16,), np.dtype(np.uint8))
+            self.assertTrue(np.array_equal(np.full(16, 1, dtype=np.uint8), array))
+
+    def test_lazy_loading(self):
+        config = LargeArrayConfig()
+        config.lut.value[:] = 2
+
+        settings = Settings(array_sidecar=True, lazy_loading=True)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "settings.json")
+            settings.save(path, config)
+
+            new_config = settings.load(path, LargeArrayConfig())
+            changes = []
+            new_config.lut.on_changed += changes.append
+
+            # the array is only loaded on first access
+            self.assertEqual(1, len(new_config.lut.plugins))
+            self.assertTrue(np.array_equal(config.lut.value, new_config.lut.value))
+            self.assertEqual(0, len(new_config.lut.plugins))
+            self.assertEqual(1, len(changes))
+
+            # setting a value before it has been loaded discards the loader
+            new_config = settings.load(path, LargeArrayConfig())
+            new_config.mask.value = np.ones(shape=(2, 2), dtype=np.uint8)
+            self.assertEqual(1, new_config.mask.value[0, 0])
+
+            # reloading replaces values which have not been read without loading them
+            decoded = []
+            serializer = NumpySerializer()
+            deserialize = serializer.deserialize
+            serializer.deserialize = lambda *args: decoded.append(args) or deserialize(*args)
+            settings.serializers.insert(0, serializer)
+
+            new_config = settings.load(path, LargeArrayConfig())
+            settings.load(path, new_config)
+            settings.load(path, new_config)
+            self.assertEqual(0, len(decoded))
+            self.assertEqual(1, len(new_config.lut.plugins))
+
+            self.assertTrue(np.array_equal(config.lut.value, new_config.lut.value))
+            self.assertEqual(1, len([args for args in decoded if args[1]["shape"] == list(config.lut.value.shape)]))
+
+            del new_config
+
+    def test_parallel(self):
+        config = LargeArrayConfig()
+        config.lut.value[:] = 3
+        config.mask.value[:] = 1
+
+        sequential = Settings().serialize(config)
+        parallel = Settings(parallel_workers=4).serialize(config)
+
+        # the result is identical to a sequential serialization, including the key order
+        self.assertEqual(list(sequential.keys()), list(parallel.keys()))
+        self.assertEqual(json.dumps(sequential), json.dumps(parallel))
+
+        new_config = LargeArrayConfig()
+        changes = []
+        new_config.lut.on_changed += lambda value: changes.append("lut")
+        new_config.mask.on_changed += lambda value: changes.append("mask")
+
+        Settings(parallel_workers=4).deserialize(parallel, new_config)
+
+        # the values are assigned in load order on the calling thread
+        self.assertEqual(["lut", "mask"], changes)
+        self.assertTrue(np.array_equal(config.lut.value, new_config.lut.value))
+        self.assertTrue(np.array_equal(config.mask.value, new_config.mask.value))
+
+    def test_vectors(self):
+        config = VectorConfig()
+        config.position.value = vector.obj(x=1.0, y=2.0, z=3.0)
+        config.markers.value = vector.array({"x": np.arange(100.0), "y": np.ones(100), "z": np.zeros(100)})
+
+        data = Settings(compact_vectors=True).serialize(config)
+        self.assertEqual([1.0, 2.0, 3.0], data["position"])
+        self.assertEqual(["x", "y", "z"], data["markers"]["components"])
+
+        new_config = VectorConfig()
+        Settings().deserialize(json.loads(json.dumps(data)), new_config)
+        self.assertEqual(vector.obj(x=1.0, y=2.0, z=3.0), new_config.position.value)
+        self.assertIsInstance(new_config.markers.value, vector.VectorNumpy3D)
+        self.assertTrue(np.array_equal(config.markers.value.x, new_config.markers.value.x))
+        self.assertTrue(np.array_equal(config.markers.value.y, new_config.markers.value.y))
+
+        # the dictionary representation can still be loaded
+        new_config = VectorConfig()
+        Settings(compact_vectors=True).deserialize({"position": {"x": 4, "y": 5, "z": 6}}, new_config)
+        self.assertEqual(vector.obj(x=4, y=5, z=6), new_config.position.value)
+
 
 if __name__ == '__main__':
     unittest.main()
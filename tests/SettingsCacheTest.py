@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from duit.model.DataField import DataField
+from duit.settings.Settings import Settings
+from duit.settings.SettingsCache import SettingsCache
+
+
+class Preset:
+    def __init__(self):
+        self.name = DataField("preset")
+        self.labels = DataField(["a"])
+        self.lut = DataField(np.zeros(shape=(16, 16), dtype=np.float32))
+
+
+class SettingsCacheTest(unittest.TestCase):
+    def test_cached_load(self):
+        cache = SettingsCache()
+        settings = Settings(cache=cache)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "preset.json")
+
+            preset = Preset()
+            preset.lut.value[:] = 2
+            settings.save(path, preset)
+
+            first = settings.load(path, Preset())
+            second = settings.load(path, Preset())
+
+            self.assertEqual(1, len(cache))
+
+            # decoded arrays are shared and read-only
+            self.assertIs(first.lut.value, second.lut.value)
+            self.assertFalse(second.lut.value.flags.writeable)
+            self.assertTrue(np.array_equal(preset.lut.value, second.lut.value))
+
+            # other values do not share the cached data
+            first.labels.value.append("b")
+            self.assertEqual(["a"], settings.load(path, Preset()).labels.value)
+
+            # a changed file is parsed again
+            preset.name.value = "changed"
+            settings.save(path, preset)
+            os.utime(path, ns=(10 ** 9, 10 ** 9))
+
+            self.assertEqual("changed", settings.load(path, Preset()).name.value)
+            self.assertEqual(1, len(cache))
+
+    def test_eviction(self):
+        cache = SettingsCache()
+        settings = Settings(cache=cache)
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, f"preset-{i}.json") for i in range(3)]
+
+            for path in paths:
+                settings.save(path, Preset())
+
+            # the entries have the same size (file and decoded array), the budget allows two of them
+            settings.load(paths[0], Preset())
+            cache.max_bytes = int(cache.size * 2.5)
+
+            settings.load(paths[1], Preset())
+            settings.load(paths[2], Preset())
+
+            self.assertEqual(2, len(cache))
+            self.assertLessEqual(cache.size, cache.max_bytes)
+
+            settings.load(paths[1], Preset())
+            settings.load(paths[0], Preset())
+            self.assertEqual(2, len(cache))
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+import zipfile
+
+from duit.model.DataField import DataField
+from duit.settings.Settings import Settings
+from duit.settings.SettingsContainer import ContainerCompression
+
+
+class ContainerProfile:
+    def __init__(self):
+        self.exposure = DataField(10)
+        self.gain = DataField(1.0)
+
+
+class ContainerConfig:
+    def __init__(self):
+        self.name = DataField("presets")
+        self.profile = DataField(ContainerProfile())
+        self.curve = DataField([0.0] * 500)
+
+
+class SettingsContainerTest(unittest.TestCase):
+    def test_round_trip(self):
+        config = ContainerConfig()
+        config.name.value = "studio"
+        config.profile.value.exposure.value = 42
+        config.curve.value = [i / 10 for i in range(500)]
+
+        settings = Settings(container_compression=ContainerCompression.DEFLATED, container_min_compress_bytes=256)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "settings.duit")
+            settings.save(path, config)
+
+            # only entries above the threshold are compressed
+            with zipfile.ZipFile(path) as container:
+                methods = {info.filename: info.compress_type for info in container.infolist()}
+
+            self.assertEqual(zipfile.ZIP_STORED, methods["name.json"])
+            self.assertEqual(zipfile.ZIP_DEFLATED, methods["curve.json"])
+
+            new_config = Settings().load(path, ContainerConfig())
+
+        self.assertEqual("studio", new_config.name.value)
+        self.assertEqual(42, new_config.profile.value.exposure.value)
+        self.assertEqual(config.curve.value, new_config.curve.value)
+
+    def test_partial(self):
+        config = ContainerConfig()
+        config.name.value = "studio"
+        config.profile.value.exposure.value = 42
+        config.profile.value.gain.value = 2.0
+
+        for compression in [None, ContainerCompression.LZMA]:
+            settings = Settings(container_compression=compression)
+
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "settings.duit")
+                settings.save(path, config)
+
+                new_config = settings.load(path, ContainerConfig(), partial=[("profile", "exposure"), "unknown"])
+
+            self.assertEqual("presets", new_config.name.value)
+            self.assertEqual(42, new_config.profile.value.exposure.value)
+            self.assertEqual(1.0, new_config.profile.value.gain.value)
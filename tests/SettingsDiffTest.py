@@ -0,0 +1,58 @@
+import json
+import unittest
+
+import numpy as np
+
+from duit.model.DataField import DataField
+from duit.settings.Settings import Settings
+
+
+class DiffCamera:
+    def __init__(self):
+        self.exposure = DataField(10)
+        self.gain = DataField(1.0)
+
+
+class DiffConfig:
+    def __init__(self):
+        self.name = DataField("config")
+        self.mask = DataField(np.zeros(shape=(2, 2), dtype=np.uint8))
+        self.camera = DataField(DiffCamera())
+
+
+class SettingsDiffTest(unittest.TestCase):
+    def test_diff(self):
+        settings = Settings()
+
+        config = DiffConfig()
+        baseline = settings.serialize(config)
+
+        self.assertEqual([], settings.diff(config, baseline))
+
+        config.camera.value.exposure.value = 20
+        config.mask.value = np.ones(shape=(2, 2), dtype=np.uint8)
+
+        patch = settings.diff(config, DiffConfig())
+        self.assertEqual([["mask"], ["camera", "exposure"]], [entry["path"] for entry in patch])
+        self.assertEqual(20, patch[1]["value"])
+
+        # the patch survives a json round trip
+        patch = json.loads(json.dumps(patch))
+
+        remote = settings.apply_patch(DiffConfig(), patch)
+        self.assertEqual(20, remote.camera.value.exposure.value)
+        self.assertEqual(1.0, remote.camera.value.gain.value)
+        self.assertTrue(np.array_equal(config.mask.value, remote.mask.value))
+        self.assertEqual([], settings.diff(remote, config))
+
+    def test_apply_patch_changes_only_affected_fields(self):
+        config = DiffConfig()
+
+        changed = []
+        config.name.on_changed += lambda value: changed.append("name")
+        config.camera.value.gain.on_changed += lambda value: changed.append("gain")
+
+        Settings().apply_patch(config, [{"path": ["camera", "gain"], "value": 2.0}])
+
+        self.assertEqual(["gain"], changed)
+        self.assertEqual(2.0, config.camera.value.gain.value)
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+
+from duit.model.DataField import DataField
+from duit.settings.Setting import Setting
+from duit.settings.Settings import Settings
+from duit.settings.SettingsJournal import SettingsJournal
+
+
+class Camera:
+    def __init__(self, exposure: int = 10):
+        self.exposure = DataField(exposure)
+        self.gain = DataField(1.0) | Setting(name="camera-gain")
+
+
+class Config:
+    def __init__(self):
+        self.name = DataField("a")
+        self.camera = DataField(Camera())
+
+
+class SettingsJournalTest(unittest.TestCase):
+    def test_incremental_save(self):
+        settings = Settings()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "settings.json")
+
+            config = Config()
+            journal = SettingsJournal(settings, config, path, max_entries=4)
+            journal.save()
+            self.assertFalse(journal.is_dirty)
+            self.assertFalse(os.path.exists(journal.journal_path))
+
+            config.name.value = "b"
+            config.camera.value.gain.value = 2.0
+            self.assertTrue(journal.is_dirty)
+            journal.save()
+
+            with open(journal.journal_path, "r") as file:
+                self.assertEqual(2, len(file.readlines()))
+
+            # the settings file is not rewritten, the journal is applied on load
+            self.assertEqual("a", settings.load(path, Config()).name.value)
+
+            loaded = SettingsJournal(settings, Config(), path).load()
+            self.assertEqual("b", loaded.name.value)
+            self.assertEqual(2.0, loaded.camera.value.gain.value)
+
+            # replacing a sub-object tracks its new fields
+            config.camera.value = Camera(20)
+            journal.save()
+            config.camera.value.exposure.value = 30
+            journal.save()
+
+            # the journal has been compacted into the settings file
+            self.assertFalse(os.path.exists(journal.journal_path))
+
+            loaded = settings.load(path, Config())
+            self.assertEqual("b", loaded.name.value)
+            self.assertEqual(30, loaded.camera.value.exposure.value)
+            self.assertEqual(1.0, loaded.camera.value.gain.value)
+
+            journal.dispose()
+
+    def test_truncated_entry(self):
+        settings = Settings()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "settings.json")
+
+            config = Config()
+            journal = SettingsJournal(settings, config, path, max_entries=10)
+            journal.save()
+
+            config.name.value = "b"
+            journal.save()
+            journal.dispose()
+
+            # an interrupted save leaves an incomplete last entry
+            with open(journal.journal_path, "a") as file:
+                file.write('{"path": ["name"], "val')
+
+            loaded = Config()
+            with self.assertLogs(level="WARNING"):
+                SettingsJournal(settings, loaded, path).load()
+            self.assertEqual("b", loaded.name.value)
+
+            with open(journal.journal_path, "r") as file:
+                self.assertEqual(1, len(file.readlines()))
+
+            # corrupted entries before the last one are still reported
+            with open(journal.journal_path, "a") as file:
+                file.write('{"path": \n{"path": ["name"], "value": "c"}\n')
+
+            with self.assertRaises(ValueError):
+                SettingsJournal(settings, Config(), path).load()
+
+
+if __name__ == '__main__':
+    unittest.main()
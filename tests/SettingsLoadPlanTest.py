@@ -0,0 +1,56 @@
+import unittest
+from unittest import mock
+
+from duit.model.DataField import DataField
+from duit.settings.Setting import Setting
+from duit.settings.Settings import Settings
+from duit.settings.SettingsLoadPlan import SettingsLoadPlan
+
+
+class PlanConfig:
+    def __init__(self, renamed: bool = False):
+        self.order = []
+
+        self.second = DataField(0) | Setting(load_order=2)
+        self.first = DataField(0) | Setting(name="one" if renamed else None, load_order=1)
+        self.callback = DataField(lambda: None)
+
+        self.first.on_changed += lambda value: self.order.append("first")
+        self.second.on_changed += lambda value: self.order.append("second")
+
+
+class SettingsLoadPlanTest(unittest.TestCase):
+    def test_plan_is_reused(self):
+        settings = Settings()
+        data = {"first": 1, "second": 2, "callback": 3}
+
+        with mock.patch.object(SettingsLoadPlan, "compile", wraps=SettingsLoadPlan.compile) as compile_plan:
+            configs = [settings.deserialize(data, PlanConfig()) for _ in range(3)]
+
+        self.assertEqual(1, compile_plan.call_count)
+        for config in configs:
+            self.assertEqual(["first", "second"], config.order)
+            self.assertEqual(1, config.first.value)
+            self.assertTrue(callable(config.callback.value))
+
+    def test_changed_annotations(self):
+        settings = Settings()
+
+        with mock.patch.object(SettingsLoadPlan, "compile", wraps=SettingsLoadPlan.compile) as compile_plan:
+            config = settings.deserialize({"first": 1, "one": 5}, PlanConfig())
+            renamed = settings.deserialize({"first": 1, "one": 5}, PlanConfig(renamed=True))
+
+        self.assertEqual(2, compile_plan.call_count)
+        self.assertEqual(1, config.first.value)
+        self.assertEqual(5, renamed.first.value)
+
+    def test_changed_value_type(self):
+        settings = Settings()
+
+        config = PlanConfig()
+        settings.deserialize({"first": 1}, config)
+
+        config.first.value = "text"
+        settings.deserialize({"first": "other"}, config)
+
+        self.assertEqual("other", config.first.value)
@@ -0,0 +1,100 @@
+import io
+import json
+import unittest
+
+import numpy as np
+
+from duit.model.DataField import DataField
+from duit.settings.Settings import Settings
+from duit.settings.backend.JsonStreamReader import JsonStreamReader
+
+
+class StreamCameraConfig:
+    def __init__(self):
+        self.exposure = DataField(10)
+        self.name = DataField("front camera")
+
+
+class StreamConfig:
+    def __init__(self):
+        self.threshold = DataField(0.5)
+        self.labels = DataField(["a", "b"])
+        self.mask = DataField(np.zeros(shape=(4, 4), dtype=np.uint8))
+        self.camera = StreamCameraConfig()
+        self.camera_field = DataField(StreamCameraConfig())
+
+
+class SettingsStreamTest(unittest.TestCase):
+    @staticmethod
+    def _create_config() -> StreamConfig:
+        config = StreamConfig()
+        config.threshold.value = 0.75
+        config.labels.value = ["x", "y", "z"]
+        config.mask.value[1:3, 1:3] = 255
+        config.camera_field.value.exposure.value = 200
+        config.camera_field.value.name.value = "back \"camera\"\n"
+        return config
+
+    def test_round_trip(self):
+        config = self._create_config()
+
+        for compact in [False, True]:
+            settings = Settings(compact_json=compact)
+
+            stream = io.StringIO()
+            settings.save_stream(stream, config)
+
+            # the stream contains the same settings as save_json()
+            self.assertEqual(json.loads(settings.save_json(config)), json.loads(stream.getvalue()))
+
+            stream.seek(0)
+            new_config = settings.load_stream(stream, StreamConfig(), chunk_size=7)
+
+            self.assertEqual(0.75, new_config.threshold.value)
+            self.assertEqual(["x", "y", "z"], new_config.labels.value)
+            self.assertTrue(np.array_equal(config.mask.value, new_config.mask.value))
+            self.assertEqual(200, new_config.camera_field.value.exposure.value)
+            self.assertEqual("back \"camera\"\n", new_config.camera_field.value.name.value)
+
+    def test_unknown_keys(self):
+        content = '{"unknown": {"nested": [1, 2, {"a": 3}]}, "threshold": 1.5, "camera_field": {"exposure": 5}}'
+
+        config = Settings().load_stream(io.StringIO(content), StreamConfig(), chunk_size=3)
+
+        self.assertEqual(1.5, config.threshold.value)
+        self.assertEqual(5, config.camera_field.value.exposure.value)
+        self.assertEqual("front camera", config.camera_field.value.name.value)
+
+    def test_reader(self):
+        reader = JsonStreamReader(io.StringIO(' { "a" : 12345678, "b": {}, "c": [1, "}"] } '), chunk_size=2)
+
+        values = {}
+        for key in reader.iter_object():
+            if key == "b":
+                self.assertEqual([], list(reader.iter_object()))
+                continue
+            values[key] = reader.read_value()
+
+        self.assertEqual({"a": 12345678, "c": [1, "}"]}, values)
+        self.assertEqual("", reader.peek())
+
+    def test_invalid_stream(self):
+        with self.assertRaises(json.JSONDecodeError):
+            Settings().load_stream(io.StringIO('{"threshold": 1.5'), StreamConfig())
+
+    def test_chunk_boundaries(self):
+        config = StreamConfig()
+        config.threshold.value = -1.25e-7
+        config.labels.value = [0.5, 12.75, 3e10, -0.001]
+        config.camera_field.value.exposure.value = 123456
+
+        settings = Settings()
+        content = settings.save_json(config)
+
+        # numbers are split at every possible position
+        for chunk_size in range(1, len(content) + 1):
+            new_config = settings.load_stream(io.StringIO(content), StreamConfig(), chunk_size=chunk_size)
+
+            self.assertEqual(-1.25e-7, new_config.threshold.value)
+            self.assertEqual([0.5, 12.75, 3e10, -0.001], new_config.labels.value)
+            self.assertEqual(123456, new_config.camera_field.value.exposure.value)
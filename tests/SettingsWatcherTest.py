@@ -0,0 +1,120 @@
+import os
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+from duit.model.DataField import DataField
+from duit.settings.Settings import Settings
+from duit.settings.SettingsWatcher import SettingsWatcher
+
+
+class WatchedConfig:
+    def __init__(self):
+        self.name = DataField("a")
+        self.count = DataField(0)
+        self.lut = DataField(np.zeros(shape=(32, 32), dtype=np.float32))
+
+
+class SettingsWatcherTest(unittest.TestCase):
+    @staticmethod
+    def _write(settings: Settings, path: str, config: WatchedConfig, version: int) -> None:
+        settings.save(path, config)
+
+        # the modification time is set explicitly to not depend on the timestamp resolution of the file system
+        os.utime(path, ns=(version * 10 ** 9, version * 10 ** 9))
+
+    def test_reload_changed_fields(self):
+        settings = Settings()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "settings.json")
+
+            external = WatchedConfig()
+            self._write(settings, path, external, 1)
+
+            config = WatchedConfig()
+            watcher = SettingsWatcher(settings, config, path)
+            watcher.load()
+
+            changes = []
+            config.name.on_changed += lambda value: changes.append("name")
+            config.count.on_changed += lambda value: changes.append("count")
+
+            self.assertFalse(watcher.check())
+
+            external.count.value = 5
+            self._write(settings, path, external, 2)
+
+            self.assertTrue(watcher.check())
+            self.assertEqual(5, config.count.value)
+            self.assertEqual(["count"], changes)
+
+            # an invalid file is reported and the object keeps its state
+            errors = []
+            watcher.on_error += errors.append
+
+            with open(path, "w") as file:
+                file.write("{\"count\": ")
+            os.utime(path, ns=(3 * 10 ** 9, 3 * 10 ** 9))
+
+            self.assertFalse(watcher.check())
+            self.assertEqual(1, len(errors))
+            self.assertEqual(5, config.count.value)
+
+    def test_background_thread(self):
+        settings = Settings()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "settings.json")
+
+            external = WatchedConfig()
+            self._write(settings, path, external, 1)
+
+            config = WatchedConfig()
+            patches = []
+            reloaded = threading.Event()
+
+            with SettingsWatcher(settings, config, path, interval=0.01) as watcher:
+                watcher.on_reloaded += patches.append
+                watcher.on_reloaded += lambda patch: reloaded.set()
+
+                external.name.value = "b"
+                self._write(settings, path, external, 2)
+
+                self.assertTrue(reloaded.wait(5.0))
+
+            self.assertEqual([[{"path": ["name"], "value": "b"}]], patches)
+            self.assertEqual("b", config.name.value)
+
+    def test_atomic_reload(self):
+        settings = Settings(array_sidecar=True)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "settings.json")
+
+            external = WatchedConfig()
+            self._write(settings, path, external, 1)
+
+            config = WatchedConfig()
+            watcher = SettingsWatcher(settings, config, path)
+            watcher.load()
+
+            # listeners see the completely applied file
+            states = []
+            config.name.on_changed += lambda value: states.append((config.name.value, config.count.value))
+
+            patches = []
+            watcher.on_reloaded += patches.append
+
+            external.name.value = "b"
+            external.count.value = 7
+            self._write(settings, path, external, 2)
+
+            self.assertTrue(watcher.check())
+            self.assertEqual([("b", 7)], states)
+
+            # unchanged arrays of the sidecar file are not reloaded
+            self.assertEqual([["name"], ["count"]], [entry["path"] for entry in patches[0]])
+            del config
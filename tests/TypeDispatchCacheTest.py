@@ -0,0 +1,67 @@
+import unittest
+from enum import IntEnum
+from typing import Any
+
+from duit.settings.serialiser.BaseSerializer import BaseSerializer
+from duit.settings.serialiser.DefaultSerializer import DefaultSerializer
+from duit.settings.serialiser.EnumSerializer import EnumSerializer
+from duit.utils.type_dispatch import TypeDispatchCache
+
+
+class Level(IntEnum):
+    Low = 1
+
+
+class PositiveSerializer(DefaultSerializer):
+    is_type_based = False
+
+    def handles_type(self, obj: Any) -> bool:
+        return isinstance(obj, int) and obj > 0
+
+
+class ShortTextSerializer(BaseSerializer):
+    def handles_type(self, obj: Any) -> bool:
+        return isinstance(obj, str) and len(obj) < 4
+
+    def serialize(self, obj: Any) -> [bool, Any]:
+        return True, obj
+
+    def deserialize(self, data_type: Any, obj: Any) -> [bool, Any]:
+        return True, obj
+
+
+class TypeDispatchCacheTest(unittest.TestCase):
+    def test_dispatch(self):
+        cache = TypeDispatchCache()
+        enum_serializer = EnumSerializer()
+        default = DefaultSerializer()
+        handlers = [enum_serializer]
+
+        # sub-classes are dispatched by the MRO aware handles_type check
+        self.assertIs(enum_serializer, cache.get(Level.Low, handlers, default))
+        self.assertIs(default, cache.get(1, handlers, default))
+        self.assertEqual(2, len(cache))
+
+        # changing the handlers invalidates the cache
+        positive = PositiveSerializer()
+        handlers.insert(0, positive)
+        self.assertIs(positive, cache.get(1, handlers, default))
+        self.assertIs(default, cache.get(-1, handlers, default))
+
+        # value based handlers are not cached
+        self.assertEqual(0, len(cache))
+
+    def test_opt_in(self):
+        cache = TypeDispatchCache()
+        short = ShortTextSerializer()
+        default = DefaultSerializer()
+        handlers = [short]
+
+        # handlers have to declare that they are type based to be cached
+        self.assertIs(short, cache.get("abc", handlers, default))
+        self.assertIs(default, cache.get("abcdef", handlers, default))
+        self.assertEqual(0, len(cache))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from duit.model.SelectableDataList import SelectableDataList
+from duit.ui.VirtualListModel import VirtualListModel
+
+
+class VirtualListModelTest(unittest.TestCase):
+    def test_paging(self):
+        model = SelectableDataList([f"device-{i}" for i in range(25)])
+        list_model = VirtualListModel(model, str, page_size=10)
+
+        self.assertEqual(25, list_model.row_count)
+        self.assertEqual(3, list_model.page_count)
+        self.assertEqual((20, "device-20"), list_model.get_page(2)[0])
+        self.assertEqual(5, len(list_model.get_page(2)))
+
+    def test_prefix_filter(self):
+        model = SelectableDataList(["Camera-A", "Light", "camera-b", "Mic"])
+        list_model = VirtualListModel(model, str)
+
+        list_model.filter_prefix = "cam"
+        self.assertEqual(2, list_model.row_count)
+        self.assertEqual([(0, "Camera-A"), (2, "camera-b")], list_model.get_page(0))
+        self.assertEqual(1, list_model.get_row(2))
+        self.assertIsNone(list_model.get_row(1))
+
+        model.append("cam-c")
+        self.assertEqual(3, list_model.row_count)
+
+    def test_incremental_update(self):
+        model = SelectableDataList(["a", "b", "c"])
+
+        rendered = []
+        list_model = VirtualListModel(model, lambda item: rendered.append(item) or item.upper())
+        list_model.get_page(0)
+
+        model.append("d")
+        model.insert(0, "x")
+        model[2] = "y"
+        del model[1]
+
+        # only the new and updated rows are rendered again
+        self.assertEqual([(0, "X"), (1, "Y"), (2, "C"), (3, "D")], list_model.get_page(0))
+        self.assertEqual(["a", "b", "c", "x", "y", "d"], rendered)
+
+        model.sort()
+        self.assertEqual(["C", "D", "X", "Y"], [name for _, name in list_model.get_page(0)])
+        self.assertEqual(10, len(rendered))
+
+
+if __name__ == '__main__':
+    unittest.main()